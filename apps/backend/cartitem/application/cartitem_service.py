@@ -3,9 +3,11 @@ from dependency_injector.wiring import inject
 from fastapi import HTTPException
 from ulid import ULID
 
-from cartitem.domain.cartitem import CartItem
+from cartitem.domain.cartitem import CartItem, CartItemLine
 from cartitem.domain.repository.cartitem_repo import ICartItemRepository
 
+MAX_CART_BATCH_SIZE = 100
+
 class CartItemService:
     @inject
     def __init__(
@@ -56,6 +58,9 @@ class CartItemService:
         cartitems = self.cartitem_repo.get_cartitems(user_id)
         return cartitems
 
+    def get_cart_lines(self, user_id: str) -> tuple[int, list[CartItemLine]]:
+        return self.cartitem_repo.get_cart_lines(user_id)
+
     def update_cartitem(
         self,
         cartitem_id: str,
@@ -103,42 +108,82 @@ class CartItemService:
 
         return cartitem
 
+    def apply_cart_batch(
+        self,
+        user_id: str,
+        upserts: list[dict],
+        delete_ids: list[str],
+    ) -> tuple[int, list[CartItemLine]]:
+        """
+        upserts의 각 항목은 create_cartitem 인자와 같은 키를 가지며,
+        cartitem_id가 있으면 수정, 없으면 추가로 처리.
+        """
+        if len(upserts) + len(delete_ids) > MAX_CART_BATCH_SIZE:
+            raise HTTPException(status_code=400, detail=f"Too many cart operations. (max {MAX_CART_BATCH_SIZE})")
+
+        update_ids = [item["cartitem_id"] for item in upserts if item.get("cartitem_id")]
+        if len(set(update_ids)) != len(update_ids) or set(update_ids) & set(delete_ids):
+            raise HTTPException(status_code=400, detail="Duplicated cartitem id in batch.")
+
+        now = datetime.now(timezone.utc)
+        inserts = []
+        updates = []
+        for item in upserts:
+            options = {key: value for key, value in item.items() if key.startswith(("option_", "is_option_"))}
+            cartitem = CartItem(
+                id=item.get("cartitem_id") or self.ulid.generate(),
+                user_id=user_id,
+                product_id=item["product_id"],
+                is_active=True,
+                quantity=item["quantity"],
+                created_at=now,
+                updated_at=now,
+                **options,
+            )
+            (updates if item.get("cartitem_id") else inserts).append(cartitem)
+
+        return self.cartitem_repo.apply_batch(user_id, inserts, updates, list(set(delete_ids)))
+
     def delete_cartitem(self, cartitem_id: str):
         self.cartitem_repo.delete(cartitem_id)
 
     def get_cartitem_values_by_id(self, cartitem: CartItem):
-        option_1_type, option_1_value, is_option_1_active = (None, None, True)
-        option_2_type, option_2_value, is_option_2_active = (None, None, True)
-        option_3_type, option_3_value, is_option_3_active = (None, None, True)
+        return self.get_cartitems_values([cartitem])[0]
 
-        if cartitem.option_type_1_id and cartitem.option_1_id:
-            option_1_type, option_1_value, is_option_1_active = self.cartitem_repo.fetch_option(
-                cartitem.option_type_1_id, cartitem.option_1_id
-            )
-        if cartitem.option_type_2_id and cartitem.option_2_id:
-            option_2_type, option_2_value, is_option_2_active = self.cartitem_repo.fetch_option(
-                cartitem.option_type_2_id, cartitem.option_2_id
-            )
-        if cartitem.option_type_3_id and cartitem.option_3_id:
-            option_3_type, option_3_value, is_option_3_active = self.cartitem_repo.fetch_option(
-                cartitem.option_type_3_id, cartitem.option_3_id
-            )
+    def get_cartitems_values(self, cartitems: list[CartItem]) -> list[dict]:
+        """
+        장바구니 항목들의 옵션 이름/값을 한 번에 조회해 응답 형태로 변환.
+        """
+        pairs = []
+        for cartitem in cartitems:
+            for option_type_id, option_id in self._option_pairs(cartitem):
+                if option_type_id and option_id:
+                    pairs.append((option_type_id, option_id))
+        options = self.cartitem_repo.fetch_options(pairs)
+
+        return [self._to_values(cartitem, options) for cartitem in cartitems]
 
-        return {
+    def _option_pairs(self, cartitem: CartItem) -> list[tuple[str | None, str | None]]:
+        return [
+            (cartitem.option_type_1_id, cartitem.option_1_id),
+            (cartitem.option_type_2_id, cartitem.option_2_id),
+            (cartitem.option_type_3_id, cartitem.option_3_id),
+        ]
+
+    def _to_values(self, cartitem: CartItem, options: dict) -> dict:
+        values = {
             "id": cartitem.id,
             "user_id": cartitem.user_id,
             "product_id": cartitem.product_id,
             "is_active": cartitem.is_active,
-            "option_type_1": option_1_type,
-            "option_1": option_1_value,
-            "is_option_1_active": is_option_1_active,
-            "option_type_2": option_2_type,
-            "option_2": option_2_value,
-            "is_option_2_active": is_option_2_active,
-            "option_type_3": option_3_type,
-            "option_3": option_3_value,
-            "is_option_3_active": is_option_3_active,
-            "quantity": cartitem.quantity,
-            "created_at": cartitem.created_at,
-            "updated_at": cartitem.updated_at,
-        }
\ No newline at end of file
+        }
+        for i, (option_type_id, option_id) in enumerate(self._option_pairs(cartitem), start=1):
+            option_type, option, is_active = options.get((option_type_id, option_id), (None, None, True))
+            values[f"option_type_{i}"] = option_type
+            values[f"option_{i}"] = option
+            values[f"is_option_{i}_active"] = is_active
+        values["quantity"] = cartitem.quantity
+        values["created_at"] = cartitem.created_at
+        values["updated_at"] = cartitem.updated_at
+
+        return values
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+MAX_CARTITEM_QUANTITY = 99  # 장바구니 한 줄의 최대 수량
+
 
 @dataclass
 class CartItem:
@@ -19,4 +21,37 @@ class CartItem:
     is_option_3_active: bool | None
     quantity: int
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+
+@dataclass
+class CartItemLine:
+    """
+    장바구니 한 줄의 조회 모델. 상품 정보와 옵션 값을 함께 담음.
+    """
+    id: str
+    user_id: str
+    product_id: str
+    is_active: bool
+    option_type_1_id: str | None
+    option_1_id: str | None
+    option_type_1: str | None
+    option_1: str | None
+    is_option_1_active: bool | None
+    option_type_2_id: str | None
+    option_2_id: str | None
+    option_type_2: str | None
+    option_2: str | None
+    is_option_2_active: bool | None
+    option_type_3_id: str | None
+    option_3_id: str | None
+    option_type_3: str | None
+    option_3: str | None
+    is_option_3_active: bool | None
+    quantity: int
+    created_at: datetime
+    updated_at: datetime
+    product_name: str | None
+    price_sell: int | None
+    discount_rate: int | None
+    is_product_active: bool
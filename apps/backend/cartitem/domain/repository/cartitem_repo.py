@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
 
-from cartitem.domain.cartitem import CartItem
+from cartitem.domain.cartitem import CartItem, CartItemLine
 
 
 class ICartItemRepository(metaclass=ABCMeta):
@@ -16,6 +16,27 @@ class ICartItemRepository(metaclass=ABCMeta):
     def get_cartitems(self, user_id: str) -> tuple[int, list[CartItem]]:
         raise NotImplementedError
     
+    @abstractmethod
+    def get_cart_lines(self, user_id: str) -> tuple[int, list[CartItemLine]]:
+        """
+        상품 정보와 옵션 값이 포함된 장바구니 목록을 한 번의 쿼리로 조회.
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def apply_batch(
+        self,
+        user_id: str,
+        inserts: list[CartItem],
+        updates: list[CartItem],
+        delete_ids: list[str],
+    ) -> tuple[int, list[CartItemLine]]:
+        """
+        추가/수정/삭제를 한 트랜잭션에서 multi-row 문으로 반영하고 갱신된 장바구니를 반환.
+        추가할 항목과 상품/옵션이 같은 줄이 이미 있으면 수량을 더함.
+        """
+        raise NotImplementedError
+    
     @abstractmethod
     def update(self, cartitem: CartItem):
         raise NotImplementedError
@@ -25,5 +46,9 @@ class ICartItemRepository(metaclass=ABCMeta):
         raise NotImplementedError
     
     @abstractmethod
-    def fetch_option(self, option_id: str) -> tuple[str, str, bool]:
+    def fetch_options(self, pairs: list[tuple[str, str]]) -> dict[tuple[str, str], tuple[str, str, bool]]:
+        """
+        (option_type_id, option_id) 쌍들을 한 번의 쿼리로 조회.
+        {(option_type_id, option_id): (옵션 타입명, 옵션값, 활성 여부)} 반환. 없는 쌍은 제외.
+        """
         raise NotImplementedError
\ No newline at end of file
@@ -1,10 +1,13 @@
-from sqlalchemy import String, Integer, DateTime
+from sqlalchemy import String, Integer, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from database import Base
 
 
 class CartItem(Base):
     __tablename__ = "CartItem"
+    __table_args__ = (
+        Index("ix_cartitem_user_id_created_at", "user_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)  # UUID
     user_id: Mapped[str] = mapped_column(String(36), nullable=False)
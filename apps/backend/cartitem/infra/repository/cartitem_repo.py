@@ -1,11 +1,83 @@
+from dataclasses import asdict
 from fastapi import HTTPException
-import requests
+from sqlalchemy import and_, delete, insert, update
+from sqlalchemy.orm import Session, Query, aliased
 
 from database import SessionLocal
 from utils.db_utils import row_to_dict
 from cartitem.domain.repository.cartitem_repo import ICartItemRepository
 from cartitem.domain.cartitem import CartItem as CartItemVO
+from cartitem.domain.cartitem import CartItemLine, MAX_CARTITEM_QUANTITY
 from cartitem.infra.db_models.cartitem import CartItem
+from product.infra.db_models.product import Product, ProductOptionType, ProductOption
+
+
+def line_key(cartitem: CartItem | CartItemVO) -> tuple:
+    """
+    같은 장바구니 줄인지 판단하는 키. (상품 + 옵션 3쌍)
+    """
+    return (
+        cartitem.product_id,
+        cartitem.option_type_1_id, cartitem.option_1_id,
+        cartitem.option_type_2_id, cartitem.option_2_id,
+        cartitem.option_type_3_id, cartitem.option_3_id,
+    )
+
+
+def cart_lines_query(db: Session, user_id: str) -> Query:
+    """
+    장바구니 항목, 상품, 옵션 타입/옵션 3쌍을 한 번에 조인하는 쿼리.
+    결과 행은 to_cart_line으로 변환. (주문 생성 등에서도 재사용)
+    """
+    columns = [
+        CartItem,
+        Product.name,
+        Product.price_sell,
+        Product.discount_rate,
+        Product.is_active,
+    ]
+    joins = []
+    for i in (1, 2, 3):
+        option_type = aliased(ProductOptionType, name=f"option_type_{i}")
+        option = aliased(ProductOption, name=f"option_{i}")
+        columns += [option_type.option_type, option.option, option.is_active]
+        joins.append((option_type, option_type.id == getattr(CartItem, f"option_type_{i}_id")))
+        joins.append((
+            option,
+            and_(
+                option.id == getattr(CartItem, f"option_{i}_id"),
+                option.product_option_type_id == option_type.id,
+            ),
+        ))
+
+    query = db.query(*columns).outerjoin(Product, Product.id == CartItem.product_id)
+    for target, on_clause in joins:
+        query = query.outerjoin(target, on_clause)
+
+    return query.filter(CartItem.user_id == user_id).order_by(CartItem.created_at.asc(), CartItem.id.asc())
+
+
+def to_cart_line(row) -> CartItemLine:
+    cartitem, product_name, price_sell, discount_rate, is_product_active, *options = row
+    values = row_to_dict(cartitem)
+    for i in (1, 2, 3):
+        option_type, option, is_active = options[(i - 1) * 3:i * 3]
+        # 옵션이 해당 옵션 타입에 속한 경우에만 값을 채움.
+        # 옵션 ID가 있는데 찾지 못했으면(삭제됐거나 다른 옵션 타입) 판매 불가로 표시해 주문을 막음
+        if option is None:
+            option_type = None
+            is_active = values[f"option_{i}_id"] is None
+        values[f"option_type_{i}"] = option_type
+        values[f"option_{i}"] = option
+        values[f"is_option_{i}_active"] = is_active
+
+    return CartItemLine(
+        **values,
+        product_name=product_name,
+        price_sell=price_sell,
+        discount_rate=discount_rate,
+        is_product_active=bool(is_product_active),
+    )
 
 
 class CartItemRepository(ICartItemRepository):
@@ -55,6 +127,99 @@ class CartItemRepository(ICartItemRepository):
 
         return total_count, [CartItemVO(**row_to_dict(cartitem)) for cartitem in cartitems]
 
+    def get_cart_lines(self, user_id: str) -> tuple[int, list[CartItemLine]]:
+        with SessionLocal() as db:
+            rows = cart_lines_query(db, user_id).all()
+
+        return len(rows), [to_cart_line(row) for row in rows]
+
+    def apply_batch(
+        self,
+        user_id: str,
+        inserts: list[CartItemVO],
+        updates: list[CartItemVO],
+        delete_ids: list[str],
+    ) -> tuple[int, list[CartItemLine]]:
+        with SessionLocal() as db:
+            try:
+                target_ids = {cartitem.id for cartitem in updates} | set(delete_ids)
+                if target_ids:
+                    owned_ids = {
+                        cartitem_id for cartitem_id, in db.query(CartItem.id).filter(
+                            CartItem.id.in_(target_ids),
+                            CartItem.user_id == user_id,
+                        )
+                    }
+                    if owned_ids != target_ids:
+                        raise HTTPException(status_code=422, detail="CartItem Does Not Exist.")
+
+                if delete_ids:
+                    db.execute(delete(CartItem).where(CartItem.id.in_(delete_ids)))
+                if updates:
+                    db.execute(
+                        update(CartItem),
+                        [
+                            {
+                                key: value
+                                for key, value in asdict(cartitem).items()
+                                if key not in ("user_id", "created_at")
+                            }
+                            for cartitem in updates
+                        ],
+                    )
+                if inserts:
+                    self._merge_inserts(db, user_id, inserts)
+                db.commit()
+            except HTTPException:
+                db.rollback()
+                raise
+            except Exception:
+                db.rollback()
+                raise HTTPException(status_code=500, detail="Failed to apply cart changes.")
+
+            rows = cart_lines_query(db, user_id).all()
+
+        return len(rows), [to_cart_line(row) for row in rows]
+
+    def _merge_inserts(self, db: Session, user_id: str, inserts: list[CartItemVO]):
+        """
+        같은 상품/옵션 줄이 이미 있으면(배치 안에서 앞서 추가된 줄 포함) 새 줄을 만들지 않고 수량을 더함.
+        유저의 기존 줄은 잠가서 동시에 들어온 배치가 같은 줄을 중복 생성하지 않도록 함.
+        합친 수량이 MAX_CARTITEM_QUANTITY를 넘으면 400 에러 발생.
+        """
+        existing = {
+            line_key(cartitem): cartitem
+            for cartitem in db.query(CartItem).filter(
+                CartItem.user_id == user_id,
+                CartItem.product_id.in_({cartitem.product_id for cartitem in inserts}),
+            ).with_for_update()
+        }
+
+        new_rows: dict[tuple, dict] = {}
+        merged: dict[str, dict] = {}
+        for cartitem in inserts:
+            key = line_key(cartitem)
+            if key in new_rows:
+                new_rows[key]["quantity"] += cartitem.quantity
+            elif key in existing:
+                line = existing[key]
+                row = merged.setdefault(line.id, {"id": line.id, "quantity": line.quantity, "updated_at": cartitem.updated_at})
+                row["quantity"] += cartitem.quantity
+            else:
+                new_rows[key] = asdict(cartitem)
+
+        for row in [*merged.values(), *new_rows.values()]:
+            if row["quantity"] > MAX_CARTITEM_QUANTITY:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cart item quantity cannot exceed {MAX_CARTITEM_QUANTITY}.",
+                )
+
+        if merged:
+            db.execute(update(CartItem), list(merged.values()))
+        if new_rows:
+            db.execute(insert(CartItem), list(new_rows.values()))
+
     def update(self, cartitem_vo: CartItemVO):
         with SessionLocal() as db:
             cartitem = db.query(CartItem).filter(CartItem.id == cartitem_vo.id).first()
@@ -90,14 +255,26 @@ class CartItemRepository(ICartItemRepository):
             db.delete(cartitem)
             db.commit()
 
-    def fetch_option(self, option_type_id: str, option_id: str) -> tuple[str, str, bool]:
-        if not option_type_id or not option_id:
-            raise HTTPException(status_code=422, detail="Option Type ID or Option ID is missing.")
-
-        try:
-            response = requests.get(f"http://127.0.0.1:8080/api/products/option_info?option_type_id={option_type_id}&option_id={option_id}")
-            response.raise_for_status()
-            option_data = response.json()
-            return option_data["option_type_value"], option_data["option_value"], option_data["is_active"]
-        except requests.RequestException:
-            return None, None, True
\ No newline at end of file
+    def fetch_options(self, pairs: list[tuple[str, str]]) -> dict[tuple[str, str], tuple[str, str, bool]]:
+        option_ids = {option_id for option_type_id, option_id in pairs if option_type_id and option_id}
+        if not option_ids:
+            return {}
+
+        with SessionLocal() as db:
+            rows = (
+                db.query(
+                    ProductOptionType.id,
+                    ProductOption.id,
+                    ProductOptionType.option_type,
+                    ProductOption.option,
+                    ProductOption.is_active,
+                )
+                .join(ProductOptionType, ProductOptionType.id == ProductOption.product_option_type_id)
+                .filter(ProductOption.id.in_(option_ids))
+                .all()
+            )
+
+        return {
+            (option_type_id, option_id): (option_type, option, is_active)
+            for option_type_id, option_id, option_type, option, is_active in rows
+        }
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from containers import Container
 from common.auth import CurrentUser, get_current_user, get_admin_user
 from cartitem.application.cartitem_service import CartItemService
+from cartitem.domain.cartitem import MAX_CARTITEM_QUANTITY
 
 router = APIRouter(prefix="/cartitems")
 
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/cartitems")
 class CreateCartItemBody(BaseModel):
     user_id: str = Field(min_length=1, max_length=32)
     product_id: str = Field(min_length=1, max_length=32)
-    quantity: int = Field(ge=1, le=99)
+    quantity: int = Field(ge=1, le=MAX_CARTITEM_QUANTITY)
     option_type_1_id: str | None = None
     option_1_id: str | None = None
     is_option_1_active: bool | None = None
@@ -43,6 +44,10 @@ class CartItemResponse(BaseModel):
     quantity: int
     created_at: datetime
     updated_at: datetime
+    product_name: str | None = None
+    price_sell: int | None = None
+    discount_rate: int | None = None
+    is_product_active: bool | None = None
 
 
 @router.post("", status_code=201, response_model=CartItemResponse)
@@ -80,13 +85,10 @@ def get_cartitems(
     user_id: str,
     cartitem_service: CartItemService = Depends(Provide[Container.cartitem_service]),
 ):
-    total_count, cartitems = cartitem_service.get_cartitems(user_id)
-    cartitems_with_values = [
-        cartitem_service.get_cartitem_values_by_id(cartitem) for cartitem in cartitems
-    ]
+    total_count, cart_lines = cartitem_service.get_cart_lines(user_id)
     return {
         "total_count": total_count,
-        "cartitems": cartitems_with_values,
+        "cartitems": cart_lines,
     }
 
 
@@ -94,7 +96,7 @@ class UpdateCartItemBody(BaseModel):
     cartitem_id: str = Field(min_length=1, max_length=32)
     user_id: str = Field(min_length=1, max_length=32)
     product_id: str = Field(min_length=1, max_length=32)
-    quantity: int = Field(ge=1, le=99)
+    quantity: int = Field(ge=1, le=MAX_CARTITEM_QUANTITY)
     option_type_1_id: str | None = None
     option_1_id: str | None = None
     is_option_1_active: bool | None = None
@@ -132,6 +134,44 @@ def update_cartitem(
     return cartitem_with_values
 
 
+class CartItemUpsertBody(BaseModel):
+    cartitem_id: str | None = Field(default=None, min_length=1, max_length=32)
+    product_id: str = Field(min_length=1, max_length=32)
+    quantity: int = Field(ge=1, le=MAX_CARTITEM_QUANTITY)
+    option_type_1_id: str | None = None
+    option_1_id: str | None = None
+    is_option_1_active: bool | None = None
+    option_type_2_id: str | None = None
+    option_2_id: str | None = None
+    is_option_2_active: bool | None = None
+    option_type_3_id: str | None = None
+    option_3_id: str | None = None
+    is_option_3_active: bool | None = None
+
+
+class CartItemBatchBody(BaseModel):
+    user_id: str = Field(min_length=1, max_length=32)
+    upserts: list[CartItemUpsertBody] = []
+    delete_ids: list[str] = []
+
+
+@router.post("/batch", response_model=GetCartItemsResponse)
+@inject
+def apply_cartitem_batch(
+    body: CartItemBatchBody,
+    cartitem_service: CartItemService = Depends(Provide[Container.cartitem_service]),
+):
+    total_count, cart_lines = cartitem_service.apply_cart_batch(
+        user_id=body.user_id,
+        upserts=[item.model_dump() for item in body.upserts],
+        delete_ids=body.delete_ids,
+    )
+    return {
+        "total_count": total_count,
+        "cartitems": cart_lines,
+    }
+
+
 @router.delete("", status_code=204)
 @inject
 def delete_cartitem(
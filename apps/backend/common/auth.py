@@ -44,6 +44,7 @@ def decode_access_token(token: str):
     
 oauth2_admin_scheme = OAuth2PasswordBearer(tokenUrl="/users/login", scheme_name="admin_auth")
 oauth2_social_scheme = OAuth2PasswordBearer(tokenUrl="/users/social-login", scheme_name="social_auth")
+oauth2_optional_scheme = OAuth2PasswordBearer(tokenUrl="/users/social-login", scheme_name="social_auth", auto_error=False)
 
 
 @dataclass
@@ -73,6 +74,16 @@ def get_current_user(token: Annotated[str, Depends(oauth2_social_scheme)]):
     return CurrentUser(user_id, Role(role))
 
 
+def get_optional_user(token: Annotated[str | None, Depends(oauth2_optional_scheme)]) -> CurrentUser | None:
+    """
+    토큰이 없으면 None. 토큰이 있으면 get_current_user와 같이 검증함.
+    """
+    if token is None:
+        return None
+
+    return get_current_user(token)
+
+
 def get_admin_user(token: Annotated[str, Depends(oauth2_admin_scheme)]):
     user_id, role = _extract_user_from_token(token)
 
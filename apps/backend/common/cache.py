@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class TTLCache:
+    """
+    프로세스(gunicorn 워커) 단위 TTL + LRU 캐시.
+    max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거.
+    항목에 태그를 달면 invalidate_tag()로 해당 태그가 달린 항목만 무효화할 수 있음.
+    """
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.tag_clock = 0
+        self._tag_versions: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=MISSING):
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[1] <= now or self._is_stale(item[2], item[3]):
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(
+        self,
+        key,
+        value,
+        generation: int | None = None,
+        ttl_seconds: float | None = None,
+        tags: tuple = (),
+        tag_clock: int | None = None,
+    ):
+        """
+        generation이 주어졌는데 그 사이 clear()가 호출됐다면 저장하지 않음.
+        (무효화 이전에 읽은 값이 다시 캐시되는 것을 방지)
+        tag_clock은 값을 읽기 전의 self.tag_clock. 그 이후 tags 중 하나라도 무효화됐다면 저장하지 않음.
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if tag_clock is None:
+                tag_clock = self.tag_clock
+            if self._is_stale(tags, tag_clock):
+                return
+            self._items[key] = (value, expires_at, tags, tag_clock)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._tag_versions.clear()
+            self.generation += 1
+
+    def invalidate_tag(self, tag):
+        """
+        tag가 달린 항목을 무효화. 항목은 다음 조회 시 제거됨.
+        """
+        with self._lock:
+            self.tag_clock += 1
+            self._tag_versions[tag] = self.tag_clock
+
+    def _is_stale(self, tags: tuple, tag_clock: int) -> bool:
+        return any(self._tag_versions.get(tag, 0) > tag_clock for tag in tags)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            item = self._items.get(key)
+            return item is not None and item[1] > time.monotonic() and not self._is_stale(item[2], item[3])
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
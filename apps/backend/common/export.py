@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, Iterator, Literal
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# 서버 사이드 커서에서 한 번에 가져오는 행 수이자 응답 청크 하나에 담는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def stream_rows(db: Session, statement: Select):
+    """
+    서버 사이드 커서(stream_results)로 EXPORT_BATCH_SIZE 행씩 읽어오는 결과를 반환.
+    ORM 엔티티가 아닌 Row를 돌려주므로 세션 identity map에 객체가 쌓이지 않음.
+    """
+    return db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+
+def _to_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+def _to_dict(row) -> dict:
+    return asdict(row) if is_dataclass(row) else dict(row)
+
+
+def iter_ndjson(rows: Iterable) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(_to_dict(row), ensure_ascii=False, default=_to_value))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(rows: Iterable, columns: list[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+
+    count = 0
+    for row in rows:
+        values = _to_dict(row)
+        writer.writerow(["" if values.get(c) is None else _to_value(values.get(c)) for c in columns])
+        count += 1
+        if count >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    yield buffer.getvalue()
+
+
+def export_response(rows: Iterable, columns: list[str], format: ExportFormat, filename: str) -> StreamingResponse:
+    """
+    행 iterator를 NDJSON 또는 CSV로 스트리밍하는 응답 생성.
+    columns에 없는 필드는 내보내지 않음.
+    """
+    selected = ({c: _to_dict(row).get(c) for c in columns} for row in rows)
+    body = iter_ndjson(selected) if format == "ndjson" else iter_csv(selected, columns)
+
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
@@ -19,6 +19,30 @@ class Settings(BaseSettings):
     iamport_webhook_secret: str
     iamport_webhook_secret_test: str
     iamport_payment_secret: str
+    product_cache_enabled: bool = True
+    product_cache_max_size: int = 2048
+    product_cache_ttl_seconds: int = 60
+    recommendation_refresh_seconds: int = 1800
+    search_index_refresh_seconds: int = 600
+    coupon_cache_enabled: bool = True
+    coupon_cache_max_size: int = 1024
+    coupon_cache_ttl_seconds: int = 300
+    coupon_claim_cache_max_size: int = 100000
+    coupon_claim_cache_ttl_seconds: int = 3600
+    coupon_campaign_runner_enabled: bool = True
+    coupon_campaign_chunk_size: int = 1000
+    coupon_campaign_poll_seconds: float = 5.0
+    payment_gateway: str = "portone"  # portone | fake
+    payment_gateway_timeout_seconds: float = 10.0
+    payment_gateway_max_connections: int = 20
+    payment_webhook_worker_enabled: bool = True
+    payment_webhook_concurrency: int = 4
+    payment_webhook_poll_seconds: float = 1.0
+    idempotency_key_ttl_hours: int = 24
+    idempotency_cache_max_size: int = 4096
+    idempotency_cache_ttl_seconds: int = 600
+    idempotency_purge_seconds: int = 300
+    idempotency_lease_seconds: int = 60  # 처리중 키를 다른 요청이 이어받을 수 있기까지의 시간
 
 
 @lru_cache
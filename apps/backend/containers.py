@@ -1,14 +1,35 @@
 from dependency_injector import containers, providers
 
+from config import get_settings
+from common.cache import TTLCache
 from user.application.user_service import UserService
 from user.infra.repository.user_repo import UserRepository
 from product.application.product_service import ProductService
+from product.application.recommendation_engine import RecommendationEngine
+from product.application.search_index import ProductSearchIndex
 from product.infra.repository.product_repo import ProductRepository
+from product.infra.repository.cached_product_repo import CachedProductRepository
 from order.application.order_service import OrderService
+from order.application.payment_webhook_worker import PaymentWebhookWorker
+from order.application.analytics_service import AnalyticsService
+from order.application.idempotency_service import IdempotencyService
+from order.application.point_service import PointService
+from order.application.coupon_campaign_service import CouponCampaignService
+from order.application.coupon_campaign_runner import CouponCampaignRunner
 from order.infra.repository.order_repo import OrderRepository
+from order.infra.repository.cached_order_repo import CachedOrderRepository
+from order.infra.repository.analytics_repo import AnalyticsRepository
+from order.infra.repository.idempotency_repo import IdempotencyRepository
+from order.infra.repository.point_repo import PointRepository
+from order.infra.repository.coupon_campaign_repo import CouponCampaignRepository
+from order.infra.payment.portone_gateway import PortOnePaymentGateway
+from order.infra.payment.fake_gateway import FakePaymentGateway
 from cartitem.application.cartitem_service import CartItemService
 from cartitem.infra.repository.cartitem_repo import CartItemRepository
 
+settings = get_settings()
+
+
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         packages=["user", "product", "order", "cartitem"],
@@ -16,9 +37,92 @@ class Container(containers.DeclarativeContainer):
 
     user_repo = providers.Factory(UserRepository)
     user_service = providers.Factory(UserService, user_repo=user_repo)
-    product_repo = providers.Factory(ProductRepository)
-    product_service = providers.Factory(ProductService, product_repo=product_repo)
-    order_repo = providers.Factory(OrderRepository)
-    order_service = providers.Factory(OrderService, order_repo=order_repo)
+    product_cache = providers.Singleton(
+        TTLCache,
+        max_size=settings.product_cache_max_size,
+        ttl_seconds=settings.product_cache_ttl_seconds,
+    )
+    product_repo = (
+        providers.Factory(CachedProductRepository, cache=product_cache)
+        if settings.product_cache_enabled
+        else providers.Factory(ProductRepository)
+    )
+    coupon_cache = providers.Singleton(
+        TTLCache,
+        max_size=settings.coupon_cache_max_size,
+        ttl_seconds=settings.coupon_cache_ttl_seconds,
+    )
+    coupon_claim_cache = providers.Singleton(
+        TTLCache,
+        max_size=settings.coupon_claim_cache_max_size,
+        ttl_seconds=settings.coupon_claim_cache_ttl_seconds,
+    )
+    order_repo = (
+        providers.Factory(CachedOrderRepository, coupon_cache=coupon_cache, claim_cache=coupon_claim_cache)
+        if settings.coupon_cache_enabled
+        else providers.Factory(OrderRepository)
+    )
+    recommendation_engine = providers.Singleton(
+        RecommendationEngine,
+        product_repo=product_repo,
+        order_repo=order_repo,
+        refresh_seconds=settings.recommendation_refresh_seconds,
+    )
+    product_search_index = providers.Singleton(
+        ProductSearchIndex,
+        product_repo=product_repo,
+        refresh_seconds=settings.search_index_refresh_seconds,
+    )
+    product_service = providers.Factory(
+        ProductService,
+        product_repo=product_repo,
+        recommendation_engine=recommendation_engine,
+        search_index=product_search_index,
+    )
+    payment_gateway = (
+        providers.Singleton(FakePaymentGateway)
+        if settings.payment_gateway == "fake"
+        else providers.Singleton(
+            PortOnePaymentGateway,
+            secret=settings.iamport_payment_secret,
+            timeout_seconds=settings.payment_gateway_timeout_seconds,
+            max_connections=settings.payment_gateway_max_connections,
+        )
+    )
+    order_service = providers.Factory(OrderService, order_repo=order_repo, payment_gateway=payment_gateway)
+    payment_webhook_worker = providers.Singleton(
+        PaymentWebhookWorker,
+        order_repo=order_repo,
+        order_service=order_service,
+        concurrency=settings.payment_webhook_concurrency,
+        poll_seconds=settings.payment_webhook_poll_seconds,
+    )
+    idempotency_cache = providers.Singleton(
+        TTLCache,
+        max_size=settings.idempotency_cache_max_size,
+        ttl_seconds=settings.idempotency_cache_ttl_seconds,
+    )
+    idempotency_repo = providers.Factory(IdempotencyRepository)
+    idempotency_service = providers.Singleton(
+        IdempotencyService,
+        idempotency_repo=idempotency_repo,
+        cache=idempotency_cache,
+    )
+    coupon_campaign_repo = providers.Factory(CouponCampaignRepository)
+    coupon_campaign_service = providers.Factory(
+        CouponCampaignService,
+        order_repo=order_repo,
+        campaign_repo=coupon_campaign_repo,
+    )
+    coupon_campaign_runner = providers.Singleton(
+        CouponCampaignRunner,
+        campaign_repo=coupon_campaign_repo,
+        chunk_size=settings.coupon_campaign_chunk_size,
+        poll_seconds=settings.coupon_campaign_poll_seconds,
+    )
+    point_repo = providers.Factory(PointRepository)
+    point_service = providers.Factory(PointService, point_repo=point_repo)
+    analytics_repo = providers.Factory(AnalyticsRepository)
+    analytics_service = providers.Factory(AnalyticsService, analytics_repo=analytics_repo)
     cartitem_repo = providers.Factory(CartItemRepository)
     cartitem_service = providers.Factory(CartItemService, cartitem_repo=cartitem_repo)
\ No newline at end of file
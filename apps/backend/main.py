@@ -1,17 +1,37 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from config import get_settings
 from containers import Container
 
 from user.interface.controllers.user_controller import router as user_routers
 from product.interface.controllers.product_controller import router as product_routers
 from order.interface.controllers.order_controller import router as order_routers
 from order.interface.controllers.coupon_controller import router as coupon_routers
+from order.interface.controllers.analytics_controller import router as analytics_routers
 from cartitem.interface.controllers.cartitem_controller import router as cartitem_routers
 
-app = FastAPI(docs_url="/api/docs", redoc_url="/api/redoc")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.container.recommendation_engine().refresh_async()
+    app.container.product_search_index().refresh_async()
+    payment_webhook_worker = app.container.payment_webhook_worker()
+    if get_settings().payment_webhook_worker_enabled:
+        payment_webhook_worker.start()
+    coupon_campaign_runner = app.container.coupon_campaign_runner()
+    if get_settings().coupon_campaign_runner_enabled:
+        coupon_campaign_runner.start()
+    yield
+    await coupon_campaign_runner.stop()
+    await payment_webhook_worker.stop()
+    await app.container.payment_gateway().aclose()
+
+
+app = FastAPI(docs_url="/api/docs", redoc_url="/api/redoc", lifespan=lifespan)
 app.container = Container()
 
 app.include_router(user_routers, prefix="/api")
@@ -19,6 +39,7 @@ app.include_router(product_routers, prefix="/api")
 app.include_router(order_routers, prefix="/api")
 app.include_router(cartitem_routers, prefix="/api")
 app.include_router(coupon_routers, prefix="/api")
+app.include_router(analytics_routers, prefix="/api")
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
@@ -0,0 +1,32 @@
+"""add product keyset indexes
+
+Revision ID: 3f1c9a7e2b40
+Revises: a31a39118bf9
+Create Date: 2026-10-18 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7e2b40'
+down_revision: Union[str, None] = 'a31a39118bf9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_product_created_at_id', 'Product', ['created_at', 'id'], unique=False)
+    op.create_index('ix_product_category_main_created_at_id', 'Product', ['category_main', 'created_at', 'id'], unique=False)
+    op.create_index('ix_product_category_created_at_id', 'Product', ['category_main', 'category_sub', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_category_created_at_id', table_name='Product')
+    op.drop_index('ix_product_category_main_created_at_id', table_name='Product')
+    op.drop_index('ix_product_created_at_id', table_name='Product')
@@ -0,0 +1,59 @@
+"""add product rating summary
+
+Revision ID: 8d2e5b71c0a4
+Revises: 3f1c9a7e2b40
+Create Date: 2026-10-18 10:47:12.904118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e5b71c0a4'
+down_revision: Union[str, None] = '3f1c9a7e2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ProductRatingSummary',
+    sa.Column('product_id', sa.String(length=36), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('rating_1', sa.Integer(), nullable=False),
+    sa.Column('rating_2', sa.Integer(), nullable=False),
+    sa.Column('rating_3', sa.Integer(), nullable=False),
+    sa.Column('rating_4', sa.Integer(), nullable=False),
+    sa.Column('rating_5', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['Product.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('product_id')
+    )
+    op.execute(
+        """
+        INSERT INTO ProductRatingSummary
+            (product_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5, updated_at)
+        SELECT
+            product_id,
+            COUNT(*),
+            SUM(rating),
+            SUM(rating = 1),
+            SUM(rating = 2),
+            SUM(rating = 3),
+            SUM(rating = 4),
+            SUM(rating = 5),
+            NOW()
+        FROM ProductReview
+        WHERE visible = 1
+        GROUP BY product_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ProductRatingSummary')
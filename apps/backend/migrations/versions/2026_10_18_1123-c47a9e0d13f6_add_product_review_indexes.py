@@ -0,0 +1,33 @@
+"""add product review indexes
+
+Revision ID: c47a9e0d13f6
+Revises: 8d2e5b71c0a4
+Create Date: 2026-10-18 11:23:05.377460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47a9e0d13f6'
+down_revision: Union[str, None] = '8d2e5b71c0a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_product_review_product_visible_created_at', 'ProductReview', ['product_id', 'visible', 'created_at'], unique=False)
+    # 상품별 평점순 정렬 (rating DESC, created_at DESC, id DESC). id는 InnoDB 보조 인덱스에 PK로 포함됨.
+    op.create_index('ix_product_review_product_visible_rating', 'ProductReview', ['product_id', 'visible', 'rating', 'created_at'], unique=False)
+    op.create_index('ix_product_review_user_created_at', 'ProductReview', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_review_user_created_at', table_name='ProductReview')
+    op.drop_index('ix_product_review_product_visible_rating', table_name='ProductReview')
+    op.drop_index('ix_product_review_product_visible_created_at', table_name='ProductReview')
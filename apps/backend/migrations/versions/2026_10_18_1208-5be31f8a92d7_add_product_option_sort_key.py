@@ -0,0 +1,47 @@
+"""add product option sort key
+
+Revision ID: 5be31f8a92d7
+Revises: c47a9e0d13f6
+Create Date: 2026-10-18 12:08:33.160725
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5be31f8a92d7'
+down_revision: Union[str, None] = 'c47a9e0d13f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _sort_key(option: str) -> str:
+    # product.domain.product.make_option_sort_key 와 동일 (마이그레이션 시점 기준으로 고정)
+    if option.isdecimal() and len(option) <= 10:
+        return f"0{int(option):010d}"
+    return f"1{option}"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('ProductOption', sa.Column('sort_key', sa.String(length=40), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, `option` FROM ProductOption")).all()
+    if rows:
+        bind.execute(
+            sa.text("UPDATE ProductOption SET sort_key = :sort_key WHERE id = :id"),
+            [{"id": id, "sort_key": _sort_key(option)} for id, option in rows],
+        )
+
+    op.alter_column('ProductOption', 'sort_key', existing_type=sa.String(length=40), nullable=False)
+    op.create_index('ix_product_option_type_sort_key', 'ProductOption', ['product_id', 'product_option_type_id', 'sort_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_option_type_sort_key', table_name='ProductOption')
+    op.drop_column('ProductOption', 'sort_key')
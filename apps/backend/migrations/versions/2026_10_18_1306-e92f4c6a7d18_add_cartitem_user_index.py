@@ -0,0 +1,28 @@
+"""add cartitem user index
+
+Revision ID: e92f4c6a7d18
+Revises: 5be31f8a92d7
+Create Date: 2026-10-18 13:06:51.742390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e92f4c6a7d18'
+down_revision: Union[str, None] = '5be31f8a92d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_cartitem_user_id_created_at', 'CartItem', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_cartitem_user_id_created_at', table_name='CartItem')
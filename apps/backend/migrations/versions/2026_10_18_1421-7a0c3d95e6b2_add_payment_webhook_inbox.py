@@ -0,0 +1,43 @@
+"""add payment webhook inbox
+
+Revision ID: 7a0c3d95e6b2
+Revises: e92f4c6a7d18
+Create Date: 2026-10-18 14:21:09.583216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a0c3d95e6b2'
+down_revision: Union[str, None] = 'e92f4c6a7d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('PaymentWebhookInbox',
+    sa.Column('merchant_id', sa.String(length=128), nullable=False),
+    sa.Column('webhook_type', sa.String(length=64), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('is_test', sa.Boolean(), nullable=False),
+    sa.Column('status', sa.Enum('대기', '처리중', '완료', '실패', name='status'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('received_at', sa.DateTime(), nullable=False),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('merchant_id')
+    )
+    op.create_index('ix_payment_webhook_inbox_status_received_at', 'PaymentWebhookInbox', ['status', 'received_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payment_webhook_inbox_status_received_at', table_name='PaymentWebhookInbox')
+    op.drop_table('PaymentWebhookInbox')
@@ -0,0 +1,125 @@
+"""add sales rollups
+
+Revision ID: b3f7e1a5c920
+Revises: 7a0c3d95e6b2
+Create Date: 2026-10-18 14:48:31.270614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f7e1a5c920'
+down_revision: Union[str, None] = '7a0c3d95e6b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 집계 버킷은 KST 기준 (order.infra.repository.analytics_repo.REPORT_TZ와 동일)
+PAID_AT = "DATE_ADD(COALESCE(p.paid_at, p.created_at), INTERVAL 9 HOUR)"
+REFUNDED_AT = "DATE_ADD(r.created_at, INTERVAL 9 HOUR)"
+ORDER_TOTALS = "(SELECT order_id, SUM(final_price) AS total FROM OrderItem GROUP BY order_id)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('SalesDaily',
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=0), nullable=False),
+    sa.Column('refund_count', sa.Integer(), nullable=False),
+    sa.Column('refund_amount', sa.Numeric(precision=14, scale=0), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('date', 'shard')
+    )
+    op.create_table('SalesHourly',
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=0), nullable=False),
+    sa.Column('refund_count', sa.Integer(), nullable=False),
+    sa.Column('refund_amount', sa.Numeric(precision=14, scale=0), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('hour', 'shard')
+    )
+    op.create_table('ProductSalesDaily',
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('product_id', sa.String(length=36), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.Column('units', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=14, scale=0), nullable=False),
+    sa.Column('refunded_units', sa.Integer(), nullable=False),
+    sa.Column('refunded_amount', sa.Numeric(precision=14, scale=0), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('date', 'product_id', 'shard')
+    )
+
+    # 취소된 결제도 결제 시점에는 매출이었으므로 포함하고, 환불은 환불 시점 버킷에 따로 더함.
+    # 과거 데이터는 모두 shard 0에 기록함.
+    for table, key, bucket in (
+        ("SalesDaily", "date", "DATE({at})"),
+        ("SalesHourly", "hour", "DATE_FORMAT({at}, '%Y-%m-%d %H:00:00')"),
+    ):
+        op.execute(
+            f"""
+            INSERT INTO {table} ({key}, order_count, revenue, refund_count, refund_amount, updated_at)
+            SELECT {bucket.format(at=PAID_AT)}, COUNT(*), SUM(p.amount), 0, 0, NOW()
+            FROM Payment p
+            WHERE p.status IN ('성공', '취소')
+            GROUP BY 1
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO {table} ({key}, order_count, revenue, refund_count, refund_amount, updated_at)
+            SELECT {bucket.format(at=REFUNDED_AT)}, 0, 0, COUNT(*), SUM(r.amount), NOW()
+            FROM Refund r
+            WHERE r.status = '완료'
+            GROUP BY 1
+            ON DUPLICATE KEY UPDATE
+                refund_count = VALUES(refund_count),
+                refund_amount = VALUES(refund_amount)
+            """
+        )
+
+    # 상품별 금액은 결제/환불 금액을 주문 내 final_price 비율로 나눈 값 (analytics_repo._allocate와 같은 규칙).
+    # 과거 데이터는 반올림하므로 주문당 몇 원의 차이가 생길 수 있음.
+    op.execute(
+        f"""
+        INSERT INTO ProductSalesDaily
+            (date, product_id, units, revenue, refunded_units, refunded_amount, updated_at)
+        SELECT DATE({PAID_AT}), oi.product_id, SUM(oi.quantity),
+            SUM(ROUND(p.amount * oi.final_price / NULLIF(t.total, 0))), 0, 0, NOW()
+        FROM Payment p
+        JOIN OrderItem oi ON oi.order_id = p.order_id
+        JOIN {ORDER_TOTALS} t ON t.order_id = p.order_id
+        WHERE p.status IN ('성공', '취소')
+        GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO ProductSalesDaily
+            (date, product_id, units, revenue, refunded_units, refunded_amount, updated_at)
+        SELECT DATE({REFUNDED_AT}), oi.product_id, 0, 0, SUM(oi.quantity),
+            SUM(ROUND(r.amount * oi.final_price / NULLIF(t.total, 0))), NOW()
+        FROM Refund r
+        JOIN OrderItem oi ON oi.order_id = r.order_id
+        JOIN {ORDER_TOTALS} t ON t.order_id = r.order_id
+        WHERE r.status = '완료'
+        GROUP BY 1, 2
+        ON DUPLICATE KEY UPDATE
+            refunded_units = VALUES(refunded_units),
+            refunded_amount = VALUES(refunded_amount)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ProductSalesDaily')
+    op.drop_table('SalesHourly')
+    op.drop_table('SalesDaily')
@@ -0,0 +1,40 @@
+"""add idempotency key
+
+Revision ID: 4d8a2f6c1e73
+Revises: b3f7e1a5c920
+Create Date: 2026-10-18 15:17:42.651093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8a2f6c1e73'
+down_revision: Union[str, None] = 'b3f7e1a5c920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('IdempotencyKey',
+    sa.Column('scope', sa.String(length=32), nullable=False),
+    sa.Column('key', sa.String(length=128), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.Enum('처리중', '완료', name='status'), nullable=False),
+    sa.Column('response', sa.Text(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('scope', 'key')
+    )
+    op.create_index('ix_idempotency_key_expires_at', 'IdempotencyKey', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_idempotency_key_expires_at', table_name='IdempotencyKey')
+    op.drop_table('IdempotencyKey')
@@ -0,0 +1,44 @@
+"""add point balance
+
+Revision ID: 9c1e5a7b3d20
+Revises: 4d8a2f6c1e73
+Create Date: 2026-10-18 15:39:05.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c1e5a7b3d20'
+down_revision: Union[str, None] = '4d8a2f6c1e73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('PointBalance',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('balance', sa.Numeric(precision=10, scale=0), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.execute(
+        """
+        INSERT INTO PointBalance (user_id, balance, updated_at)
+        SELECT
+            user_id,
+            SUM(CASE WHEN type = '사용' THEN -amount ELSE amount END),
+            NOW()
+        FROM PointTransaction
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('PointBalance')
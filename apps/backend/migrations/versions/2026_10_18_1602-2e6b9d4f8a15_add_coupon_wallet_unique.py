@@ -0,0 +1,88 @@
+"""add coupon wallet unique
+
+Revision ID: 2e6b9d4f8a15
+Revises: 9c1e5a7b3d20
+Create Date: 2026-10-18 16:02:27.490331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e6b9d4f8a15'
+down_revision: Union[str, None] = '9c1e5a7b3d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 같은 유저/쿠폰의 중복 지갑은 하나로 합침.
+    # 사용됐거나 주문에 연결된 지갑을 우선 남기고, 그중 가장 먼저 만든 것(ULID 순)을 선택.
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE coupon_wallet_dedupe (
+            id VARCHAR(36) NOT NULL PRIMARY KEY,
+            keep_id VARCHAR(36) NOT NULL
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO coupon_wallet_dedupe (id, keep_id)
+        SELECT cw.id, (
+            SELECT k.id FROM CouponWallet k
+            WHERE k.user_id = cw.user_id AND k.coupon_id = cw.coupon_id
+            ORDER BY (k.is_used OR EXISTS (SELECT 1 FROM OrderItem oi WHERE oi.coupon_wallet_id = k.id)) DESC, k.id
+            LIMIT 1
+        )
+        FROM CouponWallet cw
+        JOIN (
+            SELECT user_id, coupon_id FROM CouponWallet
+            GROUP BY user_id, coupon_id
+            HAVING COUNT(*) > 1
+        ) dup ON dup.user_id = cw.user_id AND dup.coupon_id = cw.coupon_id
+        """
+    )
+    # 지워질 지갑을 참조하는 주문 상품은 남길 지갑으로 옮김
+    op.execute(
+        """
+        UPDATE OrderItem oi
+        JOIN coupon_wallet_dedupe d ON d.id = oi.coupon_wallet_id AND d.id <> d.keep_id
+        SET oi.coupon_wallet_id = d.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE cw FROM CouponWallet cw
+        JOIN coupon_wallet_dedupe d ON d.id = cw.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute("DROP TEMPORARY TABLE coupon_wallet_dedupe")
+
+    remaining = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT COUNT(*) FROM (
+                SELECT 1 FROM CouponWallet
+                GROUP BY user_id, coupon_id
+                HAVING COUNT(*) > 1
+            ) dup
+            """
+        )
+    ).scalar()
+    if remaining:
+        raise RuntimeError(
+            f"CouponWallet still has {remaining} duplicated (user_id, coupon_id) pairs; "
+            "resolve them before adding uq_coupon_wallet_user_coupon."
+        )
+
+    op.create_unique_constraint('uq_coupon_wallet_user_coupon', 'CouponWallet', ['user_id', 'coupon_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_coupon_wallet_user_coupon', 'CouponWallet', type_='unique')
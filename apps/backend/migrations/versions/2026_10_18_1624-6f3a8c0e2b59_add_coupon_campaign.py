@@ -0,0 +1,52 @@
+"""add coupon campaign
+
+Revision ID: 6f3a8c0e2b59
+Revises: 2e6b9d4f8a15
+Create Date: 2026-10-18 16:24:51.837206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f3a8c0e2b59'
+down_revision: Union[str, None] = '2e6b9d4f8a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('CouponCampaign',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('coupon_id', sa.String(length=36), nullable=False),
+    sa.Column('segment', sa.Enum('전체', '지정', '주문', name='segment'), nullable=False),
+    sa.Column('user_ids', sa.JSON(), nullable=True),
+    sa.Column('ordered_from', sa.DateTime(), nullable=True),
+    sa.Column('ordered_to', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.Enum('대기', '진행중', '완료', '실패', name='status'), nullable=False),
+    sa.Column('target_count', sa.Integer(), nullable=True),
+    sa.Column('issued_count', sa.Integer(), nullable=False),
+    sa.Column('last_user_id', sa.String(length=36), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('lease_owner', sa.String(length=36), nullable=True),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['coupon_id'], ['Coupon.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_coupon_campaign_status_created_at', 'CouponCampaign', ['status', 'created_at'], unique=False)
+    op.create_index('ix_orders_user_id_created_at', 'Orders', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_user_id_created_at', table_name='Orders')
+    op.drop_index('ix_coupon_campaign_status_created_at', table_name='CouponCampaign')
+    op.drop_table('CouponCampaign')
@@ -0,0 +1,56 @@
+from datetime import date, datetime, time, timedelta
+from typing import List
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+
+from order.domain.order import SalesDaily, SalesHourly, ProductSales
+from order.domain.repository.analytics_repo import IAnalyticsRepository
+
+MAX_DAILY_RANGE_DAYS = 366
+MAX_HOURLY_RANGE_DAYS = 31
+
+
+class AnalyticsService:
+    @inject
+    def __init__(
+        self,
+        analytics_repo: IAnalyticsRepository,
+    ):
+        self.analytics_repo = analytics_repo
+
+    def _check_range(self, date_from: date, date_to: date, max_days: int):
+        if date_from > date_to:
+            raise HTTPException(status_code=400, detail="date_from must not be after date_to.")
+        if (date_to - date_from).days + 1 > max_days:
+            raise HTTPException(status_code=400, detail=f"Date range must not exceed {max_days} days.")
+
+    def get_sales_daily(self, date_from: date, date_to: date) -> List[SalesDaily]:
+        """
+        집계 테이블에서 일별 매출 조회. 매출이 없는 날은 0으로 채움.
+        """
+        self._check_range(date_from, date_to, MAX_DAILY_RANGE_DAYS)
+        rows = {row.date: row for row in self.analytics_repo.get_sales_daily(date_from, date_to)}
+
+        days = (date_to - date_from).days + 1
+        return [
+            rows.get(day) or SalesDaily(date=day, order_count=0, revenue=0, refund_count=0, refund_amount=0)
+            for day in (date_from + timedelta(days=i) for i in range(days))
+        ]
+
+    def get_sales_hourly(self, date_from: date, date_to: date) -> List[SalesHourly]:
+        """
+        집계 테이블에서 시간별 매출 조회. 매출이 없는 시간은 0으로 채움.
+        """
+        self._check_range(date_from, date_to, MAX_HOURLY_RANGE_DAYS)
+        rows = {row.hour: row for row in self.analytics_repo.get_sales_hourly(date_from, date_to)}
+
+        start = datetime.combine(date_from, time.min)
+        hours = ((date_to - date_from).days + 1) * 24
+        return [
+            rows.get(hour) or SalesHourly(hour=hour, order_count=0, revenue=0, refund_count=0, refund_amount=0)
+            for hour in (start + timedelta(hours=i) for i in range(hours))
+        ]
+
+    def get_product_sales(self, date_from: date, date_to: date, limit: int) -> List[ProductSales]:
+        self._check_range(date_from, date_to, MAX_DAILY_RANGE_DAYS)
+        return self.analytics_repo.get_product_sales(date_from, date_to, limit)
@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+from ulid import ULID
+
+from order.domain.order import CouponCampaign
+from order.domain.repository.coupon_campaign_repo import ICouponCampaignRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CouponCampaignRunner:
+    """
+    쿠폰 캠페인을 chunk_size명씩 지급하는 백그라운드 작업.
+    캠페인은 임대(lease)로 한 워커만 진행하며, chunk마다 임대를 갱신함.
+    워커가 죽으면 임대가 만료된 뒤 다른 워커가 저장된 커서부터 이어서 진행.
+    """
+    def __init__(
+        self,
+        campaign_repo: ICouponCampaignRepository,
+        chunk_size: int = 1000,
+        poll_seconds: float = 5.0,
+        lease_seconds: int = 60,
+        max_attempts: int = 5,
+    ):
+        self.campaign_repo = campaign_repo
+        self.chunk_size = chunk_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.ulid = ULID()
+        self.owner = self.ulid.generate()
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="coupon-campaign-runner")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                campaign = await self.run_once()
+            except Exception:
+                logger.exception("Coupon campaign runner iteration failed")
+                campaign = None
+            if campaign is None:
+                await asyncio.sleep(self.poll_seconds)
+
+    async def run_once(self) -> CouponCampaign | None:
+        """
+        캠페인 하나를 가져와 끝날 때까지(또는 임대를 잃을 때까지) 지급.
+        """
+        try:
+            campaign = await run_in_threadpool(self.campaign_repo.claim_campaign, self.owner, self.lease_seconds)
+        except Exception:
+            logger.exception("Failed to claim coupon campaign")
+            return None
+        if campaign is None:
+            return None
+
+        campaign_id = campaign.id
+        try:
+            while campaign is not None and campaign.status == "진행중":
+                campaign = await run_in_threadpool(
+                    self.campaign_repo.issue_campaign_chunk,
+                    campaign_id, self.owner, self.chunk_size, self.lease_seconds, self.ulid.generate,
+                )
+        except Exception as e:
+            logger.warning("Coupon campaign %s failed: %s", campaign_id, e)
+            detail = getattr(e, "detail", None) or str(e)
+            try:
+                await run_in_threadpool(
+                    self.campaign_repo.fail_campaign, campaign_id, self.owner, str(detail)[:1000], self.max_attempts,
+                )
+            except Exception:
+                # 임대가 만료되면 다음 폴링에서 다시 가져감
+                logger.exception("Failed to record coupon campaign %s failure", campaign_id)
+            return None
+        return campaign
@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+from typing import List
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+from ulid import ULID
+
+from order.domain.order import CouponCampaign
+from order.domain.repository.order_repo import IOrderRepository
+from order.domain.repository.coupon_campaign_repo import ICouponCampaignRepository
+
+MAX_CAMPAIGN_USER_IDS = 10000
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.replace(tzinfo=None)
+
+
+class CouponCampaignService:
+    @inject
+    def __init__(
+        self,
+        order_repo: IOrderRepository,
+        campaign_repo: ICouponCampaignRepository,
+    ):
+        self.order_repo = order_repo
+        self.campaign_repo = campaign_repo
+        self.ulid = ULID()
+
+    def create_campaign(
+        self,
+        coupon_id: str,
+        segment: str,
+        user_ids: List[str] | None = None,
+        ordered_from: datetime | None = None,
+        ordered_to: datetime | None = None,
+    ) -> CouponCampaign:
+        """
+        쿠폰 일괄 지급 캠페인을 등록. 실제 지급은 CouponCampaignRunner가 백그라운드에서 진행.
+        """
+        coupon = self.order_repo.find_coupon_by_id(coupon_id)
+        if not coupon.is_active:
+            raise HTTPException(status_code=400, detail="Coupon is inactive")
+
+        now = datetime.now(timezone.utc)
+        valid_from = coupon.valid_from.replace(tzinfo=timezone.utc)
+        valid_until = coupon.valid_until.replace(tzinfo=timezone.utc)
+
+        if not (valid_from <= now <= valid_until):
+            raise HTTPException(status_code=400, detail="Coupon is not valid at this time")
+
+        if segment == "지정":
+            if not user_ids:
+                raise HTTPException(status_code=400, detail="user_ids must be provided for '지정' segment.")
+            user_ids = sorted(set(user_ids))
+            if len(user_ids) > MAX_CAMPAIGN_USER_IDS:
+                raise HTTPException(status_code=400, detail=f"At most {MAX_CAMPAIGN_USER_IDS} user_ids are allowed.")
+        else:
+            user_ids = None
+
+        if segment == "주문":
+            if ordered_from is None or ordered_to is None:
+                raise HTTPException(status_code=400, detail="ordered_from and ordered_to must be provided for '주문' segment.")
+            ordered_from, ordered_to = _to_naive_utc(ordered_from), _to_naive_utc(ordered_to)
+            if ordered_from >= ordered_to:
+                raise HTTPException(status_code=400, detail="ordered_from must be earlier than ordered_to.")
+        else:
+            ordered_from = ordered_to = None
+
+        now = now.replace(tzinfo=None)
+        campaign = CouponCampaign(
+            id=self.ulid.generate(),
+            coupon_id=coupon.id,
+            segment=segment,
+            user_ids=user_ids,
+            ordered_from=ordered_from,
+            ordered_to=ordered_to,
+            status="대기",
+            target_count=None,
+            issued_count=0,
+            last_user_id=None,
+            attempts=0,
+            last_error=None,
+            lease_owner=None,
+            locked_until=None,
+            created_at=now,
+            updated_at=now,
+            finished_at=None,
+        )
+        self.campaign_repo.save_campaign(campaign)
+        return campaign
+
+    def get_campaign(self, campaign_id: str) -> CouponCampaign:
+        return self.campaign_repo.find_campaign_by_id(campaign_id)
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+
+from common.cache import TTLCache, MISSING
+from config import get_settings
+from order.domain.order import IdempotencyRecord
+from order.domain.repository.idempotency_repo import IIdempotencyRepository
+
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH_SIZE = 1000
+
+
+def make_fingerprint(payload: dict) -> str:
+    body = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+class IdempotencyService:
+    """
+    Idempotency-Key 헤더로 재시도 요청을 한 번만 실행.
+    완료된 응답은 DB(IdempotencyKey)에 TTL과 함께 저장하고, 워커 메모리 LRU로 앞단에서 응답함.
+    처리중 키는 idempotency_lease_seconds 동안만 유효하며, 그 뒤에는 워커가 죽었거나 완료 저장에
+    실패한 것으로 보고 다음 요청이 이어받음. 따라서 handler는 리스 시간 안에 끝나야 함.
+    """
+    @inject
+    def __init__(
+        self,
+        idempotency_repo: IIdempotencyRepository,
+        cache: TTLCache,
+    ):
+        self.settings = get_settings()
+        self.idempotency_repo = idempotency_repo
+        self.cache = cache
+        self._last_purge = 0.0
+
+    def run(self, scope: str, key: str | None, payload: dict, handler: Callable[[], Any]):
+        """
+        같은 scope/key의 완료된 요청이 있으면 저장된 응답을 반환하고, 없으면 handler를 실행해 응답을 저장.
+        같은 키가 처리 중(리스 유효)이면 409, 다른 본문으로 재사용되면 422 에러 발생.
+        """
+        if key is None:
+            return handler()
+
+        fingerprint = make_fingerprint(payload)
+        cached = self.cache.get((scope, key))
+        if cached is not MISSING:
+            return self._replay(cached, fingerprint)
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        record = IdempotencyRecord(
+            scope=scope,
+            key=key,
+            fingerprint=fingerprint,
+            status="처리중",
+            response=None,
+            expires_at=now + timedelta(hours=self.settings.idempotency_key_ttl_hours),
+            created_at=now,
+            updated_at=now,
+        )
+        stale_before = now - timedelta(seconds=self.settings.idempotency_lease_seconds)
+        existing = self.idempotency_repo.reserve(record, stale_before)
+        if existing:
+            if existing.status == "처리중":
+                self._check_fingerprint(existing, fingerprint)
+                raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is in progress.")
+            self._remember(existing)
+            return self._replay(existing, fingerprint)
+
+        try:
+            response = jsonable_encoder(handler())
+        except Exception:
+            self.idempotency_repo.release(scope, key)
+            raise
+
+        record.status = "완료"
+        record.response = json.dumps(response, ensure_ascii=False)
+        try:
+            self.idempotency_repo.complete(scope, key, record.response, datetime.now(timezone.utc).replace(tzinfo=None))
+        except Exception:
+            # handler는 이미 실행됐으므로 응답은 그대로 반환. 이 워커로 오는 재시도는 캐시에서 응답하고,
+            # DB의 처리중 키는 리스가 끝날 때까지 다른 워커의 재실행을 막음
+            logger.exception("Failed to store idempotent response for %s/%s", scope, key)
+        self._remember(record)
+        self._purge_expired()
+
+        return response
+
+    def _check_fingerprint(self, record: IdempotencyRecord, fingerprint: str):
+        if record.fingerprint != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request.")
+
+    def _replay(self, record: IdempotencyRecord, fingerprint: str):
+        self._check_fingerprint(record, fingerprint)
+        return json.loads(record.response)
+
+    def _remember(self, record: IdempotencyRecord):
+        remaining = (record.expires_at - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+        ttl_seconds = min(self.cache.ttl_seconds, remaining)
+        if ttl_seconds > 0:
+            self.cache.set((record.scope, record.key), record, ttl_seconds=ttl_seconds)
+
+    def _purge_expired(self):
+        """
+        워커당 idempotency_purge_seconds마다 한 번, 만료된 키를 최대 PURGE_BATCH_SIZE개 삭제.
+        """
+        if time.monotonic() - self._last_purge < self.settings.idempotency_purge_seconds:
+            return
+        self._last_purge = time.monotonic()
+        try:
+            self.idempotency_repo.delete_expired(datetime.now(timezone.utc).replace(tzinfo=None), PURGE_BATCH_SIZE)
+        except Exception:
+            logger.exception("Failed to purge expired idempotency keys")
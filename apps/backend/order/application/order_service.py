@@ -1,26 +1,36 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from dependency_injector.wiring import inject
 from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from ulid import ULID
 import portone_server_sdk as portone
-from dateutil import parser
 
-from order.domain.order import Order, Coupon, CouponWallet, OrderItem, Payment, Refund
+from cartitem.domain.cartitem import CartItemLine
+from order.domain.order import Order, Coupon, CouponWallet, OrderItem, Payment, Refund, PaymentWebhookEvent
+from order.domain.order import CouponDiscount, calculate_coupon_discount
 from order.domain.repository.order_repo import IOrderRepository
+from order.domain.payment_gateway import IPaymentGateway
 from config import get_settings
 
 
+class WebhookEventRejected(Exception):
+    """
+    재시도해도 성공할 수 없는 웹훅 이벤트. (예: 주문이 없는 결제)
+    """
+
+
 class OrderService:
     @inject
     def __init__(
         self,
         order_repo: IOrderRepository,
+        payment_gateway: IPaymentGateway,
     ):
         self.settings = get_settings()
         self.order_repo = order_repo
+        self.payment_gateway = payment_gateway
         self.ulid = ULID()
-        self.portone_client = portone.PaymentClient(secret=self.settings.iamport_payment_secret)
 
     def create_order(
         self,
@@ -39,13 +49,15 @@ class OrderService:
     ) -> Order:
         now = datetime.now(timezone.utc)
 
+        order_id = self.ulid.generate()
+
         # Validate items and prepare order items
         order_items = []
         for item in items:
             order_items.append(
                 OrderItem(
                     id=self.ulid.generate(),
-                    order_id="None",  # Will be set after order creation
+                    order_id=order_id,
                     product_id=item.product_id,
                     product_name=item.product_name,
                     coupon_wallet_id=item.coupon_wallet_id,
@@ -68,7 +80,7 @@ class OrderService:
 
         # Create order
         order = Order(
-            id=self.ulid.generate(),
+            id=order_id,
             user_id=user_id,
             status="결제대기",
             subtotal_price=subtotal_price,
@@ -84,15 +96,79 @@ class OrderService:
             created_at=now,
             updated_at=now,
         )
-        self.order_repo.save(order)
-
-        # Save order items
-        for item in order_items:
-            item.order_id = order.id
-            self.order_repo.save_order_item(item)
+        self.order_repo.save_with_items(order, order_items)
 
         return order
 
+    def create_order_from_cart(
+        self,
+        user_id: str,
+        cartitem_ids: List[str],
+        recipient_name: str,
+        phone_number: str,
+        zipcode: str,
+        address_line1: str,
+        address_line2: Optional[str],
+        order_memo: Optional[str],
+    ) -> tuple[Order, List[OrderItem]]:
+        now = datetime.now(timezone.utc)
+        order_id = self.ulid.generate()
+
+        def build_order(cart_lines: List[CartItemLine]) -> tuple[Order, List[OrderItem]]:
+            # 가격은 클라이언트 값이 아닌 잠금 시점의 상품 판매가로 계산
+            order_items = []
+            for line in cart_lines:
+                if not line.is_product_active:
+                    raise HTTPException(status_code=400, detail=f"Product {line.product_id} is not available")
+                if False in (line.is_option_1_active, line.is_option_2_active, line.is_option_3_active):
+                    raise HTTPException(status_code=400, detail=f"Option of product {line.product_id} is not available")
+
+                order_items.append(
+                    OrderItem(
+                        id=self.ulid.generate(),
+                        order_id=order_id,
+                        product_id=line.product_id,
+                        product_name=line.product_name,
+                        coupon_wallet_id=None,
+                        status="주문완료",
+                        quantity=line.quantity,
+                        unit_price=line.price_sell,
+                        coupon_discount_price=0,
+                        point_discount_price=0,
+                        final_price=line.price_sell * line.quantity,
+                        option_1_type=line.option_type_1,
+                        option_1_value=line.option_1,
+                        option_2_type=line.option_type_2,
+                        option_2_value=line.option_2,
+                        option_3_type=line.option_type_3,
+                        option_3_value=line.option_3,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+
+            subtotal_price = sum(item.final_price for item in order_items)
+            order = Order(
+                id=order_id,
+                user_id=user_id,
+                status="결제대기",
+                subtotal_price=subtotal_price,
+                coupon_discount_price=0,
+                point_discount_price=0,
+                total_price=subtotal_price,
+                recipient_name=recipient_name,
+                phone_number=phone_number,
+                zipcode=zipcode,
+                address_line1=address_line1,
+                address_line2=address_line2,
+                order_memo=order_memo,
+                created_at=now,
+                updated_at=now,
+            )
+            return order, order_items
+
+        return self.order_repo.create_order_from_cart(user_id, cartitem_ids, build_order)
+
     def get_order(self, order_id: str) -> tuple[Order, List[OrderItem]]:
         order = self.order_repo.find_by_id(order_id)
         if not order:
@@ -107,6 +183,9 @@ class OrderService:
     def get_orders(self, page: int, items_per_page: int) -> tuple[int, List[Order]]:
         total_count, orders = self.order_repo.get_orders(page, items_per_page)
         return total_count, orders
+
+    def export_orders(self) -> Iterator[tuple[Order, List[OrderItem]]]:
+        return self.order_repo.iter_orders_with_items()
     
     def get_orders_by_user(self, user_id: str) -> tuple[int, List[Order]]:
         total_count, orders = self.order_repo.get_orders_by_user(user_id)
@@ -214,8 +293,7 @@ class OrderService:
         if not (valid_from <= now <= valid_until):
             raise HTTPException(status_code=400, detail="Coupon is not valid at this time")
         
-        existing_wallet = self.order_repo.find_coupon_wallet_by_user_and_coupon(user_id, coupon.id)
-        if existing_wallet:
+        if self.order_repo.has_coupon_wallet(user_id, coupon.id):
             raise HTTPException(status_code=400, detail="Coupon already in wallet")
         
         coupon_wallet = CouponWallet(
@@ -244,6 +322,48 @@ class OrderService:
         coupon_wallets = self.order_repo.get_coupon_wallets_by_user(user_id)
         return coupon_wallets
     
+    def get_best_coupons(
+        self,
+        user_id: str,
+        subtotal: int | None = None,
+        cartitem_ids: List[str] | None = None,
+    ) -> tuple[int, List[CouponDiscount]]:
+        """
+        주문 금액(또는 장바구니 항목의 현재 판매가 합계)에 적용 가능한 쿠폰을 할인 금액이 큰 순으로 반환.
+        할인 금액이 같으면 만료가 빠른 쿠폰을 먼저 추천.
+        """
+        if (subtotal is None) == (not cartitem_ids):
+            raise HTTPException(status_code=400, detail="Either subtotal or cartitem_ids must be provided.")
+
+        if cartitem_ids:
+            cart_lines = self.order_repo.find_cart_lines(user_id, cartitem_ids)
+            subtotal = sum(line.price_sell * line.quantity for line in cart_lines)
+
+        candidates = []
+        for coupon_wallet, coupon in self.order_repo.get_usable_coupon_wallets(user_id, datetime.now(timezone.utc)):
+            discount = calculate_coupon_discount(coupon, subtotal)
+            if discount is None:
+                continue
+            candidates.append(
+                CouponDiscount(
+                    coupon_wallet_id=coupon_wallet.id,
+                    coupon_id=coupon.id,
+                    code=coupon.code,
+                    description=coupon.description,
+                    discount_type=coupon.discount_type,
+                    discount_rate=coupon.discount_rate,
+                    discount_amount=coupon.discount_amount,
+                    min_order_amount=coupon.min_order_amount or 0,
+                    max_discount_amount=coupon.max_discount_amount,
+                    valid_until=coupon.valid_until,
+                    discount=discount,
+                    total_price=subtotal - discount,
+                )
+            )
+
+        candidates.sort(key=lambda c: (-c.discount, c.valid_until, c.coupon_wallet_id))
+        return subtotal, candidates
+
     def use_coupon_wallet(self, coupon_wallet_id: str) -> CouponWallet:
         coupon_wallet = self.order_repo.find_coupon_wallet_by_id(coupon_wallet_id)
         if not coupon_wallet:
@@ -279,34 +399,57 @@ class OrderService:
             raise HTTPException(status_code=400, detail=str(e))
 
         if isinstance(webhook, portone.webhook.WebhookTransactionPaid): # 결제 승인
-            try:
-                iamport_payment_response = await self.portone_client.get_payment_async(payment_id=webhook.data.payment_id)
-                if not iamport_payment_response:
-                    raise ValueError
-                
-                order_id = iamport_payment_response.custom_data[1:-1]
-                order = self.order_repo.find_by_id(order_id)
-                if not order:
-                    raise ValueError
-
-                now = datetime.now(timezone.utc)
-                payment = Payment(
-                    id=self.ulid.generate(),
-                    order_id=order_id,
-                    merchant_id=webhook.data.payment_id,
-                    status="성공",
-                    method=iamport_payment_response.method.provider,
-                    amount=iamport_payment_response.amount.total,
-                    paid_at=parser.isoparse(iamport_payment_response.paid_at),
-                    created_at=now,
-                    updated_at=now,
-                )
-                self.order_repo.save_payment(payment)
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=str(e))
+            # 검증된 이벤트를 inbox에 저장하고 바로 응답. 실제 처리는 PaymentWebhookWorker가 수행.
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            event = PaymentWebhookEvent(
+                merchant_id=webhook.data.payment_id,
+                webhook_type=type(webhook).__name__,
+                payload=payload_string,
+                is_test=is_test,
+                status="대기",
+                attempts=0,
+                last_error=None,
+                locked_until=None,
+                received_at=now,
+                processed_at=None,
+                updated_at=now,
+            )
+            await run_in_threadpool(self.order_repo.save_webhook_event, event)
+            return {"status": "accepted"}
         else:
             return {"status": "ignored", "message": "Unhandled webhook type"}
 
+    async def process_webhook_event(self, event: PaymentWebhookEvent) -> bool:
+        """
+        inbox 이벤트 하나를 처리. DB 작업은 스레드풀에서 실행해 이벤트 루프를 막지 않음.
+        같은 결제가 이미 저장되어 있으면 다시 저장하지 않음.
+        주문이 없으면 WebhookEventRejected 발생.
+        """
+        gateway_payment = await self.payment_gateway.get_payment(event.merchant_id)
+        if not gateway_payment:
+            raise ValueError(f"Payment {event.merchant_id} not found")
+
+        try:
+            await run_in_threadpool(self.order_repo.find_by_id, gateway_payment.order_id)
+        except HTTPException as e:
+            if e.status_code == 404:
+                raise WebhookEventRejected(f"Order {gateway_payment.order_id} not found")
+            raise
+
+        now = datetime.now(timezone.utc)
+        payment = Payment(
+            id=self.ulid.generate(),
+            order_id=gateway_payment.order_id,
+            merchant_id=event.merchant_id,
+            status="성공",
+            method=gateway_payment.method,
+            amount=gateway_payment.amount,
+            paid_at=gateway_payment.paid_at,
+            created_at=now,
+            updated_at=now,
+        )
+        return await run_in_threadpool(self.order_repo.complete_webhook_event, event.merchant_id, payment)
+
     def refund_payment(self, order_id: str, payment_id: str, merchant_id: str, amount: int, memo: str | None) -> Refund:
         order = self.order_repo.find_by_id(order_id)
         if not order:
@@ -320,7 +463,7 @@ class OrderService:
             raise HTTPException(status_code=400, detail="Invalid refund amount")
 
         try:
-            response = self.portone_client.cancel_payment(
+            cancelled = self.payment_gateway.cancel_payment(
                 payment_id=merchant_id,
                 amount=amount,
                 reason=memo,
@@ -328,7 +471,7 @@ class OrderService:
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
         
-        if isinstance(response.cancellation, portone.payment.SucceededPaymentCancellation): # 취소 성공
+        if cancelled: # 취소 성공
             order_items = self.order_repo.get_order_items(order_id)
             now = datetime.now(timezone.utc)
             refund = Refund(
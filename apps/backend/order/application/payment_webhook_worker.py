@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+
+from order.application.order_service import OrderService, WebhookEventRejected
+from order.domain.order import PaymentWebhookEvent
+from order.domain.repository.order_repo import IOrderRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentWebhookWorker:
+    """
+    결제 웹훅 inbox를 비우는 백그라운드 작업.
+    SKIP LOCKED로 이벤트를 가져오므로 여러 워커 프로세스가 동시에 돌아도 중복 처리되지 않음.
+    동시 처리 개수는 concurrency로 제한하고, DB 작업은 스레드풀에서 실행.
+    """
+    def __init__(
+        self,
+        order_repo: IOrderRepository,
+        order_service: OrderService,
+        concurrency: int = 4,
+        batch_size: int = 20,
+        poll_seconds: float = 1.0,
+        lease_seconds: int = 60,
+        max_attempts: int = 5,
+    ):
+        self.order_repo = order_repo
+        self.order_service = order_service
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._semaphore: asyncio.Semaphore | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._task = asyncio.create_task(self._run(), name="payment-webhook-worker")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                events = await self.drain_once()
+            except Exception:
+                logger.exception("Payment webhook worker iteration failed")
+                events = []
+            if len(events) < self.batch_size:
+                await asyncio.sleep(self.poll_seconds)
+
+    async def drain_once(self) -> list[PaymentWebhookEvent]:
+        try:
+            events = await run_in_threadpool(self.order_repo.claim_webhook_events, self.batch_size, self.lease_seconds)
+        except Exception:
+            logger.exception("Failed to claim payment webhook events")
+            return []
+
+        await asyncio.gather(*(self._process(event) for event in events))
+        return events
+
+    async def _process(self, event: PaymentWebhookEvent):
+        async with self._semaphore:
+            try:
+                await self.order_service.process_webhook_event(event)
+            except Exception as e:
+                logger.warning("Payment webhook %s failed (attempt %d): %s", event.merchant_id, event.attempts, e)
+                detail = getattr(e, "detail", None) or str(e)
+                # 재시도해도 소용없는 이벤트는 바로 실패 처리
+                max_attempts = 0 if isinstance(e, WebhookEventRejected) else self.max_attempts
+                try:
+                    await run_in_threadpool(
+                        self.order_repo.fail_webhook_event,
+                        event.merchant_id, event.locked_until, str(detail)[:1000], max_attempts,
+                    )
+                except Exception:
+                    # 임대가 만료되면 다른 폴링에서 다시 가져감
+                    logger.exception("Failed to release payment webhook %s", event.merchant_id)
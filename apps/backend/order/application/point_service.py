@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from dependency_injector.wiring import inject
+from fastapi import HTTPException
+from ulid import ULID
+
+from order.domain.order import PointTransaction, PointBalance
+from order.domain.repository.point_repo import IPointRepository
+
+POINT_TYPES = ("적립", "사용", "취소")  # 취소: 사용한 포인트 복원
+
+
+class PointService:
+    @inject
+    def __init__(
+        self,
+        point_repo: IPointRepository,
+    ):
+        self.point_repo = point_repo
+        self.ulid = ULID()
+
+    def get_point_balance(self, user_id: str) -> PointBalance:
+        return self.point_repo.find_balance(user_id)
+
+    def create_point_transaction(
+        self,
+        user_id: str,
+        type: str,
+        amount: int,
+        order_id: str | None = None,
+    ) -> PointTransaction:
+        if type not in POINT_TYPES:
+            raise HTTPException(status_code=400, detail="Invalid point transaction type.")
+        if amount <= 0:
+            raise HTTPException(status_code=400, detail="Amount must be positive.")
+
+        now = datetime.now(timezone.utc)
+        point_transaction = PointTransaction(
+            id=self.ulid.generate(),
+            user_id=user_id,
+            order_id=order_id,
+            type=type,
+            amount=amount,
+            balance_after=0,
+            created_at=now,
+            updated_at=now,
+        )
+
+        return self.point_repo.save_point_transaction(point_transaction)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from dataclasses import dataclass
 
 
@@ -49,6 +49,40 @@ class CouponWallet:
     updated_at: datetime
 
 
+@dataclass
+class CouponDiscount:
+    coupon_wallet_id: str
+    coupon_id: str
+    code: str | None
+    description: str | None
+    discount_type: str
+    discount_rate: int | None
+    discount_amount: int | None
+    min_order_amount: int
+    max_discount_amount: int
+    valid_until: datetime
+    discount: int
+    total_price: int
+
+
+def calculate_coupon_discount(coupon: Coupon, subtotal: int) -> int | None:
+    """
+    주문 금액에 쿠폰을 적용했을 때의 할인 금액. 최소 주문 금액 미달이거나 유형별 할인 값(비율/금액)이 비어 있으면 None.
+    최소 주문 금액이 비어 있으면 0으로 봄. 비율 쿠폰은 원 단위 절사, 모든 할인은 max_discount_amount와 주문 금액을 넘지 않음.
+    """
+    if subtotal < (coupon.min_order_amount or 0):
+        return None
+    if coupon.discount_type == "비율":
+        if coupon.discount_rate is None:
+            return None
+        discount = subtotal * coupon.discount_rate // 100
+    else:
+        if coupon.discount_amount is None:
+            return None
+        discount = coupon.discount_amount
+    return int(max(0, min(discount, coupon.max_discount_amount, subtotal)))
+
+
 @dataclass
 class OrderItem:
     id: str
@@ -85,6 +119,15 @@ class Payment:
     updated_at: datetime
 
 
+@dataclass
+class GatewayPayment:
+    payment_id: str      # PG사 결제 ID (= Payment.merchant_id)
+    order_id: str
+    method: str
+    amount: int
+    paid_at: datetime | None
+
+
 @dataclass
 class PointTransaction:
     id: str
@@ -97,6 +140,13 @@ class PointTransaction:
     updated_at: datetime
 
 
+@dataclass
+class PointBalance:
+    user_id: str
+    balance: int
+    updated_at: datetime | None
+
+
 @dataclass
 class Refund:
     id: str
@@ -108,4 +158,80 @@ class Refund:
     restore_point_amount: int
     created_at: datetime
     updated_at: datetime
-    memo: str | None
\ No newline at end of file
+    memo: str | None
+
+
+@dataclass
+class PaymentWebhookEvent:
+    merchant_id: str
+    webhook_type: str
+    payload: str
+    is_test: bool
+    status: str
+    attempts: int
+    last_error: str | None
+    locked_until: datetime | None
+    received_at: datetime
+    processed_at: datetime | None
+    updated_at: datetime
+
+
+@dataclass
+class CouponCampaign:
+    id: str
+    coupon_id: str
+    segment: str  # 전체, 지정, 주문
+    user_ids: list[str] | None
+    ordered_from: datetime | None
+    ordered_to: datetime | None
+    status: str
+    target_count: int | None
+    issued_count: int
+    last_user_id: str | None
+    attempts: int
+    last_error: str | None
+    lease_owner: str | None
+    locked_until: datetime | None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None
+
+
+@dataclass
+class IdempotencyRecord:
+    scope: str
+    key: str
+    fingerprint: str
+    status: str
+    response: str | None
+    expires_at: datetime
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass
+class SalesDaily:
+    date: date
+    order_count: int
+    revenue: int
+    refund_count: int
+    refund_amount: int
+
+
+@dataclass
+class SalesHourly:
+    hour: datetime
+    order_count: int
+    revenue: int
+    refund_count: int
+    refund_amount: int
+
+
+@dataclass
+class ProductSales:
+    product_id: str
+    product_name: str | None
+    units: int
+    revenue: int
+    refunded_units: int
+    refunded_amount: int
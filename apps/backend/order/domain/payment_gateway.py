@@ -0,0 +1,26 @@
+from abc import ABCMeta, abstractmethod
+
+from order.domain.order import GatewayPayment
+
+
+class IPaymentGateway(metaclass=ABCMeta):
+    @abstractmethod
+    async def get_payment(self, payment_id: str) -> GatewayPayment | None:
+        """
+        Look up a payment at the payment provider. Returns None if it does not exist.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def cancel_payment(self, payment_id: str, amount: int, reason: str | None) -> bool:
+        """
+        Cancel (refund) a payment. Returns True if the cancellation succeeded.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def aclose(self):
+        """
+        Release pooled connections.
+        """
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+from datetime import date
+from typing import List
+from abc import ABCMeta, abstractmethod
+
+from order.domain.order import SalesDaily, SalesHourly, ProductSales
+
+
+class IAnalyticsRepository(metaclass=ABCMeta):
+    @abstractmethod
+    def get_sales_daily(self, date_from: date, date_to: date) -> List[SalesDaily]:
+        """
+        Get the daily sales rollup rows between two dates (inclusive).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_sales_hourly(self, date_from: date, date_to: date) -> List[SalesHourly]:
+        """
+        Get the hourly sales rollup rows between two dates (inclusive).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_product_sales(self, date_from: date, date_to: date, limit: int) -> List[ProductSales]:
+        """
+        Get per-product sales between two dates (inclusive), ordered by revenue.
+        """
+        raise NotImplementedError
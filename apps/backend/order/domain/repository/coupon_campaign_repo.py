@@ -0,0 +1,51 @@
+from typing import Callable
+from abc import ABCMeta, abstractmethod
+
+from order.domain.order import CouponCampaign
+
+
+class ICouponCampaignRepository(metaclass=ABCMeta):
+    @abstractmethod
+    def save_campaign(self, campaign: CouponCampaign):
+        """
+        Save a new coupon campaign.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_campaign_by_id(self, campaign_id: str) -> CouponCampaign:
+        """
+        Find a coupon campaign by its ID.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_campaign(self, owner: str, lease_seconds: int) -> CouponCampaign | None:
+        """
+        Take the lease on the oldest pending (or lease-expired) campaign with SKIP LOCKED.
+        Counts the target users the first time a campaign is claimed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def issue_campaign_chunk(
+        self,
+        campaign_id: str,
+        owner: str,
+        chunk_size: int,
+        lease_seconds: int,
+        make_id: Callable[[], str],
+    ) -> CouponCampaign | None:
+        """
+        Issue wallets to the next chunk of target users who do not hold the coupon yet,
+        then advance the cursor and renew the lease in the same transaction.
+        Marks the campaign done when no users are left. Returns None if the lease was lost.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail_campaign(self, campaign_id: str, owner: str, error: str, max_attempts: int):
+        """
+        Release the lease for a retry, or mark the campaign failed after max_attempts.
+        """
+        raise NotImplementedError
@@ -0,0 +1,38 @@
+from datetime import datetime
+from abc import ABCMeta, abstractmethod
+
+from order.domain.order import IdempotencyRecord
+
+
+class IIdempotencyRepository(metaclass=ABCMeta):
+    @abstractmethod
+    def reserve(self, record: IdempotencyRecord, stale_before: datetime) -> IdempotencyRecord | None:
+        """
+        Insert a new in-progress key. An expired key, or an in-progress key
+        last updated at or before `stale_before` (its owner crashed or never
+        completed it), is taken over. Returns None if the key was reserved,
+        or the existing record if the key is already taken.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, scope: str, key: str, response: str, now: datetime):
+        """
+        Store the response of a finished request. Does nothing if the key is
+        no longer in progress.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, scope: str, key: str):
+        """
+        Delete an in-progress key so that a failed request can be retried.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        """
+        Delete up to `limit` expired keys. Returns the number of deleted rows.
+        """
+        raise NotImplementedError
@@ -1,7 +1,9 @@
-from typing import List
+from datetime import datetime
+from typing import Callable, Iterator, List
 from abc import ABCMeta, abstractmethod
 
-from order.domain.order import Order, Coupon, CouponWallet, OrderItem, Payment, Refund
+from cartitem.domain.cartitem import CartItemLine
+from order.domain.order import Order, Coupon, CouponWallet, OrderItem, Payment, Refund, PaymentWebhookEvent
 
 
 class IOrderRepository(metaclass=ABCMeta):
@@ -12,6 +14,26 @@ class IOrderRepository(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def save_with_items(self, order: Order, order_items: List[OrderItem]):
+        """
+        Save a new order and all of its items in one transaction.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_order_from_cart(
+        self,
+        user_id: str,
+        cartitem_ids: List[str],
+        build_order: Callable[[List[CartItemLine]], tuple[Order, List[OrderItem]]],
+    ) -> tuple[Order, List[OrderItem]]:
+        """
+        Lock the selected cart lines, build the order from them, insert the order
+        with all items and delete the consumed cart items in one transaction.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(self, id: str) -> Order:
         """
@@ -25,6 +47,13 @@ class IOrderRepository(metaclass=ABCMeta):
         Get a paginated list of orders.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def iter_orders_with_items(self) -> Iterator[tuple[Order, List[OrderItem]]]:
+        """
+        Stream every order with its items through a server-side cursor (for exports).
+        """
+        raise NotImplementedError
     
     @abstractmethod
     def get_orders_by_user(self, user_id: str) -> tuple[int, List[Order]]:
@@ -33,6 +62,13 @@ class IOrderRepository(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_ordered_products(self) -> List[tuple[str, str]]:
+        """
+        Get distinct (user_id, product_id) pairs of completed order items.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, order: Order):
         """
@@ -116,7 +152,32 @@ class IOrderRepository(metaclass=ABCMeta):
         Find a coupon wallet by user ID and coupon ID.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def has_coupon_wallet(self, user_id: str, coupon_id: str) -> bool:
+        """
+        Fast pre-check for whether the user already holds the coupon.
+        A cached implementation may return False for an existing wallet;
+        the unique constraint checked by save_coupon_wallet is the final guard.
+        """
+        raise NotImplementedError
     
+    @abstractmethod
+    def get_usable_coupon_wallets(self, user_id: str, now: datetime) -> List[tuple[CouponWallet, Coupon]]:
+        """
+        Get the user's unused wallets whose coupon is active and valid at `now`,
+        joined to their coupons in one query.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_cart_lines(self, user_id: str, cartitem_ids: List[str]) -> List[CartItemLine]:
+        """
+        Get the user's selected cart lines with current product prices (no locking).
+        Raises 422 if any of the cart items does not exist.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update_coupon_wallet(self, coupon_wallet_id: str) -> CouponWallet:
         """
@@ -152,6 +213,37 @@ class IOrderRepository(metaclass=ABCMeta):
         """
         raise NotImplementedError
     
+    @abstractmethod
+    def save_webhook_event(self, event: PaymentWebhookEvent) -> bool:
+        """
+        Store a verified webhook event in the inbox.
+        Returns False if an event with the same merchant ID was already received.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_webhook_events(self, limit: int, lease_seconds: int) -> List[PaymentWebhookEvent]:
+        """
+        Claim pending (or lease-expired) inbox events with SKIP LOCKED so that
+        concurrent workers never process the same event.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete_webhook_event(self, merchant_id: str, payment: Payment | None) -> bool:
+        """
+        Save the payment if it does not exist yet and mark the event as done, atomically.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail_webhook_event(self, merchant_id: str, locked_until: datetime, error: str, max_attempts: int):
+        """
+        Release a claimed event for retry, or mark it failed after max_attempts.
+        Does nothing if the claim (identified by its locked_until) was lost to another worker.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def find_payment_by_id(self, payment_id: str) -> Payment:
         """
@@ -0,0 +1,21 @@
+from abc import ABCMeta, abstractmethod
+
+from order.domain.order import PointTransaction, PointBalance
+
+
+class IPointRepository(metaclass=ABCMeta):
+    @abstractmethod
+    def save_point_transaction(self, point_transaction: PointTransaction) -> PointTransaction:
+        """
+        Apply the transaction to the user's balance and insert it into the ledger
+        in one transaction. Spends are a conditional UPDATE, so they can never overdraw
+        (400 if the balance is insufficient). Returns the transaction with balance_after set.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_balance(self, user_id: str) -> PointBalance:
+        """
+        Get the user's current balance by primary key. A user without a balance row has 0 points.
+        """
+        raise NotImplementedError
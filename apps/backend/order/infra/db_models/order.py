@@ -1,10 +1,13 @@
-from sqlalchemy import String, Numeric, DateTime, ForeignKey, Text, Enum, Boolean
+from sqlalchemy import String, Numeric, Integer, SmallInteger, Date, DateTime, ForeignKey, Text, Enum, Boolean, Index, UniqueConstraint, JSON
 from sqlalchemy.orm import mapped_column
 from database import Base
 
 
 class Order(Base):
     __tablename__ = "Orders"
+    __table_args__ = (
+        Index("ix_orders_user_id_created_at", "user_id", "created_at"),
+    )
 
     id = mapped_column(String(36), primary_key=True)
     user_id = mapped_column(String(36), nullable=False)
@@ -56,6 +59,9 @@ class Coupon(Base):
 
 class CouponWallet(Base):
     __tablename__ = "CouponWallet"
+    __table_args__ = (
+        UniqueConstraint("user_id", "coupon_id", name="uq_coupon_wallet_user_coupon"),
+    )
 
     id = mapped_column(String(36), primary_key=True)
     user_id = mapped_column(String(36), nullable=False)
@@ -128,6 +134,15 @@ class PointTransaction(Base):
     updated_at = mapped_column(DateTime, nullable=False)
 
 
+# 유저별 현재 포인트 잔액 (PointTransaction 저장과 같은 트랜잭션에서 갱신)
+class PointBalance(Base):
+    __tablename__ = "PointBalance"
+
+    user_id = mapped_column(String(36), primary_key=True)
+    balance = mapped_column(Numeric(10, 0), nullable=False, default=0)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+
 class Refund(Base):
     __tablename__ = "Refund"
 
@@ -142,3 +157,108 @@ class Refund(Base):
     created_at = mapped_column(DateTime, nullable=False)
     updated_at = mapped_column(DateTime, nullable=False)
     memo = mapped_column(Text, nullable=True)
+
+
+class PaymentWebhookInbox(Base):
+    __tablename__ = "PaymentWebhookInbox"
+    __table_args__ = (
+        Index("ix_payment_webhook_inbox_status_received_at", "status", "received_at"),
+    )
+
+    merchant_id = mapped_column(String(128), primary_key=True)  # PortOne payment_id (중복 수신 방지)
+    webhook_type = mapped_column(String(64), nullable=False)
+    payload = mapped_column(Text, nullable=False)                # 검증된 원본 본문
+    is_test = mapped_column(Boolean, nullable=False, default=False)
+
+    status = mapped_column(Enum("대기", "처리중", "완료", "실패", name="status"), default="대기", nullable=False)
+    attempts = mapped_column(Integer, nullable=False, default=0)
+    last_error = mapped_column(Text, nullable=True)
+    locked_until = mapped_column(DateTime, nullable=True)        # 처리중 상태의 임대 만료 시각
+
+    received_at = mapped_column(DateTime, nullable=False)
+    processed_at = mapped_column(DateTime, nullable=True)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+
+# 매출 집계 (결제 성공/환불 시점에 같은 트랜잭션에서 증분 갱신, 날짜/시각은 KST 기준)
+class SalesDaily(Base):
+    __tablename__ = "SalesDaily"
+
+    date = mapped_column(Date, primary_key=True)
+    shard = mapped_column(SmallInteger, primary_key=True, default=0, server_default="0")  # 동시 결제 시 행 잠금 분산
+    order_count = mapped_column(Integer, nullable=False, default=0)
+    revenue = mapped_column(Numeric(14, 0), nullable=False, default=0)
+    refund_count = mapped_column(Integer, nullable=False, default=0)
+    refund_amount = mapped_column(Numeric(14, 0), nullable=False, default=0)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+
+class SalesHourly(Base):
+    __tablename__ = "SalesHourly"
+
+    hour = mapped_column(DateTime, primary_key=True)  # 정시로 절삭한 시각
+    shard = mapped_column(SmallInteger, primary_key=True, default=0, server_default="0")  # 동시 결제 시 행 잠금 분산
+    order_count = mapped_column(Integer, nullable=False, default=0)
+    revenue = mapped_column(Numeric(14, 0), nullable=False, default=0)
+    refund_count = mapped_column(Integer, nullable=False, default=0)
+    refund_amount = mapped_column(Numeric(14, 0), nullable=False, default=0)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+
+class ProductSalesDaily(Base):
+    __tablename__ = "ProductSalesDaily"
+
+    date = mapped_column(Date, primary_key=True)
+    product_id = mapped_column(String(36), primary_key=True)
+    shard = mapped_column(SmallInteger, primary_key=True, default=0, server_default="0")  # 동시 결제 시 행 잠금 분산
+    units = mapped_column(Integer, nullable=False, default=0)
+    revenue = mapped_column(Numeric(14, 0), nullable=False, default=0)
+    refunded_units = mapped_column(Integer, nullable=False, default=0)
+    refunded_amount = mapped_column(Numeric(14, 0), nullable=False, default=0)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "IdempotencyKey"
+    __table_args__ = (
+        Index("ix_idempotency_key_expires_at", "expires_at"),
+    )
+
+    scope = mapped_column(String(32), primary_key=True)         # 엔드포인트 구분 (예: orders.create)
+    key = mapped_column(String(128), primary_key=True)          # Idempotency-Key 헤더 값
+    fingerprint = mapped_column(String(64), nullable=False)     # 요청 본문 SHA-256
+    status = mapped_column(Enum("처리중", "완료", name="status"), default="처리중", nullable=False)
+    response = mapped_column(Text, nullable=True)               # 완료된 응답 본문 (JSON)
+    expires_at = mapped_column(DateTime, nullable=False)
+
+    created_at = mapped_column(DateTime, nullable=False)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+
+# 쿠폰 일괄 지급 작업. last_user_id까지 지급한 상태가 지급과 같은 트랜잭션에서 저장되어 중단 후 이어서 진행 가능
+class CouponCampaign(Base):
+    __tablename__ = "CouponCampaign"
+    __table_args__ = (
+        Index("ix_coupon_campaign_status_created_at", "status", "created_at"),
+    )
+
+    id = mapped_column(String(36), primary_key=True)
+    coupon_id = mapped_column(ForeignKey("Coupon.id"), nullable=False)
+
+    segment = mapped_column(Enum("전체", "지정", "주문", name="segment"), nullable=False)
+    user_ids = mapped_column(JSON, nullable=True)          # 지정: 대상 유저 ID 목록
+    ordered_from = mapped_column(DateTime, nullable=True)  # 주문: 해당 기간에 주문한 유저
+    ordered_to = mapped_column(DateTime, nullable=True)
+
+    status = mapped_column(Enum("대기", "진행중", "완료", "실패", name="status"), default="대기", nullable=False)
+    target_count = mapped_column(Integer, nullable=True)    # 지급 시작 시점에 쿠폰이 없던 대상 유저 수
+    issued_count = mapped_column(Integer, nullable=False, default=0)
+    last_user_id = mapped_column(String(36), nullable=True)
+    attempts = mapped_column(Integer, nullable=False, default=0)  # 연속 실패 횟수
+    last_error = mapped_column(Text, nullable=True)
+    lease_owner = mapped_column(String(36), nullable=True)
+    locked_until = mapped_column(DateTime, nullable=True)
+
+    created_at = mapped_column(DateTime, nullable=False)
+    updated_at = mapped_column(DateTime, nullable=False)
+    finished_at = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,43 @@
+import asyncio
+import threading
+import time
+
+from order.domain.order import GatewayPayment
+from order.domain.payment_gateway import IPaymentGateway
+
+
+class FakePaymentGateway(IPaymentGateway):
+    """
+    외부 호출 없이 메모리에서 동작하는 결제 게이트웨이. (로컬 테스트/벤치마크용)
+    register_payment로 등록한 결제만 조회/취소 가능. latency_seconds로 PG 응답 지연을 흉내낼 수 있음.
+    """
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.payments: dict[str, GatewayPayment] = {}
+        self.cancelled: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register_payment(self, payment: GatewayPayment):
+        with self._lock:
+            self.payments[payment.payment_id] = payment
+
+    async def get_payment(self, payment_id: str) -> GatewayPayment | None:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return self.payments.get(payment_id)
+
+    def cancel_payment(self, payment_id: str, amount: int, reason: str | None) -> bool:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self._cancel(payment_id, amount)
+
+    def _cancel(self, payment_id: str, amount: int) -> bool:
+        with self._lock:
+            payment = self.payments.get(payment_id)
+            if payment is None or payment_id in self.cancelled or amount > payment.amount:
+                return False
+            self.cancelled[payment_id] = amount
+            return True
+
+    async def aclose(self):
+        pass
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import portone_server_sdk as portone
+from portone_server_sdk.errors import PaymentNotFoundError
+from dateutil import parser
+
+from order.domain.order import GatewayPayment
+from order.domain.payment_gateway import IPaymentGateway
+
+
+class PortOnePaymentGateway(IPaymentGateway):
+    """
+    프로세스 전체에서 공유하는 PortOne 클라이언트.
+    SDK는 타임아웃/커넥션 풀 설정을 받지 않으므로, 조회는 timeout_seconds로 끊고
+    동시에 보내는 요청 수를 max_connections로 제한해 SDK 커넥션 풀이 그 이상 커지지 않게 함.
+    """
+    def __init__(self, secret: str, timeout_seconds: float = 10.0, max_connections: int = 20):
+        self.client = portone.PaymentClient(secret=secret)
+        self.timeout_seconds = timeout_seconds
+        self._async_slots = asyncio.Semaphore(max_connections)
+        self._sync_slots = threading.BoundedSemaphore(max_connections)
+
+    async def get_payment(self, payment_id: str) -> GatewayPayment | None:
+        try:
+            async with self._async_slots:
+                response = await asyncio.wait_for(
+                    self.client.get_payment_async(payment_id=payment_id),
+                    timeout=self.timeout_seconds,
+                )
+        except PaymentNotFoundError:
+            return None
+
+        if not response:
+            return None
+
+        return GatewayPayment(
+            payment_id=payment_id,
+            order_id=response.custom_data[1:-1],
+            method=response.method.provider,
+            amount=response.amount.total,
+            paid_at=parser.isoparse(response.paid_at) if getattr(response, "paid_at", None) else None,
+        )
+
+    def cancel_payment(self, payment_id: str, amount: int, reason: str | None) -> bool:
+        # 취소는 결과를 모른 채 끊으면 안 되므로 SDK 기본 타임아웃을 따름
+        with self._sync_slots:
+            response = self.client.cancel_payment(payment_id=payment_id, amount=amount, reason=reason)
+        return isinstance(response.cancellation, portone.payment.SucceededPaymentCancellation)
+
+    async def aclose(self):
+        # SDK가 만든 httpx 클라이언트는 닫는 API가 없어 프로세스와 함께 정리됨
+        pass
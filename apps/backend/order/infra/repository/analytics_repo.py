@@ -0,0 +1,222 @@
+import random
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from order.domain.repository.analytics_repo import IAnalyticsRepository
+from order.domain.order import SalesDaily as SalesDailyVO
+from order.domain.order import SalesHourly as SalesHourlyVO
+from order.domain.order import ProductSales as ProductSalesVO
+from order.infra.db_models.order import OrderItem, SalesDaily, SalesHourly, ProductSalesDaily
+from product.infra.db_models.product import Product
+
+# 집계 기준 시간대 (KST, 일광절약시간 없음)
+REPORT_TZ = timezone(timedelta(hours=9))
+# 같은 버킷의 카운터를 나눠 담는 행 수. 결제마다 임의의 shard 행을 올리므로 동시 결제가 한 행에 몰리지 않음.
+# 조회 시에는 shard를 합산함.
+ROLLUP_SHARDS = 16
+
+
+def _buckets(at: datetime) -> tuple[date, datetime]:
+    """
+    UTC 시각을 KST 기준 일자/시간 버킷으로 변환. tzinfo가 없으면 UTC로 간주.
+    """
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    local = at.astimezone(REPORT_TZ).replace(tzinfo=None)
+    return local.date(), local.replace(minute=0, second=0, microsecond=0)
+
+
+def _increment(db: Session, model, rows: list[dict], counters: tuple[str, ...], now: datetime):
+    """
+    집계 행이 없으면 생성하고, 있으면 카운터를 원자적으로 더함.
+    """
+    if not rows:
+        return
+    statement = mysql_insert(model).values([{**row, "updated_at": now} for row in rows])
+    db.execute(
+        statement.on_duplicate_key_update(
+            updated_at=statement.inserted.updated_at,
+            **{c: getattr(model, c) + getattr(statement.inserted, c) for c in counters},
+        )
+    )
+
+
+def _allocate(amount: int, weights: list[int]) -> list[int]:
+    """
+    amount를 weights 비율로 나눔. 원 단위 절사 후 남은 금액은 나머지가 큰 순서로 1원씩 배분해 합계가 amount와 같음.
+    """
+    total = sum(weights)
+    if total <= 0:
+        return [0] * len(weights)
+    shares = [amount * weight // total for weight in weights]
+    remainders = sorted(range(len(weights)), key=lambda i: -(amount * weights[i] % total))
+    for i in remainders[:amount - sum(shares)]:
+        shares[i] += 1
+    return shares
+
+
+def _product_totals(db: Session, order_id: str, amount: int) -> list[tuple[str, int, int]]:
+    """
+    주문의 상품별 (product_id, 수량, 금액). 금액은 결제/환불 금액을 상품별 final_price 합계 비율로 나눈 값이므로
+    상품별 합계가 일별 매출/환불 금액과 항상 일치함.
+    """
+    rows = (
+        db.query(
+            OrderItem.product_id,
+            func.sum(OrderItem.quantity),
+            func.sum(OrderItem.final_price),
+        )
+        .filter(OrderItem.order_id == order_id)
+        .group_by(OrderItem.product_id)
+        .order_by(OrderItem.product_id)
+        .all()
+    )
+    shares = _allocate(amount, [int(total) for _, _, total in rows])
+    return [(product_id, int(units), share) for (product_id, units, _), share in zip(rows, shares)]
+
+
+def record_sale(db: Session, order_id: str, amount: int, at: datetime, now: datetime):
+    """
+    결제 성공을 저장하는 트랜잭션 안에서 호출. 일/시간/상품별 매출을 증가시킴.
+    """
+    day, hour = _buckets(at)
+    shard = random.randrange(ROLLUP_SHARDS)
+    sales = {"order_count": 1, "revenue": amount, "refund_count": 0, "refund_amount": 0}
+    counters = tuple(sales)
+
+    _increment(db, SalesDaily, [{"date": day, "shard": shard, **sales}], counters, now)
+    _increment(db, SalesHourly, [{"hour": hour, "shard": shard, **sales}], counters, now)
+    _increment(
+        db,
+        ProductSalesDaily,
+        [
+            {
+                "date": day,
+                "product_id": product_id,
+                "shard": shard,
+                "units": units,
+                "revenue": revenue,
+                "refunded_units": 0,
+                "refunded_amount": 0,
+            }
+            for product_id, units, revenue in _product_totals(db, order_id, amount)
+        ],
+        ("units", "revenue", "refunded_units", "refunded_amount"),
+        now,
+    )
+
+
+def record_refund(db: Session, order_id: str, amount: int, at: datetime, now: datetime):
+    """
+    환불을 저장하는 트랜잭션 안에서 호출. 환불 시점의 버킷에 환불 건수/금액을 증가시킴.
+    환불은 주문 전체 취소이므로 모든 상품 수량을 환불 수량으로, 환불 금액은 상품별로 나눠 기록함.
+    """
+    day, hour = _buckets(at)
+    shard = random.randrange(ROLLUP_SHARDS)
+    refunds = {"order_count": 0, "revenue": 0, "refund_count": 1, "refund_amount": amount}
+    counters = tuple(refunds)
+
+    _increment(db, SalesDaily, [{"date": day, "shard": shard, **refunds}], counters, now)
+    _increment(db, SalesHourly, [{"hour": hour, "shard": shard, **refunds}], counters, now)
+    _increment(
+        db,
+        ProductSalesDaily,
+        [
+            {
+                "date": day,
+                "product_id": product_id,
+                "shard": shard,
+                "units": 0,
+                "revenue": 0,
+                "refunded_units": units,
+                "refunded_amount": refunded_amount,
+            }
+            for product_id, units, refunded_amount in _product_totals(db, order_id, amount)
+        ],
+        ("units", "revenue", "refunded_units", "refunded_amount"),
+        now,
+    )
+
+
+def _sales_columns(model) -> list:
+    return [
+        func.sum(model.order_count).label("order_count"),
+        func.sum(model.revenue).label("revenue"),
+        func.sum(model.refund_count).label("refund_count"),
+        func.sum(model.refund_amount).label("refund_amount"),
+    ]
+
+
+def _to_sales(row) -> dict:
+    return {
+        "order_count": int(row.order_count),
+        "revenue": int(row.revenue),
+        "refund_count": int(row.refund_count),
+        "refund_amount": int(row.refund_amount),
+    }
+
+
+class AnalyticsRepository(IAnalyticsRepository):
+    def get_sales_daily(self, date_from: date, date_to: date) -> List[SalesDailyVO]:
+        with SessionLocal() as db:
+            rows = (
+                db.query(SalesDaily.date, *_sales_columns(SalesDaily))
+                .filter(SalesDaily.date >= date_from, SalesDaily.date <= date_to)
+                .group_by(SalesDaily.date)
+                .order_by(SalesDaily.date)
+                .all()
+            )
+
+        return [SalesDailyVO(date=row.date, **_to_sales(row)) for row in rows]
+
+    def get_sales_hourly(self, date_from: date, date_to: date) -> List[SalesHourlyVO]:
+        start = datetime.combine(date_from, time.min)
+        end = datetime.combine(date_to + timedelta(days=1), time.min)
+
+        with SessionLocal() as db:
+            rows = (
+                db.query(SalesHourly.hour, *_sales_columns(SalesHourly))
+                .filter(SalesHourly.hour >= start, SalesHourly.hour < end)
+                .group_by(SalesHourly.hour)
+                .order_by(SalesHourly.hour)
+                .all()
+            )
+
+        return [SalesHourlyVO(hour=row.hour, **_to_sales(row)) for row in rows]
+
+    def get_product_sales(self, date_from: date, date_to: date, limit: int) -> List[ProductSalesVO]:
+        revenue = func.sum(ProductSalesDaily.revenue).label("revenue")
+
+        with SessionLocal() as db:
+            rows = (
+                db.query(
+                    ProductSalesDaily.product_id,
+                    Product.name.label("product_name"),
+                    func.sum(ProductSalesDaily.units).label("units"),
+                    revenue,
+                    func.sum(ProductSalesDaily.refunded_units).label("refunded_units"),
+                    func.sum(ProductSalesDaily.refunded_amount).label("refunded_amount"),
+                )
+                .outerjoin(Product, Product.id == ProductSalesDaily.product_id)
+                .filter(ProductSalesDaily.date >= date_from, ProductSalesDaily.date <= date_to)
+                .group_by(ProductSalesDaily.product_id, Product.name)
+                .order_by(revenue.desc(), ProductSalesDaily.product_id)
+                .limit(limit)
+                .all()
+            )
+
+        return [
+            ProductSalesVO(
+                product_id=row.product_id,
+                product_name=row.product_name,
+                units=int(row.units),
+                revenue=int(row.revenue),
+                refunded_units=int(row.refunded_units),
+                refunded_amount=int(row.refunded_amount),
+            )
+            for row in rows
+        ]
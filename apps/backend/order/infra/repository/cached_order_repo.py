@@ -0,0 +1,73 @@
+from copy import deepcopy
+from datetime import datetime, timezone
+from fastapi import HTTPException
+
+from common.cache import TTLCache, MISSING
+from order.infra.repository.order_repo import OrderRepository, COUPON_ALREADY_IN_WALLET
+from order.domain.order import Coupon as CouponVO
+from order.domain.order import CouponWallet as CouponWalletVO
+
+
+class CachedOrderRepository(OrderRepository):
+    """
+    쿠폰 코드 등록 경로를 워커 메모리에서 처리하는 OrderRepository.
+    - coupon_cache: 코드 -> 쿠폰. valid_until에 만료되며 쿠폰 생성/수정 시 전체를 비움.
+    - claim_cache: 이미 등록한 (user_id, coupon_id) 집합. 크기 제한(LRU)이 있고,
+      없다고 나와도 CouponWallet의 unique 제약이 최종적으로 중복 등록을 막음.
+      있다고 나오면 DB로 한 번 더 확인하므로 다른 워커에서 쿠폰이 회수돼도 재등록이 막히지 않음.
+    다른 워커의 coupon_cache는 TTL이 지나야 갱신됨.
+    """
+    def __init__(self, coupon_cache: TTLCache, claim_cache: TTLCache):
+        self.coupon_cache = coupon_cache
+        self.claim_cache = claim_cache
+
+    def find_coupon_by_code(self, coupon_code: str) -> CouponVO:
+        coupon = self.coupon_cache.get(coupon_code)
+        if coupon is MISSING:
+            generation = self.coupon_cache.generation
+            coupon = super().find_coupon_by_code(coupon_code)
+
+            remaining = (coupon.valid_until.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).total_seconds()
+            ttl_seconds = min(self.coupon_cache.ttl_seconds, remaining)
+            if ttl_seconds > 0:
+                self.coupon_cache.set(coupon_code, coupon, generation=generation, ttl_seconds=ttl_seconds)
+        return deepcopy(coupon)
+
+    def save_coupon(self, coupon: CouponVO):
+        try:
+            return super().save_coupon(coupon)
+        finally:
+            self.coupon_cache.clear()
+
+    def update_coupon(self, coupon: CouponVO):
+        try:
+            return super().update_coupon(coupon)
+        finally:
+            self.coupon_cache.clear()
+
+    def has_coupon_wallet(self, user_id: str, coupon_id: str) -> bool:
+        # 등록되지 않은 경우는 DB 조회 없이 저장을 시도하고 unique 제약에 맡김
+        key = (user_id, coupon_id)
+        if key not in self.claim_cache:
+            return False
+        if super().has_coupon_wallet(user_id, coupon_id):
+            return True
+        self.claim_cache.delete(key)
+        return False
+
+    def save_coupon_wallet(self, coupon_wallet: CouponWalletVO):
+        key = (coupon_wallet.user_id, coupon_wallet.coupon_id)
+        try:
+            super().save_coupon_wallet(coupon_wallet)
+        except HTTPException as e:
+            if e.detail == COUPON_ALREADY_IN_WALLET:
+                self.claim_cache.set(key, True)
+            raise
+        self.claim_cache.set(key, True)
+
+    def delete_coupon_wallet(self, coupon_wallet_id: str):
+        coupon_wallet = self.find_coupon_wallet_by_id(coupon_wallet_id)
+        try:
+            return super().delete_coupon_wallet(coupon_wallet_id)
+        finally:
+            self.claim_cache.delete((coupon_wallet.user_id, coupon_wallet.coupon_id))
@@ -0,0 +1,187 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, exists, func, insert, select
+
+from database import SessionLocal
+from utils.db_utils import row_to_dict
+from order.domain.repository.coupon_campaign_repo import ICouponCampaignRepository
+from order.domain.order import CouponCampaign as CouponCampaignVO
+from order.infra.db_models.order import CouponCampaign, CouponWallet, Order
+from user.infra.db_models.user import User
+
+
+def _target_users(campaign: CouponCampaign):
+    """
+    캠페인 대상 유저 ID 쿼리. 유저 PK 순으로 훑으므로 last_user_id를 커서로 사용할 수 있음.
+    """
+    statement = select(User.id)
+    if campaign.segment == "지정":
+        statement = statement.where(User.id.in_(campaign.user_ids or []))
+    elif campaign.segment == "주문":
+        statement = statement.where(
+            exists().where(
+                Order.user_id == User.id,
+                Order.created_at >= campaign.ordered_from,
+                Order.created_at < campaign.ordered_to,
+            )
+        )
+    return statement
+
+
+def _unissued_users(campaign: CouponCampaign):
+    """
+    대상 유저 중 아직 이 쿠폰이 없는 유저 ID 쿼리 (anti-join).
+    """
+    return (
+        _target_users(campaign)
+        .outerjoin(
+            CouponWallet,
+            and_(CouponWallet.user_id == User.id, CouponWallet.coupon_id == campaign.coupon_id),
+        )
+        .where(CouponWallet.id.is_(None))
+    )
+
+
+class CouponCampaignRepository(ICouponCampaignRepository):
+    def save_campaign(self, campaign: CouponCampaignVO):
+        with SessionLocal() as db:
+            try:
+                db.add(CouponCampaign(**asdict(campaign)))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise HTTPException(status_code=500, detail="An error occurred while saving the coupon campaign")
+
+    def find_campaign_by_id(self, campaign_id: str) -> CouponCampaignVO:
+        with SessionLocal() as db:
+            campaign = db.get(CouponCampaign, campaign_id)
+            if not campaign:
+                raise HTTPException(status_code=404, detail="CouponCampaign not found")
+            return CouponCampaignVO(**row_to_dict(campaign))
+
+    def claim_campaign(self, owner: str, lease_seconds: int) -> CouponCampaignVO | None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with SessionLocal() as db:
+            campaign = (
+                db.query(CouponCampaign)
+                .filter(
+                    or_(
+                        CouponCampaign.status == "대기",
+                        and_(CouponCampaign.status == "진행중", CouponCampaign.locked_until < now),
+                    )
+                )
+                .order_by(CouponCampaign.created_at.asc())
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if not campaign:
+                db.commit()
+                return None
+
+            if campaign.target_count is None:
+                # 이미 쿠폰을 가진 유저는 지급 대상이 아니므로 제외해야 issued_count와 비교할 수 있음
+                target = _unissued_users(campaign).subquery()
+                campaign.target_count = db.execute(select(func.count()).select_from(target)).scalar()
+            campaign.status = "진행중"
+            campaign.lease_owner = owner
+            campaign.locked_until = now + timedelta(seconds=lease_seconds)
+            campaign.updated_at = now
+            db.commit()
+
+            return CouponCampaignVO(**row_to_dict(campaign))
+
+    def issue_campaign_chunk(
+        self,
+        campaign_id: str,
+        owner: str,
+        chunk_size: int,
+        lease_seconds: int,
+        make_id: Callable[[], str],
+    ) -> CouponCampaignVO | None:
+        """
+        대상 유저 중 쿠폰이 없는 유저를 _unissued_users로 골라 다중 행 INSERT IGNORE로 지급.
+        커서(last_user_id)와 지급 수는 지급과 같은 트랜잭션에서 커밋되므로 중단되어도 중복 없이 이어서 진행됨.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with SessionLocal() as db:
+            try:
+                campaign = (
+                    db.query(CouponCampaign)
+                    .filter(
+                        CouponCampaign.id == campaign_id,
+                        CouponCampaign.status == "진행중",
+                        CouponCampaign.lease_owner == owner,
+                    )
+                    .with_for_update()
+                    .first()
+                )
+                if not campaign:
+                    db.rollback()
+                    return None
+
+                statement = _unissued_users(campaign).order_by(User.id).limit(chunk_size)
+                if campaign.last_user_id is not None:
+                    statement = statement.where(User.id > campaign.last_user_id)
+                user_ids = db.execute(statement).scalars().all()
+
+                if user_ids:
+                    result = db.execute(
+                        insert(CouponWallet)
+                        .prefix_with("IGNORE")  # 동시에 개별 등록된 지갑은 unique 제약으로 건너뜀
+                        .values([
+                            {
+                                "id": make_id(),
+                                "user_id": user_id,
+                                "coupon_id": campaign.coupon_id,
+                                "is_used": False,
+                                "used_at": None,
+                                "created_at": now,
+                                "updated_at": now,
+                            }
+                            for user_id in user_ids
+                        ])
+                    )
+                    campaign.issued_count += result.rowcount
+                    campaign.last_user_id = user_ids[-1]
+                    campaign.locked_until = now + timedelta(seconds=lease_seconds)
+                else:
+                    campaign.status = "완료"
+                    campaign.lease_owner = None
+                    campaign.locked_until = None
+                    campaign.finished_at = now
+
+                campaign.attempts = 0
+                campaign.updated_at = now
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+            return CouponCampaignVO(**row_to_dict(campaign))
+
+    def fail_campaign(self, campaign_id: str, owner: str, error: str, max_attempts: int):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with SessionLocal() as db:
+            campaign = (
+                db.query(CouponCampaign)
+                .filter(CouponCampaign.id == campaign_id, CouponCampaign.lease_owner == owner)
+                .with_for_update()
+                .first()
+            )
+            if not campaign:
+                db.rollback()
+                return
+
+            campaign.attempts += 1
+            campaign.last_error = error
+            campaign.lease_owner = None
+            campaign.locked_until = now  # 다음 폴링에서 다시 가져감
+            if campaign.attempts >= max_attempts:
+                campaign.status = "실패"
+                campaign.locked_until = None
+                campaign.finished_at = now
+            campaign.updated_at = now
+            db.commit()
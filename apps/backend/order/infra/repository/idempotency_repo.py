@@ -0,0 +1,82 @@
+from dataclasses import asdict
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+import MySQLdb
+
+from database import SessionLocal
+from utils.db_utils import row_to_dict
+from order.domain.repository.idempotency_repo import IIdempotencyRepository
+from order.domain.order import IdempotencyRecord as IdempotencyRecordVO
+from order.infra.db_models.order import IdempotencyKey
+
+
+class IdempotencyRepository(IIdempotencyRepository):
+    def reserve(self, record: IdempotencyRecordVO, stale_before: datetime) -> IdempotencyRecordVO | None:
+        """
+        만료된 키나 리스가 끝난 처리중 키를 지우고 새 키를 삽입. PK 중복이면 기존 기록을 반환.
+        """
+        with SessionLocal() as db:
+            try:
+                db.execute(
+                    delete(IdempotencyKey).where(
+                        IdempotencyKey.scope == record.scope,
+                        IdempotencyKey.key == record.key,
+                        or_(
+                            IdempotencyKey.expires_at <= record.created_at,
+                            and_(IdempotencyKey.status == "처리중", IdempotencyKey.updated_at <= stale_before),
+                        ),
+                    )
+                )
+                db.add(IdempotencyKey(**asdict(record)))
+                db.commit()
+                return None
+            except IntegrityError as e:
+                db.rollback()
+                if not (isinstance(e.orig, MySQLdb.IntegrityError) and e.orig.args[0] == 1062):
+                    raise
+
+            existing = db.query(IdempotencyKey).filter(
+                IdempotencyKey.scope == record.scope,
+                IdempotencyKey.key == record.key,
+            ).first()
+            if not existing:
+                # 다른 요청이 실패해 키를 방금 해제한 경우
+                raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is in progress.")
+
+            return IdempotencyRecordVO(**row_to_dict(existing))
+
+    def complete(self, scope: str, key: str, response: str, now: datetime):
+        with SessionLocal() as db:
+            db.execute(
+                update(IdempotencyKey)
+                .where(
+                    IdempotencyKey.scope == scope,
+                    IdempotencyKey.key == key,
+                    IdempotencyKey.status == "처리중",
+                )
+                .values(status="완료", response=response, updated_at=now)
+            )
+            db.commit()
+
+    def release(self, scope: str, key: str):
+        with SessionLocal() as db:
+            db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.scope == scope,
+                    IdempotencyKey.key == key,
+                    IdempotencyKey.status == "처리중",
+                )
+            )
+            db.commit()
+
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        with SessionLocal() as db:
+            result = db.execute(
+                delete(IdempotencyKey)
+                .where(IdempotencyKey.expires_at <= now)
+                .with_dialect_options(mysql_limit=limit)
+            )
+            db.commit()
+            return result.rowcount
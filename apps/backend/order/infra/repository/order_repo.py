@@ -1,9 +1,17 @@
-from typing import List
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List
 from fastapi import HTTPException
+from sqlalchemy import and_, or_, delete, insert, update, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 from database import SessionLocal
 from utils.db_utils import row_to_dict
+from common.export import stream_rows
+from cartitem.domain.cartitem import CartItemLine
+from cartitem.infra.db_models.cartitem import CartItem
+from cartitem.infra.repository.cartitem_repo import cart_lines_query, to_cart_line
 from order.domain.repository.order_repo import IOrderRepository
 from order.domain.order import Order as OrderVO
 from order.domain.order import Coupon as CouponVO
@@ -11,7 +19,12 @@ from order.domain.order import CouponWallet as CouponWalletVO
 from order.domain.order import OrderItem as OrderItemVO
 from order.domain.order import Payment as PaymentVO
 from order.domain.order import Refund as RefundVO
-from order.infra.db_models.order import Order, Coupon, CouponWallet, OrderItem, Payment, Refund
+from order.domain.order import PaymentWebhookEvent as PaymentWebhookEventVO
+from order.infra.db_models.order import Order, Coupon, CouponWallet, OrderItem, Payment, Refund, PaymentWebhookInbox
+from order.infra.repository.analytics_repo import record_sale, record_refund
+import MySQLdb
+
+COUPON_ALREADY_IN_WALLET = "Coupon already in wallet"
 
 
 class OrderRepository(IOrderRepository):
@@ -37,6 +50,61 @@ class OrderRepository(IOrderRepository):
             db.add(new_order)
             db.commit()
 
+    def _add_order_with_items(self, db: Session, order: OrderVO, order_items: List[OrderItemVO]):
+        db.add(Order(**asdict(order)))
+        db.flush()
+        if order_items:
+            db.execute(insert(OrderItem), [asdict(order_item) for order_item in order_items])
+
+    def save_with_items(self, order: OrderVO, order_items: List[OrderItemVO]):
+        with SessionLocal() as db:
+            try:
+                self._add_order_with_items(db, order, order_items)
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                if "foreign key constraint fails" in str(e.orig):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Invalid foreign key: coupon_wallet_id does not exist"
+                    )
+                raise HTTPException(
+                    status_code=500,
+                    detail="An error occurred while saving the order"
+                )
+
+    def create_order_from_cart(
+        self,
+        user_id: str,
+        cartitem_ids: List[str],
+        build_order: Callable[[List[CartItemLine]], tuple[OrderVO, List[OrderItemVO]]],
+    ) -> tuple[OrderVO, List[OrderItemVO]]:
+        cartitem_ids = list(set(cartitem_ids))
+
+        with SessionLocal() as db:
+            try:
+                rows = (
+                    cart_lines_query(db, user_id)
+                    .filter(CartItem.id.in_(cartitem_ids))
+                    .with_for_update(of=CartItem)
+                    .all()
+                )
+                if len(rows) != len(cartitem_ids):
+                    raise HTTPException(status_code=422, detail="CartItem Does Not Exist.")
+
+                order, order_items = build_order([to_cart_line(row) for row in rows])
+                self._add_order_with_items(db, order, order_items)
+                db.execute(delete(CartItem).where(CartItem.id.in_(cartitem_ids)))
+                db.commit()
+            except HTTPException:
+                db.rollback()
+                raise
+            except Exception:
+                db.rollback()
+                raise HTTPException(status_code=500, detail="An error occurred while creating the order")
+
+        return order, order_items
+
     def find_by_id(self, id: str) -> OrderVO:
         with SessionLocal() as db:
             order = db.query(Order).filter(Order.id == id).first()
@@ -51,6 +119,32 @@ class OrderRepository(IOrderRepository):
             offset = (page - 1) * items_per_page
             orders = query.limit(items_per_page).offset(offset).all()
             return total_count, [OrderVO(**row_to_dict(order)) for order in orders]
+
+    def iter_orders_with_items(self) -> Iterator[tuple[OrderVO, List[OrderItemVO]]]:
+        """
+        주문과 주문 상품을 LEFT JOIN 한 번으로 스트리밍하고, 연속된 행을 주문 단위로 묶어 반환.
+        """
+        order_columns = Order.__table__.columns
+        item_columns = OrderItem.__table__.columns
+        statement = (
+            select(*order_columns, *[c.label(f"item_{c.name}") for c in item_columns])
+            .outerjoin(OrderItem, OrderItem.order_id == Order.id)
+            .order_by(Order.created_at, Order.id, OrderItem.id)
+        )
+
+        with SessionLocal() as db:
+            order, items = None, []
+            for row in stream_rows(db, statement):
+                values = row._mapping
+                if order is None or order.id != values["id"]:
+                    if order is not None:
+                        yield order, items
+                    order = OrderVO(**{c.name: values[c.name] for c in order_columns})
+                    items = []
+                if values["item_id"] is not None:
+                    items.append(OrderItemVO(**{c.name: values[f"item_{c.name}"] for c in item_columns}))
+            if order is not None:
+                yield order, items
     
     def get_orders_by_user(self, user_id: str) -> tuple[int, List[OrderVO]]:
         with SessionLocal() as db:
@@ -59,6 +153,17 @@ class OrderRepository(IOrderRepository):
             orders = query.all()
             return total_count, [OrderVO(**row_to_dict(order)) for order in orders]
 
+    def get_ordered_products(self) -> List[tuple[str, str]]:
+        with SessionLocal() as db:
+            ordered = (
+                db.query(Order.user_id, OrderItem.product_id)
+                .join(Order, Order.id == OrderItem.order_id)
+                .filter(OrderItem.status == "주문완료")
+                .distinct()
+                .all()
+            )
+        return [(user_id, product_id) for user_id, product_id in ordered]
+
     def update(self, order_vo: OrderVO):
         with SessionLocal() as db:
             order = db.query(Order).filter(Order.id == order_vo.id).first()
@@ -191,6 +296,8 @@ class OrderRepository(IOrderRepository):
                 db.commit()
             except IntegrityError as e:
                 db.rollback()
+                if isinstance(e.orig, MySQLdb.IntegrityError) and e.orig.args[0] == 1062:
+                    raise HTTPException(status_code=400, detail=COUPON_ALREADY_IN_WALLET)
                 if "foreign key constraint fails" in str(e.orig):
                     raise HTTPException(
                         status_code=400,
@@ -217,6 +324,13 @@ class OrderRepository(IOrderRepository):
             if not coupon_wallet:
                 return None
             return CouponWalletVO(**row_to_dict(coupon_wallet))
+
+    def has_coupon_wallet(self, user_id: str, coupon_id: str) -> bool:
+        with SessionLocal() as db:
+            return db.query(CouponWallet.id).filter(
+                CouponWallet.user_id == user_id,
+                CouponWallet.coupon_id == coupon_id
+            ).first() is not None
         
     def update_coupon_wallet(self, coupon_wallet: CouponWalletVO):
         with SessionLocal() as db:
@@ -245,6 +359,34 @@ class OrderRepository(IOrderRepository):
             coupon_wallets = query.limit(items_per_page).offset(offset).all()
             return total_count, [CouponWalletVO(**row_to_dict(cw)) for cw in coupon_wallets]
 
+    def get_usable_coupon_wallets(self, user_id: str, now: datetime) -> List[tuple[CouponWalletVO, CouponVO]]:
+        now = now.astimezone(timezone.utc).replace(tzinfo=None) if now.tzinfo else now
+        with SessionLocal() as db:
+            rows = (
+                db.query(CouponWallet, Coupon)
+                .join(Coupon, Coupon.id == CouponWallet.coupon_id)
+                .filter(
+                    CouponWallet.user_id == user_id,
+                    CouponWallet.is_used == False,
+                    Coupon.is_active == True,
+                    Coupon.valid_from <= now,
+                    Coupon.valid_until >= now,
+                )
+                .all()
+            )
+            return [
+                (CouponWalletVO(**row_to_dict(coupon_wallet)), CouponVO(**row_to_dict(coupon)))
+                for coupon_wallet, coupon in rows
+            ]
+
+    def find_cart_lines(self, user_id: str, cartitem_ids: List[str]) -> List[CartItemLine]:
+        cartitem_ids = list(set(cartitem_ids))
+        with SessionLocal() as db:
+            rows = cart_lines_query(db, user_id).filter(CartItem.id.in_(cartitem_ids)).all()
+            if len(rows) != len(cartitem_ids):
+                raise HTTPException(status_code=422, detail="CartItem Does Not Exist.")
+            return [to_cart_line(row) for row in rows]
+
     def get_coupon_wallets_by_user(self, user_id: str) -> tuple[int, List[CouponWalletVO]]:
         with SessionLocal() as db:
             query = db.query(CouponWallet).filter(
@@ -270,11 +412,105 @@ class OrderRepository(IOrderRepository):
         with SessionLocal() as db:
             try:
                 db.add(new_payment)
+                if payment.status == "성공":
+                    record_sale(db, payment.order_id, payment.amount, payment.paid_at or payment.created_at, payment.updated_at)
                 db.commit()
             except Exception as e:
                 db.rollback()
                 raise e
     
+    def save_webhook_event(self, event: PaymentWebhookEventVO) -> bool:
+        with SessionLocal() as db:
+            try:
+                db.add(PaymentWebhookInbox(**asdict(event)))
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                if isinstance(e.orig, MySQLdb.IntegrityError) and e.orig.args[0] == 1062:
+                    return False  # 이미 수신한 이벤트 (재전송)
+                raise HTTPException(status_code=500, detail="Failed to save webhook event")
+        return True
+
+    def claim_webhook_events(self, limit: int, lease_seconds: int) -> List[PaymentWebhookEventVO]:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with SessionLocal() as db:
+            events = (
+                db.query(PaymentWebhookInbox)
+                .filter(
+                    or_(
+                        PaymentWebhookInbox.status == "대기",
+                        and_(PaymentWebhookInbox.status == "처리중", PaymentWebhookInbox.locked_until < now),
+                    )
+                )
+                .order_by(PaymentWebhookInbox.received_at.asc())
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for event in events:
+                event.status = "처리중"
+                event.attempts += 1
+                event.locked_until = now + timedelta(seconds=lease_seconds)
+                event.updated_at = now
+            db.commit()
+
+            return [PaymentWebhookEventVO(**row_to_dict(event)) for event in events]
+
+    def complete_webhook_event(self, merchant_id: str, payment: PaymentVO | None) -> bool:
+        """
+        결제 저장과 inbox 완료 처리를 한 트랜잭션에서 수행.
+        같은 결제(merchant_id 또는 order_id)가 이미 있으면 저장하지 않음.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with SessionLocal() as db:
+            try:
+                saved = False
+                if payment:
+                    exists = db.query(Payment.id).filter(
+                        or_(Payment.merchant_id == payment.merchant_id, Payment.order_id == payment.order_id)
+                    ).first()
+                    if not exists:
+                        db.add(Payment(**asdict(payment)))
+                        if payment.status == "성공":
+                            record_sale(db, payment.order_id, payment.amount, payment.paid_at or payment.created_at, now)
+                        saved = True
+                db.execute(
+                    update(PaymentWebhookInbox)
+                    .where(PaymentWebhookInbox.merchant_id == merchant_id)
+                    .values(status="완료", locked_until=None, last_error=None, processed_at=now, updated_at=now)
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        return saved
+
+    def fail_webhook_event(self, merchant_id: str, locked_until: datetime, error: str, max_attempts: int):
+        """
+        가져갈 때의 locked_until이 그대로인 처리중 이벤트만 되돌림.
+        임대가 만료돼 다른 워커가 다시 가져갔거나 이미 완료된 이벤트는 건드리지 않음.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        with SessionLocal() as db:
+            event = (
+                db.query(PaymentWebhookInbox)
+                .filter(
+                    PaymentWebhookInbox.merchant_id == merchant_id,
+                    PaymentWebhookInbox.status == "처리중",
+                    PaymentWebhookInbox.locked_until == locked_until,
+                )
+                .with_for_update()
+                .first()
+            )
+            if not event:
+                db.rollback()
+                return
+            event.status = "실패" if event.attempts >= max_attempts else "대기"
+            event.locked_until = None
+            event.last_error = error
+            event.updated_at = now
+            db.commit()
+
     def find_payment_by_id(self, payment_id: str) -> PaymentVO:
         with SessionLocal() as db:
             payment = db.query(Payment).filter(Payment.id == payment_id).first()
@@ -290,56 +526,53 @@ class OrderRepository(IOrderRepository):
             return PaymentVO(**row_to_dict(payment))
 
     def make_refund(self, order: OrderVO, order_items: OrderItemVO, payment: PaymentVO, refund: RefundVO):
+        now = refund.updated_at
+        coupon_wallet_ids = {item.coupon_wallet_id for item in order_items if item.coupon_wallet_id}
+
+        # 주문 크기와 상관없이 고정된 수의 문장으로 처리하고, 잠금 순서를 항상 같게 유지
         with SessionLocal() as db:
             try:
                 # Update Order status to "주문취소"
-                db_order = db.query(Order).filter(Order.id == order.id).first()
-                if not db_order:
+                result = db.execute(
+                    update(Order)
+                    .where(Order.id == order.id)
+                    .values(status="주문취소", updated_at=now)
+                )
+                if result.rowcount == 0:
                     raise HTTPException(status_code=404, detail="Order not found")
-                db_order.status = "주문취소"
-                db_order.updated_at = order.updated_at
-                db.add(db_order)
-
-                # Update each OrderItem status to "주문취소"
-                for item in order_items:
-                    db_item = db.query(OrderItem).filter(OrderItem.id == item.id).first()
-                    if not db_item:
-                        raise HTTPException(status_code=404, detail=f"OrderItem {item.id} not found")
-                    db_item.status = "주문취소"
-                    db_item.updated_at = item.updated_at
-                    db.add(db_item)
-
-                    # If OrderItem has a coupon_wallet_id, mark the CouponWallet as unused
-                    if item.coupon_wallet_id:
-                        db_coupon_wallet = db.query(CouponWallet).filter(CouponWallet.id == item.coupon_wallet_id).first()
-                        if db_coupon_wallet:
-                            db_coupon_wallet.is_used = False
-                            db_coupon_wallet.used_at = None
-                            db_coupon_wallet.updated_at = item.updated_at
-                            db.add(db_coupon_wallet)
-
-                db_payment = db.query(Payment).filter(Payment.id == payment.id).first()
-                if not db_payment:
+
+                # Update every OrderItem of the order to "주문취소"
+                db.execute(
+                    update(OrderItem)
+                    .where(OrderItem.order_id == order.id)
+                    .values(status="주문취소", updated_at=now)
+                )
+
+                # Mark the CouponWallets used by the order as unused
+                if coupon_wallet_ids:
+                    db.execute(
+                        update(CouponWallet)
+                        .where(CouponWallet.id.in_(coupon_wallet_ids))
+                        .values(is_used=False, used_at=None, updated_at=now)
+                    )
+
+                result = db.execute(
+                    update(Payment)
+                    .where(Payment.id == payment.id)
+                    .values(status="취소", updated_at=now)
+                )
+                if result.rowcount == 0:
                     raise HTTPException(status_code=404, detail="Payment not found")
-                db_payment.status = "취소"
-                db_payment.updated_at = payment.updated_at
-                db.add(db_payment)
 
                 # Create a Refund record
-                new_refund = Refund(
-                    id=refund.id,
-                    order_id=refund.order_id,
-                    payment_id=refund.payment_id,
-                    merchant_id=refund.merchant_id,
-                    status=refund.status,
-                    amount=refund.amount,
-                    restore_point_amount=refund.restore_point_amount,
-                    memo=refund.memo,
-                    created_at=refund.created_at,
-                    updated_at=refund.updated_at,
-                )
-                db.add(new_refund)
+                db.add(Refund(**asdict(refund)))
+
+                # Add the refund to the sales rollups
+                record_refund(db, order.id, refund.amount, refund.created_at, now)
                 db.commit()
+            except HTTPException:
+                db.rollback()
+                raise
             except Exception as e:
                 db.rollback()
-                raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+                raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,63 @@
+from dataclasses import asdict, replace
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from database import SessionLocal
+from order.domain.repository.point_repo import IPointRepository
+from order.domain.order import PointTransaction as PointTransactionVO
+from order.domain.order import PointBalance as PointBalanceVO
+from order.infra.db_models.order import PointTransaction, PointBalance
+
+
+class PointRepository(IPointRepository):
+    def save_point_transaction(self, point_transaction: PointTransactionVO) -> PointTransactionVO:
+        """
+        사용(차감)은 잔액이 충분할 때만 갱신되는 조건부 UPDATE로, 적립/취소(복원)는 upsert로 잔액을 변경.
+        변경된 잔액 행은 커밋 전까지 잠겨 있으므로 balance_after를 그대로 읽어 원장에 기록함.
+        """
+        user_id = point_transaction.user_id
+        amount = point_transaction.amount
+        now = point_transaction.updated_at
+
+        with SessionLocal() as db:
+            try:
+                if point_transaction.type == "사용":
+                    result = db.execute(
+                        update(PointBalance)
+                        .where(PointBalance.user_id == user_id, PointBalance.balance >= amount)
+                        .values(balance=PointBalance.balance - amount, updated_at=now)
+                    )
+                    if result.rowcount == 0:
+                        raise HTTPException(status_code=400, detail="Insufficient points.")
+                else:
+                    statement = mysql_insert(PointBalance).values(user_id=user_id, balance=amount, updated_at=now)
+                    db.execute(
+                        statement.on_duplicate_key_update(
+                            balance=PointBalance.balance + statement.inserted.balance,
+                            updated_at=statement.inserted.updated_at,
+                        )
+                    )
+
+                balance = db.query(PointBalance.balance).filter(PointBalance.user_id == user_id).scalar()
+                point_transaction = replace(point_transaction, balance_after=int(balance))
+                db.add(PointTransaction(**asdict(point_transaction)))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        return point_transaction
+
+    def find_balance(self, user_id: str) -> PointBalanceVO:
+        with SessionLocal() as db:
+            point_balance = db.get(PointBalance, user_id)
+
+        if not point_balance:
+            return PointBalanceVO(user_id=user_id, balance=0, updated_at=None)
+
+        return PointBalanceVO(
+            user_id=point_balance.user_id,
+            balance=int(point_balance.balance),
+            updated_at=point_balance.updated_at,
+        )
@@ -0,0 +1,127 @@
+from datetime import date, datetime
+from typing import Annotated, List
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from containers import Container
+from common.auth import CurrentUser, get_admin_user
+from order.application.analytics_service import AnalyticsService
+
+router = APIRouter(prefix="/admin/analytics")
+
+
+class SalesDailyResponse(BaseModel):
+    date: date
+    order_count: int
+    revenue: int
+    refund_count: int
+    refund_amount: int
+    net_revenue: int
+
+
+class SalesHourlyResponse(BaseModel):
+    hour: datetime
+    order_count: int
+    revenue: int
+    refund_count: int
+    refund_amount: int
+    net_revenue: int
+
+
+class SalesTotalResponse(BaseModel):
+    order_count: int
+    revenue: int
+    refund_count: int
+    refund_amount: int
+    net_revenue: int
+
+
+class GetSalesDailyResponse(BaseModel):
+    total: SalesTotalResponse
+    days: List[SalesDailyResponse]
+
+
+class GetSalesHourlyResponse(BaseModel):
+    total: SalesTotalResponse
+    hours: List[SalesHourlyResponse]
+
+
+class ProductSalesResponse(BaseModel):
+    product_id: str
+    product_name: str | None
+    units: int
+    revenue: int
+    refunded_units: int
+    refunded_amount: int
+    net_revenue: int
+
+
+class GetProductSalesResponse(BaseModel):
+    products: List[ProductSalesResponse]
+
+
+def _with_net(row) -> dict:
+    return {**vars(row), "net_revenue": row.revenue - row.refund_amount}
+
+
+def _total(rows) -> dict:
+    total = {
+        "order_count": sum(row.order_count for row in rows),
+        "revenue": sum(row.revenue for row in rows),
+        "refund_count": sum(row.refund_count for row in rows),
+        "refund_amount": sum(row.refund_amount for row in rows),
+    }
+    total["net_revenue"] = total["revenue"] - total["refund_amount"]
+    return total
+
+
+@router.get("/sales/daily", response_model=GetSalesDailyResponse)
+@inject
+def get_sales_daily(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    date_from: date,
+    date_to: date,
+    analytics_service: AnalyticsService = Depends(Provide[Container.analytics_service]),
+):
+    days = analytics_service.get_sales_daily(date_from, date_to)
+
+    return {
+        "total": _total(days),
+        "days": [_with_net(day) for day in days],
+    }
+
+
+@router.get("/sales/hourly", response_model=GetSalesHourlyResponse)
+@inject
+def get_sales_hourly(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    date_from: date,
+    date_to: date,
+    analytics_service: AnalyticsService = Depends(Provide[Container.analytics_service]),
+):
+    hours = analytics_service.get_sales_hourly(date_from, date_to)
+
+    return {
+        "total": _total(hours),
+        "hours": [_with_net(hour) for hour in hours],
+    }
+
+
+@router.get("/products", response_model=GetProductSalesResponse)
+@inject
+def get_product_sales(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    date_from: date,
+    date_to: date,
+    limit: int = Query(20, ge=1, le=100),
+    analytics_service: AnalyticsService = Depends(Provide[Container.analytics_service]),
+):
+    products = analytics_service.get_product_sales(date_from, date_to, limit)
+
+    return {
+        "products": [
+            {**vars(product), "net_revenue": product.revenue - product.refunded_amount}
+            for product in products
+        ],
+    }
@@ -1,11 +1,13 @@
 from datetime import datetime
-from typing import List
+from typing import Annotated, List, Literal
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from containers import Container
+from common.auth import CurrentUser, get_admin_user
 from order.application.order_service import OrderService
+from order.application.coupon_campaign_service import CouponCampaignService
 
 router = APIRouter(prefix="/coupons")
 
@@ -187,4 +189,96 @@ def delete_coupon_wallet(
     coupon_wallet_id: str,
     order_service: OrderService = Depends(Provide[Container.order_service]),
 ):
-    order_service.delete_coupon_wallet(coupon_wallet_id)
\ No newline at end of file
+    order_service.delete_coupon_wallet(coupon_wallet_id)
+
+
+class GetBestCouponsRequest(BaseModel):
+    user_id: str
+    subtotal: int | None = Field(default=None, ge=0, le=999999999)
+    cartitem_ids: List[str] | None = Field(default=None, max_length=100)
+
+
+class CouponDiscountResponse(BaseModel):
+    coupon_wallet_id: str
+    coupon_id: str
+    code: str | None
+    description: str | None
+    discount_type: str
+    discount_rate: int | None
+    discount_amount: int | None
+    min_order_amount: int
+    max_discount_amount: int
+    valid_until: datetime
+    discount: int
+    total_price: int
+
+
+class GetBestCouponsResponse(BaseModel):
+    subtotal: int
+    coupons: List[CouponDiscountResponse]
+
+
+@router.post("/best", response_model=GetBestCouponsResponse)
+@inject
+def get_best_coupons(
+    request: GetBestCouponsRequest,
+    order_service: OrderService = Depends(Provide[Container.order_service]),
+):
+    subtotal, coupons = order_service.get_best_coupons(
+        user_id=request.user_id,
+        subtotal=request.subtotal,
+        cartitem_ids=request.cartitem_ids,
+    )
+    return {"subtotal": subtotal, "coupons": coupons}
+
+class CreateCouponCampaignRequest(BaseModel):
+    coupon_id: str
+    segment: Literal["전체", "지정", "주문"]
+    user_ids: List[str] | None = None
+    ordered_from: datetime | None = None
+    ordered_to: datetime | None = None
+
+
+class CouponCampaignResponse(BaseModel):
+    id: str
+    coupon_id: str
+    segment: str
+    ordered_from: datetime | None
+    ordered_to: datetime | None
+    status: str
+    target_count: int | None
+    issued_count: int
+    last_user_id: str | None
+    attempts: int
+    last_error: str | None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None
+
+
+@router.post("/campaigns", status_code=202, response_model=CouponCampaignResponse)
+@inject
+def create_coupon_campaign(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    request: CreateCouponCampaignRequest,
+    coupon_campaign_service: CouponCampaignService = Depends(Provide[Container.coupon_campaign_service]),
+):
+    campaign = coupon_campaign_service.create_campaign(
+        coupon_id=request.coupon_id,
+        segment=request.segment,
+        user_ids=request.user_ids,
+        ordered_from=request.ordered_from,
+        ordered_to=request.ordered_to,
+    )
+    return campaign
+
+
+@router.get("/campaigns/by_id", response_model=CouponCampaignResponse)
+@inject
+def get_coupon_campaign(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    campaign_id: str,
+    coupon_campaign_service: CouponCampaignService = Depends(Provide[Container.coupon_campaign_service]),
+):
+    campaign = coupon_campaign_service.get_campaign(campaign_id)
+    return campaign
@@ -1,12 +1,15 @@
+from dataclasses import asdict
 from datetime import datetime
 from typing import Annotated, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Request
 from pydantic import BaseModel, Field
 
 from containers import Container
 from common.auth import CurrentUser, get_current_user, get_admin_user
+from common.export import ExportFormat, export_response
 from order.application.order_service import OrderService
+from order.application.idempotency_service import IdempotencyService
 
 router = APIRouter(prefix="/orders")
 
@@ -92,6 +95,17 @@ class CreateOrderRequest(BaseModel):
     items: List[CreateOrderItemRequest]
 
 
+class CreateOrderFromCartRequest(BaseModel):
+    user_id: str
+    cartitem_ids: List[str] = Field(min_length=1, max_length=100)
+    recipient_name: str = Field(min_length=1, max_length=32)
+    phone_number: str = Field(min_length=10, max_length=15)
+    zipcode: str = Field(min_length=5, max_length=10)
+    address_line1: str = Field(min_length=1, max_length=100)
+    address_line2: str | None = Field(default=None, max_length=100)
+    order_memo: str | None = Field(default=None, max_length=100)
+
+
 class CreateRefundRequest(BaseModel):
     order_id: str = Field(min_length=10, max_length=36)
     payment_id: str = Field(min_length=10, max_length=36)
@@ -104,23 +118,48 @@ class CreateRefundRequest(BaseModel):
 @inject
 def create_order(
     request: CreateOrderRequest,
+    idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key", max_length=128)] = None,
     order_service: OrderService = Depends(Provide[Container.order_service]),
+    idempotency_service: IdempotencyService = Depends(Provide[Container.idempotency_service]),
 ):
-    order = order_service.create_order(
+    return idempotency_service.run(
+        "orders.create",
+        idempotency_key,
+        request.model_dump(mode="json"),
+        lambda: order_service.create_order(
+            user_id=request.user_id,
+            subtotal_price=request.subtotal_price,
+            coupon_discount_price=request.coupon_discount_price,
+            point_discount_price=request.point_discount_price,
+            total_price=request.total_price,
+            recipient_name=request.recipient_name,
+            phone_number=request.phone_number,
+            zipcode=request.zipcode,
+            address_line1=request.address_line1,
+            address_line2=request.address_line2,
+            order_memo=request.order_memo,
+            items=request.items,
+        ),
+    )
+
+
+@router.post("/from_cart", response_model=GetOrderResponse)
+@inject
+def create_order_from_cart(
+    request: CreateOrderFromCartRequest,
+    order_service: OrderService = Depends(Provide[Container.order_service]),
+):
+    order, order_items = order_service.create_order_from_cart(
         user_id=request.user_id,
-        subtotal_price=request.subtotal_price,
-        coupon_discount_price=request.coupon_discount_price,
-        point_discount_price=request.point_discount_price,
-        total_price=request.total_price,
+        cartitem_ids=request.cartitem_ids,
         recipient_name=request.recipient_name,
         phone_number=request.phone_number,
         zipcode=request.zipcode,
         address_line1=request.address_line1,
         address_line2=request.address_line2,
         order_memo=request.order_memo,
-        items=request.items,
     )
-    return order
+    return {"order": order, "items": order_items}
 
 
 @router.get("/by_id", response_model=GetOrderResponse)
@@ -154,6 +193,36 @@ def get_orders(
     return {"total_count": total_count, "orders": orders}
 
 
+def _order_export_rows(orders, format: ExportFormat):
+    """
+    NDJSON은 주문 한 줄에 items를 중첩하고, CSV는 주문 상품 한 줄마다 주문 정보를 반복함.
+    """
+    for order, items in orders:
+        if format == "ndjson":
+            yield {**asdict(order), "items": [asdict(item) for item in items]}
+            continue
+        for item in items or [None]:
+            item_values = asdict(item) if item else {}
+            yield {**asdict(order), **{f"item_{k}": v for k, v in item_values.items()}}
+
+
+@router.get("/export")
+@inject
+def export_orders(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    format: ExportFormat = "ndjson",
+    order_service: OrderService = Depends(Provide[Container.order_service]),
+):
+    columns = list(OrderResponse.model_fields)
+    if format == "ndjson":
+        columns.append("items")
+    else:
+        columns += [f"item_{name}" for name in OrderItemResponse.model_fields if name != "order_id"]
+
+    rows = _order_export_rows(order_service.export_orders(), format)
+    return export_response(rows, columns, format, "orders")
+
+
 @router.post("/payment/webhook/test")
 @inject
 async def payment_webhook(
@@ -179,16 +248,22 @@ async def payment_webhook(
 def payment_refund_whole(
     #current_user: Annotated[CurrentUser, Depends(get_current_user)],
     request: CreateRefundRequest,
+    idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key", max_length=128)] = None,
     order_service: OrderService = Depends(Provide[Container.order_service]),
+    idempotency_service: IdempotencyService = Depends(Provide[Container.idempotency_service]),
 ):
-    refund = order_service.refund_payment(
-        order_id=request.order_id,
-        payment_id=request.payment_id,
-        merchant_id=request.merchant_id,
-        amount=request.amount,
-        memo=request.memo,
+    return idempotency_service.run(
+        "orders.refund_whole",
+        idempotency_key,
+        request.model_dump(mode="json"),
+        lambda: order_service.refund_payment(
+            order_id=request.order_id,
+            payment_id=request.payment_id,
+            merchant_id=request.merchant_id,
+            amount=request.amount,
+            memo=request.memo,
+        ),
     )
-    return refund
 
 
 """
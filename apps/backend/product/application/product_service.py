@@ -1,11 +1,16 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import Iterator, List
 from dependency_injector.wiring import inject
 from fastapi import HTTPException, UploadFile
 from ulid import ULID
 
-from product.domain.product import Product, ProductOption, ProductLike, ProductReview, ProductOptionType
+from product.domain.product import Product, ProductOption, ProductLike, ProductReview, ProductOptionType, ProductDetail
+from product.domain.product import make_option_sort_key
 from product.domain.repository.product_repo import IProductRepository
+from product.application.recommendation_engine import RecommendationEngine
+from product.application.search_index import ProductSearchIndex
+
+MAX_BATCH_PRODUCT_IDS = 300
 
 
 class ProductService:
@@ -13,8 +18,12 @@ class ProductService:
     def __init__(
         self,
         product_repo: IProductRepository,
+        recommendation_engine: RecommendationEngine,
+        search_index: ProductSearchIndex,
     ):
         self.product_repo = product_repo
+        self.recommendation_engine = recommendation_engine
+        self.search_index = search_index
         self.ulid = ULID()
 
     def create_product(
@@ -54,6 +63,7 @@ class ProductService:
             updated_at=now,
         )
         new_product = self.product_repo.save(product, image_thumbnail, image_detail)
+        self.search_index.upsert(new_product)
         return new_product
     
     def get_products(self, page: int, items_per_page: int) -> tuple[int, list[Product]]:
@@ -64,13 +74,63 @@ class ProductService:
         products = self.product_repo.get_products_by_id(product_id)
         return products
     
+    def get_products_by_ids(self, product_ids: list[str]) -> tuple[list[Product], list[str]]:
+        """
+        요청한 ID 순서대로 상품을 반환하고, 찾지 못한 ID 목록을 함께 반환.
+        """
+        product_ids = list(dict.fromkeys(product_ids))
+        if len(product_ids) > MAX_BATCH_PRODUCT_IDS:
+            raise HTTPException(status_code=400, detail=f"Can look up to {MAX_BATCH_PRODUCT_IDS} products at once.")
+
+        products = {product.id: product for product in self.product_repo.get_products_by_ids(product_ids)}
+
+        found = [products[product_id] for product_id in product_ids if product_id in products]
+        missing_ids = [product_id for product_id in product_ids if product_id not in products]
+        return found, missing_ids
+    
     def get_products_by_category(self, page: int, items_per_page: int, category_main: str, category_sub) -> tuple[int, list[Product]]:
         products = self.product_repo.get_products_by_category(page, items_per_page, category_main, category_sub)
         return products
     
-    def get_recommended_products(self, user_id: str) -> tuple[int, list[Product]]:
-        total_count, products = self.product_repo.get_products_recommended(user_id)
-        return total_count, products
+    def get_products_by_cursor(
+        self,
+        cursor: str | None,
+        items_per_page: int,
+        category_main: str | None = None,
+        category_sub: str | None = None,
+        with_total: bool = False,
+    ) -> tuple[int | None, list[Product], str | None]:
+        products = self.product_repo.get_products_by_cursor(
+            cursor, items_per_page, category_main, category_sub, with_total
+        )
+        return products
+    
+    def get_product_detail(self, product_id: str, review_limit: int = 10) -> ProductDetail:
+        product_detail = self.product_repo.get_product_detail(product_id, review_limit)
+        return product_detail
+
+    def search_products(
+        self,
+        query: str,
+        category_main: str | None,
+        category_sub: str | None,
+        is_active: bool | None,
+        page: int,
+        items_per_page: int,
+    ) -> tuple[int, list[Product]]:
+        products = self.search_index.search(
+            query,
+            category_main=category_main,
+            category_sub=category_sub,
+            is_active=is_active,
+            offset=(page - 1) * items_per_page,
+            limit=items_per_page,
+        )
+        return products
+
+    def get_recommended_products(self, user_id: str | None, limit: int = 20) -> tuple[int, list[Product]]:
+        products = self.recommendation_engine.recommend(user_id, limit)
+        return len(products), products
 
     def update_product(
         self,
@@ -107,6 +167,7 @@ class ProductService:
         product.updated_at = datetime.now(timezone.utc)
 
         self.product_repo.update(product, image_thumbnail, image_detail)
+        self.search_index.upsert(product)
 
         return product
     
@@ -119,11 +180,13 @@ class ProductService:
         product.updated_at = datetime.now(timezone.utc)
 
         product = self.product_repo.update(product, None, None)
+        self.search_index.upsert(product)
 
         return product
 
     def delete_product(self, product_id: str):
         self.product_repo.delete(product_id)
+        self.search_index.remove(product_id)
 
     def create_product_option_type(self, product_id: str, option_type: str) -> ProductOptionType:
         now = datetime.now(timezone.utc)
@@ -160,10 +223,40 @@ class ProductService:
         product_option_type_id: str,
         options: List[str],
     ) -> tuple[int, list[ProductOption]]:
+        option_list = self._make_options(product_id, product_option_type_id, options)
+        self.product_repo.save_options_bulk(option_list)
+
+        return len(option_list), option_list
+
+    def create_product_options_bulk(
+        self,
+        items: List[tuple[str, str, List[str]]],
+    ) -> tuple[list[ProductOptionType], list[ProductOption]]:
+        """
+        (product_id, option_type, options) 목록으로 옵션 타입과 옵션을 한 번에 등록.
+        """
+        now = datetime.now(timezone.utc)
+        option_types = []
         option_list = []
-        for option in options:
-            now = datetime.now(timezone.utc)
-            product_option: ProductOption = ProductOption(
+        for product_id, option_type, options in items:
+            product_option_type = ProductOptionType(
+                id=self.ulid.generate(),
+                product_id=product_id,
+                option_type=option_type,
+                created_at=now,
+                updated_at=now,
+            )
+            option_types.append(product_option_type)
+            option_list += self._make_options(product_id, product_option_type.id, options)
+
+        self.product_repo.save_option_types_bulk(option_types, option_list)
+
+        return option_types, option_list
+
+    def _make_options(self, product_id: str, product_option_type_id: str, options: List[str]) -> list[ProductOption]:
+        now = datetime.now(timezone.utc)
+        return [
+            ProductOption(
                 id=self.ulid.generate(),
                 product_id=product_id,
                 product_option_type_id=product_option_type_id,
@@ -171,11 +264,10 @@ class ProductService:
                 is_active=True,
                 created_at=now,
                 updated_at=now,
+                sort_key=make_option_sort_key(option),
             )
-            self.product_repo.save_option(product_option)
-            option_list.append(product_option)
-
-        return len(option_list), option_list
+            for option in options
+        ]
 
     def get_product_options(self, product_id: str, product_option_type_id: str) -> tuple[int, list[ProductOption]]:
         product_options = self.product_repo.get_options(product_id, product_option_type_id)
@@ -186,6 +278,7 @@ class ProductService:
         product_option = self.product_repo.find_by_optionid(id)
 
         product_option.option = option
+        product_option.sort_key = make_option_sort_key(option)
         product_option.is_active = is_active
         product_option.updated_at = datetime.now(timezone.utc)
 
@@ -245,13 +338,19 @@ class ProductService:
         self,
         product_id: str | None = None,
         user_id: str | None = None,
-    ) -> tuple[int, list[ProductReview]]:
+        sort: str = "newest",
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> tuple[int, list[ProductReview], str | None]:
         if product_id is None and user_id is None:
             raise HTTPException(status_code=400, detail="Either product id or user id must be provided.")
         
-        product_reviews = self.product_repo.get_reviews(product_id, user_id)
+        product_reviews = self.product_repo.get_reviews(product_id, user_id, sort, cursor, limit)
 
         return product_reviews
+
+    def export_product_reviews(self) -> Iterator[ProductReview]:
+        return self.product_repo.iter_reviews()
     
     def delete_product_review(self, product_review_id: str):
         self.product_repo.delete_review(product_review_id)
@@ -0,0 +1,147 @@
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from product.domain.product import Product
+from product.domain.repository.product_repo import IProductRepository
+from order.domain.repository.order_repo import IOrderRepository
+
+ORDERED_WEIGHT = 2.0
+
+
+@dataclass
+class RecommendationSnapshot:
+    products: dict[str, Product]                                         # 활성 상품
+    candidates: dict[str, tuple[str, ...]] = field(default_factory=dict)  # 유저별 추천 후보 (점수순)
+    popular: tuple[str, ...] = ()                                         # 인기순
+    pool: tuple[str, ...] = ()                                            # 미리 섞어둔 랜덤 풀
+    built_at: float = 0.0
+
+
+class RecommendationEngine:
+    """
+    좋아요/리뷰/주문 이력으로 유저별 추천 후보를 미리 계산해 메모리에 보관.
+    요청 시에는 dict 조회와 고정 길이 슬라이스만 수행함.
+    후보가 부족하면 인기 상품과 랜덤 풀로 채움.
+    """
+    def __init__(
+        self,
+        product_repo: IProductRepository,
+        order_repo: IOrderRepository,
+        refresh_seconds: int = 1800,
+        candidates_per_user: int = 40,
+        max_items_per_user: int = 50,
+    ):
+        self.product_repo = product_repo
+        self.order_repo = order_repo
+        self.refresh_seconds = refresh_seconds
+        self.candidates_per_user = candidates_per_user
+        self.max_items_per_user = max_items_per_user
+        self._snapshot: RecommendationSnapshot | None = None
+        self._build_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._offset = itertools.count()
+
+    def build(self) -> RecommendationSnapshot:
+        with self._build_lock:
+            self._snapshot = self._build()
+            return self._snapshot
+
+    def _build(self) -> RecommendationSnapshot:
+        products = {product.id: product for product in self.product_repo.get_active_products()}
+        signals = self.product_repo.get_recommendation_signals()
+        signals += [
+            (user_id, product_id, ORDERED_WEIGHT)
+            for user_id, product_id in self.order_repo.get_ordered_products()
+        ]
+
+        user_items: dict[str, dict[str, float]] = defaultdict(dict)
+        popularity: dict[str, float] = defaultdict(float)
+        for user_id, product_id, weight in signals:
+            if product_id not in products:
+                continue
+            items = user_items[user_id]
+            items[product_id] = items.get(product_id, 0.0) + weight
+            popularity[product_id] += weight
+
+        # 아이템 간 동시 출현 (유저당 가중치 상위 max_items_per_user개까지만)
+        co_occurrence: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for items in user_items.values():
+            top_items = heapq.nlargest(self.max_items_per_user, items.items(), key=lambda item: item[1])
+            for (i, w_i), (j, w_j) in itertools.permutations(top_items, 2):
+                co_occurrence[i][j] += min(w_i, w_j)
+
+        candidates = {}
+        for user_id, items in user_items.items():
+            scores: dict[str, float] = defaultdict(float)
+            for i, w_i in items.items():
+                for j, co in co_occurrence.get(i, {}).items():
+                    if j not in items:
+                        scores[j] += w_i * co / math.sqrt(popularity[i] * popularity[j])
+            if scores:
+                top = heapq.nlargest(self.candidates_per_user, scores.items(), key=lambda item: item[1])
+                candidates[user_id] = tuple(product_id for product_id, _ in top)
+
+        popular = tuple(sorted(popularity, key=lambda product_id: -popularity[product_id]))
+        pool = list(products)
+        random.shuffle(pool)
+
+        return RecommendationSnapshot(
+            products=products,
+            candidates=candidates,
+            popular=popular,
+            pool=tuple(pool),
+            built_at=time.monotonic(),
+        )
+
+    def _ensure_built(self) -> RecommendationSnapshot:
+        with self._build_lock:
+            if self._snapshot is None:
+                self._snapshot = self._build()
+            return self._snapshot
+
+    def refresh_async(self):
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._refresh, name="recommendation-build", daemon=True).start()
+
+    def _refresh(self):
+        try:
+            self.build()
+        finally:
+            self._refresh_lock.release()
+
+    def recommend(self, user_id: str | None, limit: int = 20) -> list[Product]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._ensure_built()
+        elif time.monotonic() - snapshot.built_at > self.refresh_seconds:
+            self.refresh_async()
+
+        picked: dict[str, Product] = {}
+
+        def take(product_id: str):
+            product = snapshot.products.get(product_id)
+            if product is not None and product_id not in picked:
+                picked[product_id] = product
+
+        for product_id in snapshot.candidates.get(user_id, ())[:limit]:
+            take(product_id)
+
+        if len(picked) < limit and snapshot.pool:
+            # 인기 상품과 랜덤 풀을 번갈아 채움. 풀은 요청마다 시작 위치를 옮겨가며 사용.
+            start = next(self._offset) * limit % len(snapshot.pool)
+            window = snapshot.pool[start:start + limit] + snapshot.pool[:max(0, start + limit - len(snapshot.pool))]
+            for popular_id, pool_id in itertools.zip_longest(snapshot.popular[:limit], window):
+                for product_id in (popular_id, pool_id):
+                    if product_id is not None and len(picked) < limit:
+                        take(product_id)
+                if len(picked) >= limit:
+                    break
+
+        return list(picked.values())
@@ -0,0 +1,194 @@
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+
+from product.domain.product import Product
+from product.domain.repository.product_repo import IProductRepository
+
+NAME_WEIGHT = 2.0
+CATEGORY_WEIGHT = 1.0
+MIN_COVERAGE = 0.5  # 검색어 bigram 중 최소 이 비율 이상 일치해야 결과에 포함
+
+_SPLIT = re.compile(r"[^\w]+")
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def tokenize(text: str) -> set[str]:
+    """
+    글자 단위 bigram 토큰화. 한글은 형태소 분석 없이도 부분 일치가 가능함.
+    띄어쓰기 유무와 상관없이 찾을 수 있도록 공백을 제거한 문자열의 bigram도 포함.
+    """
+    words = [word for word in _SPLIT.split(normalize(text)) if word]
+    tokens = set()
+    for word in words + ["".join(words)]:
+        if len(word) == 1:
+            tokens.add(word)
+        tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class ProductSearchIndex:
+    """
+    상품명/카테고리에 대한 워커 메모리 역색인.
+    시작 시 전체 상품으로 생성하고, 상품 변경 시 해당 상품만 갱신함.
+    다른 워커에서 일어난 변경은 refresh_seconds마다 재생성하며 반영.
+    한 글자 검색어는 bigram이 없으므로 글자 단위 색인(_unigrams)에서 찾음.
+    """
+    def __init__(self, product_repo: IProductRepository, refresh_seconds: int = 600):
+        self.product_repo = product_repo
+        self.refresh_seconds = refresh_seconds
+        self._products: dict[str, Product] = {}
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._doc_tokens: dict[str, set[str]] = {}
+        self._unigrams: dict[str, dict[str, float]] = defaultdict(dict)
+        self._doc_chars: dict[str, set[str]] = {}
+        self._pending: dict[str, Product | None] | None = None  # 재생성 중 들어온 변경 (None이면 삭제)
+        self._built_at: float | None = None
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+
+    def build(self):
+        """
+        스냅샷은 락 밖에서 읽으므로, 읽는 동안 들어온 upsert/remove를 모아 두었다가 교체 후 다시 적용함.
+        """
+        with self._lock:
+            self._pending = {}
+        try:
+            products = self.product_repo.get_all_products()
+            with self._lock:
+                self._products.clear()
+                self._postings.clear()
+                self._doc_tokens.clear()
+                self._unigrams.clear()
+                self._doc_chars.clear()
+                for product in products:
+                    self._add(product)
+                for product_id, product in self._pending.items():
+                    self._remove(product_id)
+                    if product is not None:
+                        self._add(product)
+                self._built_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def refresh_async(self):
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._refresh, name="search-index-build", daemon=True).start()
+
+    def _refresh(self):
+        try:
+            self.build()
+        finally:
+            self._refresh_lock.release()
+
+    def upsert(self, product: Product):
+        with self._lock:
+            self._remove(product.id)
+            self._add(product)
+            if self._pending is not None:
+                self._pending[product.id] = product
+
+    def remove(self, product_id: str):
+        with self._lock:
+            self._remove(product_id)
+            if self._pending is not None:
+                self._pending[product_id] = None
+
+    def _add(self, product: Product):
+        weights: dict[str, float] = {}
+        for token in tokenize(f"{product.category_main} {product.category_sub}"):
+            weights[token] = CATEGORY_WEIGHT
+        for token in tokenize(product.name):
+            weights[token] = NAME_WEIGHT
+
+        char_weights: dict[str, float] = {}
+        for char in normalize(f"{product.category_main}{product.category_sub}"):
+            char_weights[char] = CATEGORY_WEIGHT
+        for char in normalize(product.name):
+            char_weights[char] = NAME_WEIGHT
+        char_weights = {char: weight for char, weight in char_weights.items() if not _SPLIT.match(char)}
+
+        for token, weight in weights.items():
+            self._postings[token][product.id] = weight
+        for char, weight in char_weights.items():
+            self._unigrams[char][product.id] = weight
+        self._doc_tokens[product.id] = set(weights)
+        self._doc_chars[product.id] = set(char_weights)
+        self._products[product.id] = product
+
+    def _remove(self, product_id: str):
+        for token in self._doc_tokens.pop(product_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(product_id, None)
+                if not postings:
+                    del self._postings[token]
+        for char in self._doc_chars.pop(product_id, ()):
+            postings = self._unigrams.get(char)
+            if postings is not None:
+                postings.pop(product_id, None)
+                if not postings:
+                    del self._unigrams[char]
+        self._products.pop(product_id, None)
+
+    def search(
+        self,
+        query: str,
+        category_main: str | None = None,
+        category_sub: str | None = None,
+        is_active: bool | None = True,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[int, list[Product]]:
+        if self._built_at is None:
+            with self._refresh_lock:
+                if self._built_at is None:
+                    self.build()
+        elif time.monotonic() - self._built_at > self.refresh_seconds:
+            self.refresh_async()
+
+        compact_query = "".join(_SPLIT.split(normalize(query)))
+        if len(compact_query) == 1:
+            index, query_tokens = self._unigrams, {compact_query}
+        else:
+            index, query_tokens = self._postings, tokenize(query)
+        if not query_tokens:
+            return 0, []
+
+        with self._lock:
+            total_docs = max(len(self._products), 1)
+            scores: dict[str, float] = defaultdict(float)
+            matched: dict[str, int] = defaultdict(int)
+            max_score = 0.0
+            for token in query_tokens:
+                postings = index.get(token, {})
+                idf = math.log(1 + total_docs / (1 + len(postings)))
+                max_score += NAME_WEIGHT * idf
+                for product_id, weight in postings.items():
+                    scores[product_id] += weight * idf
+                    matched[product_id] += 1
+
+            ranked = []
+            for product_id, score in scores.items():
+                if matched[product_id] < len(query_tokens) * MIN_COVERAGE:
+                    continue
+                product = self._products[product_id]
+                if is_active is not None and product.is_active != is_active:
+                    continue
+                if category_main is not None and product.category_main != category_main:
+                    continue
+                if category_sub is not None and product.category_sub != category_sub:
+                    continue
+                exact = compact_query in "".join(_SPLIT.split(normalize(product.name)))
+                ranked.append((exact, score / max_score, product))
+
+        ranked.sort(key=lambda item: (not item[0], -item[1], item[2].name))
+        return len(ranked), [product for _, _, product in ranked[offset:offset + limit]]
@@ -15,6 +15,8 @@ class Product:
     category_sub: str    # 소분류
     created_at: datetime
     updated_at: datetime
+    review_count: int = 0
+    rating_average: float = 0.0
 
 
 @dataclass
@@ -35,6 +37,7 @@ class ProductOption:
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    sort_key: str | None = None
 
 
 @dataclass
@@ -55,4 +58,29 @@ class ProductReview:
     content: str | None
     created_at: datetime
     updated_at: datetime
-    visible: bool
\ No newline at end of file
+    visible: bool
+
+@dataclass
+class ProductReviewSummary:
+    product_id: str
+    review_count: int
+    rating_average: float
+    rating_histogram: dict[int, int]  # 1 ~ 5점별 개수
+
+
+@dataclass
+class ProductDetail:
+    product: Product
+    option_types: list[ProductOptionType]
+    options: dict[str, list[ProductOption]]  # option type id별 옵션
+    review_summary: ProductReviewSummary
+    reviews: list[ProductReview]
+
+
+def make_option_sort_key(option: str) -> str:
+    """
+    숫자 옵션(사이즈 등)은 숫자순으로 먼저, 나머지는 문자순으로 정렬되도록 하는 키.
+    """
+    if option.isdecimal() and len(option) <= 10:
+        return f"0{int(option):010d}"
+    return f"1{option}"
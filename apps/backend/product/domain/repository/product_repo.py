@@ -1,8 +1,8 @@
-from typing import List
+from typing import Iterator, List
 from abc import ABCMeta, abstractmethod
 from fastapi import UploadFile
 
-from product.domain.product import Product, ProductOptionType, ProductOption, ProductLike, ProductReview
+from product.domain.product import Product, ProductOptionType, ProductOption, ProductLike, ProductReview, ProductDetail
 
 
 class IProductRepository(metaclass=ABCMeta):
@@ -42,12 +42,48 @@ class IProductRepository(metaclass=ABCMeta):
     def get_products_by_id(self, product_id: str) -> tuple[int, list[Product]]:
         raise NotImplementedError
     
+    @abstractmethod
+    def get_products_by_ids(self, product_ids: list[str]) -> list[Product]:
+        """
+        여러 ID의 상품을 한 번의 IN 쿼리로 조회.
+        결과 순서는 보장하지 않으며, 없는 ID는 결과에서 빠짐.
+        """
+        raise NotImplementedError
+    
     @abstractmethod
     def get_products_by_category(self, page: int, items_per_page: int, category_main: str, category_sub) -> tuple[int, list[Product]]:
         raise NotImplementedError
     
     @abstractmethod
-    def get_products_recommended(self, user_id: str) -> tuple[int, list[Product]]:
+    def get_products_by_cursor(
+        self,
+        cursor: str | None,
+        items_per_page: int,
+        category_main: str | None = None,
+        category_sub: str | None = None,
+        with_total: bool = False,
+    ) -> tuple[int | None, list[Product], str | None]:
+        """
+        (created_at, id) 커서 기반 최신순 상품 목록.
+        with_total이 False면 전체 개수를 세지 않고 None 반환.
+        커서가 올바르지 않으면 400 에러 발생.
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def get_all_products(self) -> list[Product]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_active_products(self) -> list[Product]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_recommendation_signals(self) -> list[tuple[str, str, float]]:
+        """
+        추천 계산용 (user_id, product_id, 가중치) 목록.
+        좋아요, 4점 이상 리뷰를 합산. 주문 이력은 주문 저장소에서 따로 읽음.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -103,6 +139,24 @@ class IProductRepository(metaclass=ABCMeta):
     def save_option(self, options: ProductOption):
         raise NotImplementedError
     
+    @abstractmethod
+    def save_options_bulk(self, product_options: List[ProductOption]):
+        """
+        여러 옵션을 한 트랜잭션에서 multi-row INSERT로 저장. 하나라도 실패하면 전체 롤백.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_option_types_bulk(
+        self,
+        product_option_types: List[ProductOptionType],
+        product_options: List[ProductOption],
+    ):
+        """
+        여러 상품의 옵션 타입과 옵션을 한 트랜잭션에서 저장. (관리자 일괄 등록용)
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_options(self, product_id: str, product_option_type_id: str) -> tuple[int, list[ProductOption]]:
         raise NotImplementedError
@@ -136,11 +190,40 @@ class IProductRepository(metaclass=ABCMeta):
         raise NotImplementedError
     
     @abstractmethod
-    def get_reviews(self, product_id: str, user_id: str) -> tuple[int, list[ProductReview]]:
+    def get_reviews(
+        self,
+        product_id: str | None,
+        user_id: str | None,
+        sort: str = "newest",
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> tuple[int, list[ProductReview], str | None]:
+        """
+        노출 중인 리뷰를 최신순(newest) 또는 평점순(rating)으로 커서 페이지네이션.
+        (전체 개수, 리뷰 목록, 다음 페이지 커서) 반환.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_reviews(self) -> Iterator[ProductReview]:
+        """
+        숨김 리뷰를 포함한 모든 리뷰를 서버 사이드 커서로 스트리밍. (내보내기용)
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def delete_review(self, prouct_review_id: str) -> ProductReview:
+        """
+        리뷰를 삭제하고 삭제된 리뷰를 반환.
+        """
         raise NotImplementedError
     
     @abstractmethod
-    def delete_review(self, prouct_review_id: str):
+    def get_product_detail(self, product_id: str, review_limit: int = 10) -> ProductDetail:
+        """
+        상품, 옵션 타입별 옵션, 리뷰 요약, 최신 리뷰를 한 세션에서 조회.
+        검색한 상품이 없을 경우 404 에러 발생.
+        """
         raise NotImplementedError
     
     @abstractmethod
@@ -1,10 +1,15 @@
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Text, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database import Base
 
 
 class Product(Base):
     __tablename__ = "Product"
+    __table_args__ = (
+        Index("ix_product_created_at_id", "created_at", "id"),
+        Index("ix_product_category_main_created_at_id", "category_main", "created_at", "id"),
+        Index("ix_product_category_created_at_id", "category_main", "category_sub", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)  # UUID
     product_number: Mapped[int] = mapped_column(Integer, autoincrement=True, unique=True) # 상품번호
@@ -38,6 +43,13 @@ class Product(Base):
         cascade="all, delete-orphan"
     )
 
+    # 목록 조회 시 같은 쿼리에서 LEFT JOIN으로 함께 로드
+    rating_summary: Mapped["ProductRatingSummary | None"] = relationship(
+        back_populates="product",
+        cascade="all, delete-orphan",
+        lazy="joined",
+    )
+
 
 class ProductOptionType(Base):
     __tablename__ = "ProductOptionType"
@@ -62,6 +74,9 @@ class ProductOptionType(Base):
 
 class ProductOption(Base):
     __tablename__ = "ProductOption"
+    __table_args__ = (
+        Index("ix_product_option_type_sort_key", "product_id", "product_option_type_id", "sort_key"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     product_id: Mapped[str] = mapped_column(
@@ -75,6 +90,7 @@ class ProductOption(Base):
         nullable=False
     )
     option: Mapped[str] = mapped_column(String(32), nullable=False)
+    sort_key: Mapped[str] = mapped_column(String(40), nullable=False)  # make_option_sort_key(option)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[str] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[str] = mapped_column(DateTime, nullable=False)
@@ -103,6 +119,11 @@ class ProductLike(Base):
 
 class ProductReview(Base):
     __tablename__ = "ProductReview"
+    __table_args__ = (
+        Index("ix_product_review_product_visible_created_at", "product_id", "visible", "created_at"),
+        Index("ix_product_review_product_visible_rating", "product_id", "visible", "rating", "created_at"),
+        Index("ix_product_review_user_created_at", "user_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     user_id: Mapped[str] = mapped_column(String(36), nullable=False)
@@ -118,4 +139,24 @@ class ProductReview(Base):
     updated_at: Mapped[str] = mapped_column(DateTime, nullable=False)
     visible: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
-    product: Mapped["Product"] = relationship(back_populates="reviews")
\ No newline at end of file
+    product: Mapped["Product"] = relationship(back_populates="reviews")
+
+
+class ProductRatingSummary(Base):
+    __tablename__ = "ProductRatingSummary"
+
+    product_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("Product.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_1: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_2: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_3: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_4: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_5: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[str] = mapped_column(DateTime, nullable=False)
+
+    product: Mapped["Product"] = relationship(back_populates="rating_summary")
@@ -0,0 +1,152 @@
+from copy import deepcopy
+from typing import List
+from fastapi import UploadFile
+
+from common.cache import TTLCache, MISSING
+from product.infra.repository.product_repo import ProductRepository
+from product.domain.product import Product as ProductVO
+from product.domain.product import ProductOptionType as ProductOptionTypeVO
+from product.domain.product import ProductOption as ProductOptionVO
+from product.domain.product import ProductReview as ProductReviewVO
+
+
+def _product_ids(value) -> tuple[str, ...]:
+    """
+    캐시할 값(상품, 상품 목록, 목록을 포함한 튜플)에 포함된 상품 ID.
+    """
+    if isinstance(value, ProductVO):
+        return (value.id,)
+    if isinstance(value, (list, tuple)):
+        return tuple(product_id for item in value for product_id in _product_ids(item))
+    return ()
+
+
+class CachedProductRepository(ProductRepository):
+    """
+    상품 카탈로그 조회 결과를 워커 메모리에 캐시하는 ProductRepository.
+    상품/옵션 타입/옵션 변경 시 캐시 전체를 비움.
+    리뷰 변경 시에는 리뷰 집계가 바뀐 상품이 포함된 항목만 무효화함. (항목마다 포함된 상품 ID를 태그로 저장)
+    다른 워커의 캐시는 TTL이 지나야 갱신됨.
+    """
+    def __init__(self, cache: TTLCache):
+        self.cache = cache
+
+    def _cached(self, key: tuple, loader, *args):
+        value = self.cache.get(key)
+        if value is MISSING:
+            generation, tag_clock = self.cache.generation, self.cache.tag_clock
+            value = loader(*args)
+            self.cache.set(key, value, generation=generation, tags=_product_ids(value), tag_clock=tag_clock)
+        return deepcopy(value)
+
+    def _invalidate(self, mutation, *args):
+        try:
+            return mutation(*args)
+        finally:
+            self.cache.clear()
+
+    def find_by_id(self, id) -> ProductVO:
+        return self._cached(("find_by_id", id), super().find_by_id, id)
+
+    def get_products_by_id(self, product_id):
+        return self._cached(("get_products_by_id", product_id), super().get_products_by_id, product_id)
+
+    def get_products_by_ids(self, product_ids: list[str]) -> list[ProductVO]:
+        products = []
+        missing_ids = []
+        for product_id in product_ids:
+            product = self.cache.get(("find_by_id", product_id))
+            if product is MISSING:
+                missing_ids.append(product_id)
+            else:
+                products.append(product)
+
+        if missing_ids:
+            generation, tag_clock = self.cache.generation, self.cache.tag_clock
+            loaded = super().get_products_by_ids(missing_ids)
+            for product in loaded:
+                self.cache.set(
+                    ("find_by_id", product.id), product,
+                    generation=generation, tags=(product.id,), tag_clock=tag_clock,
+                )
+            products += loaded
+
+        return deepcopy(products)
+
+    def get_products(self, page: int = 1, items_per_page: int = 10) -> tuple[int, list[ProductVO]]:
+        return self._cached(
+            ("get_products", page, items_per_page),
+            super().get_products, page, items_per_page,
+        )
+
+    def get_products_by_category(self, page, items_per_page, category_main, category_sub):
+        return self._cached(
+            ("get_products_by_category", page, items_per_page, category_main, category_sub),
+            super().get_products_by_category, page, items_per_page, category_main, category_sub,
+        )
+
+    def get_products_by_cursor(
+        self,
+        cursor: str | None,
+        items_per_page: int,
+        category_main: str | None = None,
+        category_sub: str | None = None,
+        with_total: bool = False,
+    ) -> tuple[int | None, list[ProductVO], str | None]:
+        return self._cached(
+            ("get_products_by_cursor", cursor, items_per_page, category_main, category_sub, with_total),
+            super().get_products_by_cursor, cursor, items_per_page, category_main, category_sub, with_total,
+        )
+
+    def get_option_types(self, product_id: str) -> tuple[int, List[ProductOptionTypeVO]]:
+        return self._cached(("get_option_types", product_id), super().get_option_types, product_id)
+
+    def get_options(self, product_id: str, product_option_type_id: str) -> tuple[int, List[ProductOptionVO]]:
+        return self._cached(
+            ("get_options", product_id, product_option_type_id),
+            super().get_options, product_id, product_option_type_id,
+        )
+
+    def save(self, product: ProductVO, image_thumbnail: UploadFile, image_detail: List[UploadFile]) -> ProductVO:
+        return self._invalidate(super().save, product, image_thumbnail, image_detail)
+
+    def update(self, product_vo: ProductVO, image_thumbnail: UploadFile | None, image_detail: List[UploadFile] | None) -> ProductVO:
+        return self._invalidate(super().update, product_vo, image_thumbnail, image_detail)
+
+    def delete(self, id):
+        return self._invalidate(super().delete, id)
+
+    def save_option_type(self, product_option_type_vo: ProductOptionTypeVO):
+        return self._invalidate(super().save_option_type, product_option_type_vo)
+
+    def update_option_type(self, product_option_type: ProductOptionTypeVO):
+        return self._invalidate(super().update_option_type, product_option_type)
+
+    def delete_option_type(self, id: str):
+        return self._invalidate(super().delete_option_type, id)
+
+    def save_option(self, product_options: ProductOptionVO):
+        return self._invalidate(super().save_option, product_options)
+
+    def save_options_bulk(self, product_options: List[ProductOptionVO]):
+        return self._invalidate(super().save_options_bulk, product_options)
+
+    def save_option_types_bulk(self, product_option_types: List[ProductOptionTypeVO], product_options: List[ProductOptionVO]):
+        return self._invalidate(super().save_option_types_bulk, product_option_types, product_options)
+
+    def update_option(self, product_option_vo: ProductOptionVO):
+        return self._invalidate(super().update_option, product_option_vo)
+
+    def delete_option(self, id: str):
+        return self._invalidate(super().delete_option, id)
+
+    def save_review(self, product_review: ProductReviewVO, images: List[UploadFile]) -> ProductReviewVO:
+        try:
+            return super().save_review(product_review, images)
+        finally:
+            self.cache.invalidate_tag(product_review.product_id)
+
+    def delete_review(self, product_review_id: str) -> ProductReviewVO:
+        product_review = super().delete_review(product_review_id)
+        self.cache.invalidate_tag(product_review.product_id)
+        return product_review
@@ -1,21 +1,50 @@
-from typing import List
-from sqlalchemy import case, cast, Integer
+from typing import Iterator, List
+from datetime import datetime
+from sqlalchemy import and_, or_, insert, update, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.sql.expression import func
 from fastapi import HTTPException, UploadFile
 import MySQLdb
 
 from database import SessionLocal
 from aws import bucket_session
 from utils.db_utils import row_to_dict
+from utils.cursor import encode_cursor, decode_cursor
 from common.s3_upload import upload_images_to_s3, delete_images_from_s3
+from common.export import stream_rows
 from product.domain.repository.product_repo import IProductRepository
 from product.domain.product import Product as ProductVO
 from product.domain.product import ProductOptionType as ProductOptionTypeVO
 from product.domain.product import ProductOption as ProductOptionVO
 from product.domain.product import ProductLike as ProductLikeVO
 from product.domain.product import ProductReview as ProductReviewVO
-from product.infra.db_models.product import Product, ProductOptionType, ProductOption, ProductLike, ProductReview
+from product.domain.product import ProductReviewSummary, ProductDetail, make_option_sort_key
+from product.infra.db_models.product import Product, ProductOptionType, ProductOption, ProductLike, ProductReview, ProductRatingSummary
+
+
+def to_product_vo(product: Product) -> ProductVO:
+    # rating_summary는 joined 로드된 경우에만 사용 (세션 밖에서 lazy load 방지)
+    summary = product.__dict__.get("rating_summary")
+    review_count = summary.review_count if summary else 0
+    return ProductVO(
+        **row_to_dict(product),
+        review_count=review_count,
+        rating_average=round(summary.rating_sum / review_count, 2) if review_count else 0.0,
+    )
+
+
+def to_review_summary(product_id: str, summary: ProductRatingSummary | None) -> ProductReviewSummary:
+    review_count = summary.review_count if summary else 0
+    return ProductReviewSummary(
+        product_id=product_id,
+        review_count=review_count,
+        rating_average=round(summary.rating_sum / review_count, 2) if review_count else 0.0,
+        rating_histogram={
+            rating: getattr(summary, f"rating_{rating}") if summary else 0
+            for rating in range(1, 6)
+        },
+    )
 
 
 class ProductRepository(IProductRepository):
@@ -45,7 +74,7 @@ class ProductRepository(IProductRepository):
                 db.rollback()
                 raise HTTPException(status_code=500, detail="Failed to Save Product.")
         
-        return ProductVO(**row_to_dict(new_product))
+        return ProductVO(**row_to_dict(new_product))  # 신규 상품은 리뷰 없음
             
     def find_by_name(self, name: str) -> ProductVO:
         with SessionLocal() as db:
@@ -56,7 +85,7 @@ class ProductRepository(IProductRepository):
         if not product:
             raise HTTPException(status_code=422)
         
-        return ProductVO(**row_to_dict(product))
+        return to_product_vo(product)
 
     def _upload_product_img(self, name: str, image_thumbnail: UploadFile, image_detail: List[UploadFile]):
         if not image_thumbnail or not image_detail:
@@ -89,7 +118,7 @@ class ProductRepository(IProductRepository):
             offset = (page - 1) * items_per_page
             products = query.limit(items_per_page).offset(offset).all()
 
-        return total_count, [ProductVO(**row_to_dict(product)) for product in products]
+        return total_count, [to_product_vo(product) for product in products]
     
     def get_products_by_id(self, product_id):
         with SessionLocal() as db:
@@ -100,8 +129,17 @@ class ProductRepository(IProductRepository):
             if not product:
                 raise HTTPException(status_code=404, detail="Product Not Found")
 
-        return [ProductVO(**row_to_dict(product))]
+        return [to_product_vo(product)]
     
+    def get_products_by_ids(self, product_ids: list[str]) -> list[ProductVO]:
+        if not product_ids:
+            return []
+
+        with SessionLocal() as db:
+            products = db.query(Product).filter(Product.id.in_(product_ids)).all()
+
+        return [to_product_vo(product) for product in products]
+
     def get_products_by_category(self, page, items_per_page, category_main, category_sub):
         with SessionLocal() as db:
             query = db.query(Product).filter(Product.category_main == category_main)
@@ -116,14 +154,71 @@ class ProductRepository(IProductRepository):
             offset = (page - 1) * items_per_page
             products = query.limit(items_per_page).offset(offset).all()
 
-        return total_count, [ProductVO(**row_to_dict(product)) for product in products]
+        return total_count, [to_product_vo(product) for product in products]
+
+    def get_products_by_cursor(
+        self,
+        cursor: str | None,
+        items_per_page: int,
+        category_main: str | None = None,
+        category_sub: str | None = None,
+        with_total: bool = False,
+    ) -> tuple[int | None, list[ProductVO], str | None]:
+        with SessionLocal() as db:
+            query = db.query(Product)
+
+            if category_main is not None:
+                query = query.filter(Product.category_main == category_main)
+            if category_sub is not None:
+                query = query.filter(Product.category_sub == category_sub)
+
+            total_count = query.count() if with_total else None
+
+            if cursor:
+                created_at, product_id = decode_cursor(cursor, datetime, str)
+                query = query.filter(
+                    or_(
+                        Product.created_at < created_at,
+                        and_(Product.created_at == created_at, Product.id < product_id),
+                    )
+                )
+
+            products = query.order_by(
+                Product.created_at.desc(),
+                Product.id.desc(),
+            ).limit(items_per_page + 1).all()
+
+        next_cursor = None
+        if len(products) > items_per_page:
+            products = products[:items_per_page]
+            last = products[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return total_count, [to_product_vo(product) for product in products], next_cursor
+
+    def get_all_products(self) -> list[ProductVO]:
+        with SessionLocal() as db:
+            products = db.query(Product).all()
+
+        return [to_product_vo(product) for product in products]
 
-    def get_products_recommended(self, user_id: str) -> tuple[int, list[ProductVO]]:
+    def get_active_products(self) -> list[ProductVO]:
         with SessionLocal() as db:
-            query = db.query(Product).filter(Product.is_active == True).order_by(func.rand()).limit(20)
-            products = query.all()
-            total_count = len(products)
-        return total_count, [ProductVO(**row_to_dict(product)) for product in products]
+            products = db.query(Product).filter(Product.is_active == True).all()
+
+        return [to_product_vo(product) for product in products]
+
+    def get_recommendation_signals(self) -> list[tuple[str, str, float]]:
+        with SessionLocal() as db:
+            likes = db.query(ProductLike.user_id, ProductLike.product_id).all()
+            reviews = db.query(ProductReview.user_id, ProductReview.product_id, ProductReview.rating).filter(
+                ProductReview.visible == True,
+                ProductReview.rating >= 4,
+            ).all()
+
+        signals = [(user_id, product_id, 1.0) for user_id, product_id in likes]
+        signals += [(user_id, product_id, float(rating - 3)) for user_id, product_id, rating in reviews]
+        return signals
 
     def update(self, product_vo: ProductVO, image_thumbnail: UploadFile | None, image_detail: List[UploadFile] | None) -> ProductVO:
         with SessionLocal() as db:
@@ -147,10 +242,11 @@ class ProductRepository(IProductRepository):
                 # TODO S3 IMAGE MODIFY LOGIC
                 pass
             db.commit()
+            db.refresh(product)
         except Exception as e:
             raise HTTPException(status_code=500, detail="Failed to Update product.")
 
-        return ProductVO(**row_to_dict(product))
+        return to_product_vo(product)
 
     def find_by_id(self, id) -> ProductVO:
         with SessionLocal() as db:
@@ -159,7 +255,7 @@ class ProductRepository(IProductRepository):
         if not product:
             raise HTTPException(status_code=422)
         
-        return ProductVO(**row_to_dict(product))
+        return to_product_vo(product)
     
     def delete(self, id):
         with SessionLocal() as db:
@@ -269,6 +365,7 @@ class ProductRepository(IProductRepository):
                     product_id=product_options.product_id,
                     product_option_type_id=product_options.product_option_type_id,
                     option=product_options.option,
+                    sort_key=make_option_sort_key(product_options.option),
                     is_active=product_options.is_active,
                     created_at=product_options.created_at,
                     updated_at=product_options.updated_at,
@@ -279,25 +376,72 @@ class ProductRepository(IProductRepository):
                 db.rollback()
                 raise HTTPException(status_code=500, detail="Failed to save product options.")
 
+    def save_options_bulk(self, product_options: List[ProductOptionVO]):
+        if not product_options:
+            return
+
+        with SessionLocal() as db:
+            try:
+                db.execute(insert(ProductOption), [self._option_row(option) for option in product_options])
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                raise HTTPException(status_code=422, detail="Invalid product ID or option type ID.")
+            except Exception:
+                db.rollback()
+                raise HTTPException(status_code=500, detail="Failed to save product options.")
+
+    def save_option_types_bulk(
+        self,
+        product_option_types: List[ProductOptionTypeVO],
+        product_options: List[ProductOptionVO],
+    ):
+        with SessionLocal() as db:
+            try:
+                if product_option_types:
+                    db.execute(
+                        insert(ProductOptionType),
+                        [
+                            dict(
+                                id=option_type.id,
+                                product_id=option_type.product_id,
+                                option_type=option_type.option_type,
+                                created_at=option_type.created_at,
+                                updated_at=option_type.updated_at,
+                            )
+                            for option_type in product_option_types
+                        ],
+                    )
+                if product_options:
+                    db.execute(insert(ProductOption), [self._option_row(option) for option in product_options])
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                raise HTTPException(status_code=422, detail="Invalid product ID or option type ID.")
+            except Exception:
+                db.rollback()
+                raise HTTPException(status_code=500, detail="Failed to save product option types.")
+
+    def _option_row(self, product_option: ProductOptionVO) -> dict:
+        return dict(
+            id=product_option.id,
+            product_id=product_option.product_id,
+            product_option_type_id=product_option.product_option_type_id,
+            option=product_option.option,
+            sort_key=make_option_sort_key(product_option.option),
+            is_active=product_option.is_active,
+            created_at=product_option.created_at,
+            updated_at=product_option.updated_at,
+        )
+
     def get_options(self, product_id: str, product_option_type_id: str) -> tuple[int, List[ProductOptionVO]]:
         with SessionLocal() as db:
             product_options = db.query(ProductOption).filter(
                 ProductOption.product_id == product_id,
                 ProductOption.product_option_type_id == product_option_type_id
-            ).order_by(
-            case(
-                (ProductOption.option.op('REGEXP')('^[0-9]+$'), 0),  # 숫자면 0
-                else_=1  # 아니면 1
-            ),
-            cast(ProductOption.option, Integer),  # 숫자면 숫자순
-            ProductOption.option.asc()  # 아니면 알파벳순
-        )
-            total_count = product_options.count()
+            ).order_by(ProductOption.sort_key.asc()).all()
 
-            if not product_options:
-                raise HTTPException(status_code=422)
-
-        return total_count, [ProductOptionVO(**row_to_dict(product_option)) for product_option in product_options]
+        return len(product_options), [ProductOptionVO(**row_to_dict(product_option)) for product_option in product_options]
     
     def update_option(self, product_option_vo: ProductOptionVO) -> ProductOption:
         with SessionLocal() as db:
@@ -307,6 +451,7 @@ class ProductRepository(IProductRepository):
             raise HTTPException(status_code=422)
         
         product_option.option = product_option_vo.option
+        product_option.sort_key = make_option_sort_key(product_option_vo.option)
         product_option.is_active = product_option_vo.is_active
         product_option.updated_at = product_option_vo.updated_at
 
@@ -374,7 +519,7 @@ class ProductRepository(IProductRepository):
 
             total_count = len(results)
             like_ids = [like_id for like_id, _ in results]
-            products = [ProductVO(**row_to_dict(p)) for _, p in results]
+            products = [to_product_vo(p) for _, p in results]
 
         return total_count, like_ids, products
     
@@ -410,6 +555,8 @@ class ProductRepository(IProductRepository):
             try:
                 db.add(new_product_review)
                 db.flush()
+                if new_product_review.visible:
+                    self._add_rating(db, product_review.product_id, product_review.rating, product_review.created_at)
                 upload_images_to_s3(f"reviews/{product_review.id}", images)
                 db.commit()
             except IntegrityError as e:
@@ -419,25 +566,78 @@ class ProductRepository(IProductRepository):
                     if code == 1452:
                         raise HTTPException(status_code=422, detail="Invalid product ID.")
 
-    def get_reviews(self, product_id: str, user_id: str) -> tuple[int, list[ProductReviewVO]]:
-        with SessionLocal() as db:
-            if product_id is None and user_id is None:
-                raise HTTPException(status_code=400, detail="Either product id or user id must be provided.")
-
-            with SessionLocal() as db:
-                query = db.query(ProductReview)
-
-                if product_id:
-                    query = query.filter(ProductReview.product_id == product_id)
-                elif user_id:
-                    query = query.filter(ProductReview.user_id == user_id)
+    def get_reviews(
+        self,
+        product_id: str | None,
+        user_id: str | None,
+        sort: str = "newest",
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> tuple[int, list[ProductReviewVO], str | None]:
+        if product_id is None and user_id is None:
+            raise HTTPException(status_code=400, detail="Either product id or user id must be provided.")
 
-                reviews = query.order_by(ProductReview.created_at.desc()).all()
-                total_count = len(reviews)
-
-                return total_count, [ProductReviewVO(**row_to_dict(review)) for review in reviews]
+        with SessionLocal() as db:
+            query = db.query(ProductReview).filter(ProductReview.visible == True)
+
+            if product_id:
+                query = query.filter(ProductReview.product_id == product_id)
+                summary = db.get(ProductRatingSummary, product_id)
+                total_count = summary.review_count if summary else 0
+            else:
+                query = query.filter(ProductReview.user_id == user_id)
+                total_count = query.count()
+
+            if sort == "rating":
+                if cursor:
+                    rating, created_at, review_id = decode_cursor(cursor, int, datetime, str)
+                    query = query.filter(
+                        or_(
+                            ProductReview.rating < rating,
+                            and_(ProductReview.rating == rating, ProductReview.created_at < created_at),
+                            and_(
+                                ProductReview.rating == rating,
+                                ProductReview.created_at == created_at,
+                                ProductReview.id < review_id,
+                            ),
+                        )
+                    )
+                query = query.order_by(
+                    ProductReview.rating.desc(),
+                    ProductReview.created_at.desc(),
+                    ProductReview.id.desc(),
+                )
+            else:
+                if cursor:
+                    created_at, review_id = decode_cursor(cursor, datetime, str)
+                    query = query.filter(
+                        or_(
+                            ProductReview.created_at < created_at,
+                            and_(ProductReview.created_at == created_at, ProductReview.id < review_id),
+                        )
+                    )
+                query = query.order_by(ProductReview.created_at.desc(), ProductReview.id.desc())
+
+            reviews = query.limit(limit + 1).all()
+
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            last = reviews[-1]
+            if sort == "rating":
+                next_cursor = encode_cursor(last.rating, last.created_at, last.id)
+            else:
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+        return total_count, [ProductReviewVO(**row_to_dict(review)) for review in reviews], next_cursor
+
+    def iter_reviews(self) -> Iterator[ProductReviewVO]:
+        with SessionLocal() as db:
+            rows = stream_rows(db, select(ProductReview.__table__).order_by(ProductReview.created_at, ProductReview.id))
+            for row in rows:
+                yield ProductReviewVO(**row._mapping)
     
-    def delete_review(self, product_review_id: str):
+    def delete_review(self, product_review_id: str) -> ProductReviewVO:
         with SessionLocal() as db:
             product_review = db.query(ProductReview).filter(
                 ProductReview.id == product_review_id
@@ -445,15 +645,94 @@ class ProductRepository(IProductRepository):
             
             if not product_review:
                 raise HTTPException(status_code=422)
-            
+
+            deleted_review = ProductReviewVO(**row_to_dict(product_review))
             try:
                 db.delete(product_review)
+                if product_review.visible:
+                    self._remove_rating(db, product_review.product_id, product_review.rating)
                 delete_images_from_s3(f"reviews/{product_review_id}")
                 db.commit()
             except:
                 db.rollback()
                 raise HTTPException(status_code=500, detail="Failed to Delete product review.")
+
+        return deleted_review
     
+    def _add_rating(self, db, product_id: str, rating: int, now: datetime):
+        """
+        리뷰 작성과 같은 트랜잭션에서 상품별 리뷰 집계를 갱신.
+        행이 없으면 생성하고, 있으면 원자적으로 증가시킴.
+        """
+        rating_column = f"rating_{rating}"
+        statement = mysql_insert(ProductRatingSummary).values(
+            product_id=product_id,
+            review_count=1,
+            rating_sum=rating,
+            updated_at=now,
+            **{f"rating_{r}": int(r == rating) for r in range(1, 6)},
+        )
+        db.execute(
+            statement.on_duplicate_key_update(
+                review_count=ProductRatingSummary.review_count + 1,
+                rating_sum=ProductRatingSummary.rating_sum + rating,
+                updated_at=statement.inserted.updated_at,
+                **{rating_column: getattr(ProductRatingSummary, rating_column) + 1},
+            )
+        )
+
+    def _remove_rating(self, db, product_id: str, rating: int):
+        rating_column = f"rating_{rating}"
+        db.execute(
+            update(ProductRatingSummary)
+            .where(ProductRatingSummary.product_id == product_id)
+            .values(
+                review_count=ProductRatingSummary.review_count - 1,
+                rating_sum=ProductRatingSummary.rating_sum - rating,
+                updated_at=datetime.now(),
+                **{rating_column: getattr(ProductRatingSummary, rating_column) - 1},
+            )
+        )
+
+    def get_product_detail(self, product_id: str, review_limit: int = 10) -> ProductDetail:
+        with SessionLocal() as db:
+            product = db.query(Product).filter(Product.id == product_id).first()
+
+            if not product:
+                raise HTTPException(status_code=404, detail="Product Not Found")
+
+            option_types = (
+                db.query(ProductOptionType)
+                .options(selectinload(ProductOptionType.options))
+                .filter(ProductOptionType.product_id == product_id)
+                .order_by(ProductOptionType.option_type.asc())
+                .all()
+            )
+
+            reviews = (
+                db.query(ProductReview)
+                .filter(ProductReview.product_id == product_id, ProductReview.visible == True)
+                .order_by(ProductReview.created_at.desc(), ProductReview.id.desc())
+                .limit(review_limit)
+                .all()
+            )
+
+            options = {
+                option_type.id: [
+                    ProductOptionVO(**row_to_dict(option))
+                    for option in sorted(option_type.options, key=lambda option: option.sort_key)
+                ]
+                for option_type in option_types
+            }
+
+        return ProductDetail(
+            product=to_product_vo(product),
+            option_types=[ProductOptionTypeVO(**row_to_dict(option_type)) for option_type in option_types],
+            options=options,
+            review_summary=to_review_summary(product_id, product.rating_summary),
+            reviews=[ProductReviewVO(**row_to_dict(review)) for review in reviews],
+        )
+
     def get_option_info(self, option_type_id: str, option_id: str) -> tuple[str, str, bool]:
         with SessionLocal() as db:
             option_type = db.query(ProductOptionType).filter(ProductOptionType.id == option_type_id).first()
@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, UploadFile, File, Form
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Query
 from pydantic import BaseModel, Field
 
+from config import get_settings
 from containers import Container
-from common.auth import CurrentUser, get_current_user, get_admin_user
+from common.cache import TTLCache
+from common.auth import CurrentUser, get_current_user, get_optional_user, get_admin_user
+from common.export import ExportFormat, export_response
 from utils.val_image import validate_images
 from product.application.product_service import ProductService
 
@@ -24,6 +27,8 @@ class ProductResponse(BaseModel):
     category_sub: str
     created_at: datetime
     updated_at: datetime
+    review_count: int = 0
+    rating_average: float = 0.0
 
 
 @router.post("", status_code=201, response_model=ProductResponse)
@@ -55,19 +60,34 @@ def create_product(
 
 
 class GetProductsResponse(BaseModel):
-    total_count: int
+    total_count: int | None
     page: int
     products: list[ProductResponse]
+    next_cursor: str | None = None
 
 
 @router.get("", response_model=GetProductsResponse)
 @inject
 def get_products(
-    page: int = 1,
-    items_per_page: int = 10,
+    page: int = Query(1, ge=1),
+    items_per_page: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    with_total: bool = False,
     #NO NEED TO AUTHORIZE
     product_service: ProductService = Depends(Provide[Container.product_service]),
 ):
+    if use_cursor or cursor:
+        total_count, products, next_cursor = product_service.get_products_by_cursor(
+            cursor, items_per_page, with_total=with_total
+        )
+        return {
+            "total_count": total_count,
+            "page": page,
+            "products": products,
+            "next_cursor": next_cursor,
+        }
+
     total_count, products = product_service.get_products(page, items_per_page)
     
     return {
@@ -92,16 +112,53 @@ def get_products_by_id(
     }
 
 
+class GetProductsByIdsResponse(BaseModel):
+    total_count: int
+    products: list[ProductResponse]
+    missing_ids: list[str]
+
+
+@router.get("/by_ids", response_model=GetProductsByIdsResponse)
+@inject
+def get_products_by_ids(
+    ids: List[str] = Query(min_length=1),
+    product_service: ProductService = Depends(Provide[Container.product_service]),
+):
+    # ?ids=a,b,c 와 ?ids=a&ids=b 형식 모두 허용
+    product_ids = [product_id for value in ids for product_id in value.split(",") if product_id]
+    products, missing_ids = product_service.get_products_by_ids(product_ids)
+
+    return {
+        "total_count": len(products),
+        "products": products,
+        "missing_ids": missing_ids,
+    }
+
+
 @router.get("/by_category", response_model=GetProductsResponse)
 @inject
 def get_products_by_category(
-    page: int,
-    items_per_page: int,
     category_main: str,
+    page: int = Query(1, ge=1),
+    items_per_page: int = Query(10, ge=1, le=100),
     category_sub: str | None = None,
+    cursor: str | None = None,
+    use_cursor: bool = False,
+    with_total: bool = False,
     #NO NEED TO AUTHORIZE
     product_service: ProductService = Depends(Provide[Container.product_service]),
 ):
+    if use_cursor or cursor:
+        total_count, products, next_cursor = product_service.get_products_by_cursor(
+            cursor, items_per_page, category_main, category_sub, with_total
+        )
+        return {
+            "total_count": total_count,
+            "page": page,
+            "products": products,
+            "next_cursor": next_cursor,
+        }
+
     total_count, products = product_service.get_products_by_category(page, items_per_page, category_main, category_sub)
     
     return {
@@ -111,13 +168,39 @@ def get_products_by_category(
     }
 
 
+@router.get("/search", response_model=GetProductsResponse)
+@inject
+def search_products(
+    q: str = Query(min_length=1, max_length=64),
+    category_main: str | None = None,
+    category_sub: str | None = None,
+    is_active: bool | None = True,
+    page: int = Query(1, ge=1),
+    items_per_page: int = Query(20, ge=1, le=100),
+    #NO NEED TO AUTHORIZE
+    product_service: ProductService = Depends(Provide[Container.product_service]),
+):
+    total_count, products = product_service.search_products(
+        q, category_main, category_sub, is_active, page, items_per_page
+    )
+
+    return {
+        "total_count": total_count,
+        "page": page,
+        "products": products,
+    }
+
+
 @router.get("/recommended", response_model=GetProductsResponse)
 @inject
 def get_recommended_products(
-    #current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser | None, Depends(get_optional_user)],
+    limit: int = Query(20, ge=1, le=50),
     product_service: ProductService = Depends(Provide[Container.product_service]),
 ):
-    total_count, products = product_service.get_recommended_products('test_user_id')
+    # 로그인하지 않았으면 인기/랜덤 상품으로 채움
+    user_id = current_user.id if current_user else None
+    total_count, products = product_service.get_recommended_products(user_id, limit)
     return {
         "total_count": total_count,
         "page": 1,
@@ -125,6 +208,28 @@ def get_recommended_products(
     }
 
 
+class ProductCacheStatsResponse(BaseModel):
+    enabled: bool
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+
+
+@router.get("/cache/stats", response_model=ProductCacheStatsResponse)
+@inject
+def get_product_cache_stats(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    product_cache: TTLCache = Depends(Provide[Container.product_cache]),
+):
+    return {
+        "enabled": get_settings().product_cache_enabled,
+        **product_cache.stats(),
+    }
+
+
 @router.put("", response_model=ProductResponse)
 @inject
 def update_product( 
@@ -288,6 +393,40 @@ def create_product_option(
     }
 
 
+class BulkProductOptionTypeItem(BaseModel):
+    product_id: str = Field(min_length=10, max_length=36)
+    option_type: str = Field(min_length=1, max_length=32)
+    options: list[str] = Field(min_length=1, max_length=50)
+
+
+class BulkCreateProductOptionsBody(BaseModel):
+    items: list[BulkProductOptionTypeItem] = Field(min_length=1, max_length=500)
+
+
+class BulkCreateProductOptionsResponse(BaseModel):
+    total_option_types: int
+    total_options: int
+    product_option_types: list[ProductOptionTypeResponse]
+
+
+@router.post("/options/bulk", status_code=201, response_model=BulkCreateProductOptionsResponse)
+@inject
+def create_product_options_bulk(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    body: BulkCreateProductOptionsBody,
+    product_service: ProductService = Depends(Provide[Container.product_service]),
+):
+    product_option_types, product_options = product_service.create_product_options_bulk(
+        [(item.product_id, item.option_type, item.options) for item in body.items]
+    )
+
+    return {
+        "total_option_types": len(product_option_types),
+        "total_options": len(product_options),
+        "product_option_types": product_option_types,
+    }
+
+
 class UpdateProductOptionBody(BaseModel):
     id: str = Field(min_length=10, max_length=32)
     option: str = Field(min_length=1, max_length=10)
@@ -438,19 +577,26 @@ def create_product_review(
 class GetProductReviewsResponse(BaseModel):
     total_count: int
     product_reviews: list[ProductReviewResponse]
+    next_cursor: str | None = None
 
 
 @router.get("/reviews/by_product", response_model=GetProductReviewsResponse)
 @inject
 def get_reviews_by_product(
     product_id: str,
+    sort: Literal["newest", "rating"] = "newest",
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
     product_service: ProductService = Depends(Provide[Container.product_service]),
 ):
-    total_count, product_reviews = product_service.get_product_reviews(product_id, None)
+    total_count, product_reviews, next_cursor = product_service.get_product_reviews(
+        product_id, None, sort, cursor, limit,
+    )
 
     return {
         "total_count": total_count,
         "product_reviews": product_reviews,
+        "next_cursor": next_cursor,
     }
 
 
@@ -458,16 +604,33 @@ def get_reviews_by_product(
 @inject
 def get_reviews_by_user(
     user_id: str,
+    sort: Literal["newest", "rating"] = "newest",
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
     product_service: ProductService = Depends(Provide[Container.product_service]),
 ):
-    total_count, product_reviews = product_service.get_product_reviews(None, user_id)
+    total_count, product_reviews, next_cursor = product_service.get_product_reviews(
+        None, user_id, sort, cursor, limit,
+    )
 
     return {
         "total_count": total_count,
         "product_reviews": product_reviews,
+        "next_cursor": next_cursor,
     }
 
 
+@router.get("/reviews/export")
+@inject
+def export_reviews(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    format: ExportFormat = "ndjson",
+    product_service: ProductService = Depends(Provide[Container.product_service]),
+):
+    columns = list(ProductReviewResponse.model_fields)
+    return export_response(product_service.export_product_reviews(), columns, format, "reviews")
+
+
 @router.delete("/reviews", status_code=204)
 @inject
 def delete_review(
@@ -499,4 +662,41 @@ def get_option_info(
         "option_type_value": option_type_value,
         "option_value": option_value,
         "is_active": is_active,
-    }
\ No newline at end of file
+    }
+
+class ProductOptionTypeDetailResponse(ProductOptionTypeResponse):
+    options: list[ProductOptionResponse]
+
+
+class ProductReviewSummaryResponse(BaseModel):
+    review_count: int
+    rating_average: float
+    rating_histogram: dict[int, int]
+
+
+class ProductDetailResponse(BaseModel):
+    product: ProductResponse
+    option_types: list[ProductOptionTypeDetailResponse]
+    review_summary: ProductReviewSummaryResponse
+    reviews: list[ProductReviewResponse]
+
+
+@router.get("/{product_id}/detail", response_model=ProductDetailResponse)
+@inject
+def get_product_detail(
+    product_id: str,
+    review_limit: int = Query(10, ge=0, le=50),
+    #NO NEED TO AUTHORIZE
+    product_service: ProductService = Depends(Provide[Container.product_service]),
+):
+    product_detail = product_service.get_product_detail(product_id, review_limit)
+
+    return {
+        "product": product_detail.product,
+        "option_types": [
+            {**vars(option_type), "options": product_detail.options[option_type.id]}
+            for option_type in product_detail.option_types
+        ],
+        "review_summary": product_detail.review_summary,
+        "reviews": product_detail.reviews,
+    }
@@ -0,0 +1,17 @@
+import os
+
+# config.Settings에 필요한 값. 실제 DB/외부 서비스에는 연결하지 않음.
+for name in (
+    "DATABASE_USERNAME",
+    "DATABASE_PASSWORD",
+    "DATABASE_HOST",
+    "DATABASE_SCHEMA",
+    "JWT_SECRET",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_REGION",
+    "IAMPORT_WEBHOOK_SECRET",
+    "IAMPORT_WEBHOOK_SECRET_TEST",
+    "IAMPORT_PAYMENT_SECRET",
+):
+    os.environ.setdefault(name, "test")
@@ -0,0 +1,22 @@
+from order.infra.repository.analytics_repo import _allocate
+
+
+def test_allocate_splits_in_proportion():
+    assert _allocate(9000, [20000, 10000]) == [6000, 3000]
+
+
+def test_allocate_sum_matches_amount():
+    shares = _allocate(10000, [3333, 3333, 3334])
+
+    assert sum(shares) == 10000
+    assert shares == [3333, 3333, 3334]
+
+
+def test_allocate_gives_remainder_to_largest_fractions():
+    assert _allocate(7, [1, 1, 1]) == [3, 2, 2]
+    assert _allocate(10, [1, 2]) == [3, 7]
+
+
+def test_allocate_zero_weights():
+    assert _allocate(100, [0, 0]) == [0, 0]
+    assert _allocate(0, [5, 5]) == [0, 0]
@@ -0,0 +1,77 @@
+import time
+
+from common.cache import TTLCache, MISSING
+
+
+def test_get_set_and_stats():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+
+    assert cache.get("a") is MISSING
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1, ttl_seconds=0.01)
+
+    time.sleep(0.02)
+
+    assert cache.get("a") is MISSING
+    assert "a" not in cache
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_set_after_clear_is_dropped():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    generation = cache.generation
+
+    cache.clear()
+    cache.set("a", 1, generation=generation)
+
+    assert cache.get("a") is MISSING
+
+
+def test_invalidate_tag_only_drops_tagged_entries():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("page", [1, 2], tags=("p1", "p2"))
+    cache.set("detail", 3, tags=("p3",))
+
+    cache.invalidate_tag("p2")
+
+    assert cache.get("page") is MISSING
+    assert cache.get("detail") == 3
+
+
+def test_value_loaded_before_tag_invalidation_is_not_stored():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    tag_clock = cache.tag_clock
+
+    cache.invalidate_tag("p1")
+    cache.set("page", [1], tags=("p1",), tag_clock=tag_clock)
+
+    assert cache.get("page") is MISSING
+
+
+def test_zero_size_cache_stores_nothing():
+    cache = TTLCache(max_size=0, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is MISSING
@@ -0,0 +1,144 @@
+from datetime import datetime
+from unittest import mock
+
+import MySQLdb
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from common.cache import TTLCache
+from order.domain.order import CouponWallet, Order
+from order.infra.repository import order_repo
+from order.infra.repository.cached_order_repo import CachedOrderRepository
+from order.infra.repository.order_repo import COUPON_ALREADY_IN_WALLET
+
+
+class FailingSession:
+    """
+    commit에서 지정한 DB 에러를 내는 세션.
+    """
+    def __init__(self, error: Exception):
+        self.error = error
+        self.commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def add(self, instance):
+        pass
+
+    def flush(self):
+        pass
+
+    def execute(self, *args, **kwargs):
+        pass
+
+    def commit(self):
+        self.commits += 1
+        raise IntegrityError("INSERT", {}, self.error)
+
+    def rollback(self):
+        pass
+
+
+def duplicate_key() -> Exception:
+    return MySQLdb.IntegrityError(1062, "Duplicate entry 'u1-c1' for key 'uq_coupon_wallet_user_coupon'")
+
+
+def make_wallet() -> CouponWallet:
+    now = datetime(2026, 1, 1)
+    return CouponWallet(
+        id="w1",
+        user_id="u1",
+        coupon_id="c1",
+        is_used=False,
+        used_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def repo():
+    return CachedOrderRepository(
+        coupon_cache=TTLCache(max_size=10, ttl_seconds=60),
+        claim_cache=TTLCache(max_size=10, ttl_seconds=60),
+    )
+
+
+def test_duplicate_claim_on_cold_cache_is_400_and_cached(repo):
+    session = FailingSession(duplicate_key())
+
+    assert not repo.has_coupon_wallet("u1", "c1")
+    with mock.patch.object(order_repo, "SessionLocal", return_value=session):
+        with pytest.raises(HTTPException) as e:
+            repo.save_coupon_wallet(make_wallet())
+
+    assert e.value.status_code == 400
+    assert e.value.detail == COUPON_ALREADY_IN_WALLET
+    assert ("u1", "c1") in repo.claim_cache
+    assert session.commits == 1
+
+
+def test_cached_claim_is_confirmed_with_db(repo):
+    repo.claim_cache.set(("u1", "c1"), True)
+
+    with mock.patch.object(order_repo.OrderRepository, "has_coupon_wallet", return_value=True):
+        assert repo.has_coupon_wallet("u1", "c1")
+    # 다른 워커에서 쿠폰이 회수된 경우 캐시를 지우고 등록을 허용
+    with mock.patch.object(order_repo.OrderRepository, "has_coupon_wallet", return_value=False):
+        assert not repo.has_coupon_wallet("u1", "c1")
+    assert ("u1", "c1") not in repo.claim_cache
+
+
+def test_delete_coupon_wallet_evicts_only_its_claim(repo):
+    repo.claim_cache.set(("u1", "c1"), True)
+    repo.claim_cache.set(("u2", "c1"), True)
+
+    with mock.patch.object(order_repo.OrderRepository, "find_coupon_wallet_by_id", return_value=make_wallet()), \
+            mock.patch.object(order_repo.OrderRepository, "delete_coupon_wallet"):
+        repo.delete_coupon_wallet("w1")
+
+    assert ("u1", "c1") not in repo.claim_cache
+    assert ("u2", "c1") in repo.claim_cache
+
+
+def test_other_integrity_errors_are_not_reported_as_duplicates(repo):
+    error = MySQLdb.IntegrityError(1452, "Cannot add or update a child row: a foreign key constraint fails")
+
+    with mock.patch.object(order_repo, "SessionLocal", return_value=FailingSession(error)):
+        with pytest.raises(HTTPException) as e:
+            repo.save_coupon_wallet(make_wallet())
+
+    assert e.value.detail != COUPON_ALREADY_IN_WALLET
+    assert not repo.has_coupon_wallet("u1", "c1")
+
+
+def test_duplicate_order_key_is_not_reported_as_coupon_duplicate(repo):
+    now = datetime(2026, 1, 1)
+    order = Order(
+        id="o1",
+        user_id="u1",
+        status="결제대기",
+        subtotal_price=1000,
+        coupon_discount_price=0,
+        point_discount_price=0,
+        total_price=1000,
+        recipient_name="name",
+        phone_number="010",
+        zipcode="00000",
+        address_line1="line1",
+        address_line2="line2",
+        order_memo=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+    with mock.patch.object(order_repo, "SessionLocal", return_value=FailingSession(duplicate_key())):
+        with pytest.raises(HTTPException) as e:
+            repo.save_with_items(order, [])
+
+    assert e.value.status_code == 500
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+from order.domain.order import Coupon, calculate_coupon_discount
+
+
+def make_coupon(**kwargs) -> Coupon:
+    now = datetime(2026, 1, 1)
+    values = dict(
+        id="c1",
+        code="CODE",
+        description=None,
+        discount_type="정액",
+        discount_rate=None,
+        discount_amount=3000,
+        min_order_amount=0,
+        max_discount_amount=3000,
+        valid_from=now,
+        valid_until=datetime(2027, 1, 1),
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    values.update(kwargs)
+    return Coupon(**values)
+
+
+def test_below_min_order_amount_is_not_applicable():
+    coupon = make_coupon(min_order_amount=20000)
+
+    assert calculate_coupon_discount(coupon, 19999) is None
+    assert calculate_coupon_discount(coupon, 20000) == 3000
+
+
+@pytest.mark.parametrize(
+    "subtotal, expected",
+    [
+        (10000, 1000),
+        (12345, 1234),  # 원 단위 절사
+        (50000, 3000),  # max_discount_amount
+    ],
+)
+def test_rate_coupon(subtotal, expected):
+    coupon = make_coupon(discount_type="비율", discount_rate=10, discount_amount=None)
+
+    assert calculate_coupon_discount(coupon, subtotal) == expected
+
+
+def test_fixed_coupon_does_not_exceed_subtotal():
+    coupon = make_coupon(discount_amount=5000, max_discount_amount=5000)
+
+    assert calculate_coupon_discount(coupon, 4000) == 4000
+    assert calculate_coupon_discount(coupon, 0) == 0
+
+
+def test_fixed_coupon_is_capped_by_max_discount_amount():
+    coupon = make_coupon(discount_amount=5000, max_discount_amount=2000)
+
+    assert calculate_coupon_discount(coupon, 10000) == 2000
+
+
+def test_null_min_order_amount_is_zero():
+    coupon = make_coupon(min_order_amount=None)
+
+    assert calculate_coupon_discount(coupon, 1000) == 1000
+
+
+def test_coupon_without_discount_value_is_not_applicable():
+    assert calculate_coupon_discount(make_coupon(discount_type="비율", discount_rate=None, discount_amount=None), 10000) is None
+    assert calculate_coupon_discount(make_coupon(discount_amount=None), 10000) is None
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from utils.cursor import encode_cursor, decode_cursor
+
+
+def test_round_trip():
+    created_at = datetime(2026, 10, 18, 12, 30, 15, 123456)
+
+    cursor = encode_cursor(5, created_at, "01JABC")
+
+    assert decode_cursor(cursor, int, datetime, str) == (5, created_at, "01JABC")
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor("???>>>", datetime(2026, 1, 1))
+
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor, types",
+    [
+        ("not-base64!", (datetime, str)),
+        (encode_cursor("2026-01-01T00:00:00"), (datetime, str)),  # 개수 불일치
+        (encode_cursor("yesterday", "01JABC"), (datetime, str)),  # 형식 불일치
+        (encode_cursor("five"), (int,)),
+    ],
+)
+def test_invalid_cursor_is_400(cursor, types):
+    with pytest.raises(HTTPException) as e:
+        decode_cursor(cursor, *types)
+
+    assert e.value.status_code == 400
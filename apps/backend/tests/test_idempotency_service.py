@@ -0,0 +1,152 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from common.cache import TTLCache
+from order.application.idempotency_service import IdempotencyService
+from order.domain.order import IdempotencyRecord
+from order.domain.repository.idempotency_repo import IIdempotencyRepository
+
+
+class InMemoryIdempotencyRepository(IIdempotencyRepository):
+    def __init__(self):
+        self.records: dict[tuple[str, str], IdempotencyRecord] = {}
+        self.calls = 0
+        self.fail_complete = False
+
+    def reserve(self, record: IdempotencyRecord, stale_before: datetime) -> IdempotencyRecord | None:
+        self.calls += 1
+        existing = self.records.get((record.scope, record.key))
+        if existing and not (existing.status == "처리중" and existing.updated_at <= stale_before):
+            return replace(existing)
+        self.records[(record.scope, record.key)] = replace(record)
+        return None
+
+    def complete(self, scope: str, key: str, response: str, now: datetime):
+        if self.fail_complete:
+            raise RuntimeError("DB is down")
+        record = self.records[(scope, key)]
+        if record.status != "처리중":
+            return
+        record.status = "완료"
+        record.response = response
+        record.updated_at = now
+
+    def release(self, scope: str, key: str):
+        self.records.pop((scope, key), None)
+
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        return 0
+
+
+@pytest.fixture
+def repo():
+    return InMemoryIdempotencyRepository()
+
+
+@pytest.fixture
+def service(repo):
+    return IdempotencyService(idempotency_repo=repo, cache=TTLCache(max_size=10, ttl_seconds=60))
+
+
+def test_without_key_always_runs(service):
+    calls = []
+
+    service.run("order", None, {}, lambda: calls.append(1))
+    service.run("order", None, {}, lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+def test_replays_completed_response(service, repo):
+    calls = []
+
+    def handler():
+        calls.append(1)
+        return {"id": "o1", "created_at": datetime(2026, 1, 1)}
+
+    first = service.run("order", "k1", {"amount": 1000}, handler)
+    second = service.run("order", "k1", {"amount": 1000}, handler)
+
+    assert first == second == {"id": "o1", "created_at": "2026-01-01T00:00:00"}
+    assert len(calls) == 1
+    assert repo.calls == 1  # 두 번째 요청은 워커 캐시에서 응답
+
+
+def test_replays_from_db_on_another_worker(repo):
+    first = IdempotencyService(idempotency_repo=repo, cache=TTLCache(max_size=10, ttl_seconds=60))
+    second = IdempotencyService(idempotency_repo=repo, cache=TTLCache(max_size=10, ttl_seconds=60))
+
+    first.run("order", "k1", {"amount": 1000}, lambda: {"id": "o1"})
+
+    assert second.run("order", "k1", {"amount": 1000}, lambda: {"id": "o2"}) == {"id": "o1"}
+
+
+def test_different_payload_is_422(service):
+    service.run("order", "k1", {"amount": 1000}, lambda: {"id": "o1"})
+
+    with pytest.raises(HTTPException) as e:
+        service.run("order", "k1", {"amount": 2000}, lambda: {"id": "o2"})
+
+    assert e.value.status_code == 422
+
+
+def test_in_progress_key_is_409(service):
+    def handler():
+        return service.run("order", "k1", {"amount": 1000}, lambda: {"id": "o2"})
+
+    with pytest.raises(HTTPException) as e:
+        service.run("order", "k1", {"amount": 1000}, handler)
+
+    assert e.value.status_code == 409
+
+
+def test_failed_request_releases_key(service, repo):
+    def failing():
+        raise HTTPException(status_code=400, detail="Invalid")
+
+    with pytest.raises(HTTPException):
+        service.run("order", "k1", {"amount": 1000}, failing)
+
+    assert ("order", "k1") not in repo.records
+    assert service.run("order", "k1", {"amount": 1000}, lambda: {"id": "o1"}) == {"id": "o1"}
+
+
+def test_keys_are_scoped(service):
+    service.run("order", "k1", {}, lambda: {"id": "o1"})
+
+    assert service.run("refund", "k1", {}, lambda: {"id": "r1"}) == {"id": "r1"}
+
+
+def test_takes_over_in_progress_key_after_lease(service, repo):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    repo.records[("order", "k1")] = IdempotencyRecord(
+        scope="order",
+        key="k1",
+        fingerprint="abandoned",
+        status="처리중",
+        response=None,
+        expires_at=now + timedelta(hours=24),
+        created_at=now - timedelta(seconds=service.settings.idempotency_lease_seconds + 1),
+        updated_at=now - timedelta(seconds=service.settings.idempotency_lease_seconds + 1),
+    )
+
+    assert service.run("order", "k1", {"amount": 1000}, lambda: {"id": "o1"}) == {"id": "o1"}
+    assert repo.records[("order", "k1")].status == "완료"
+
+
+def test_failed_complete_still_returns_response(service, repo):
+    calls = []
+
+    def handler():
+        calls.append(1)
+        return {"id": "o1"}
+
+    repo.fail_complete = True
+
+    assert service.run("order", "k1", {"amount": 1000}, handler) == {"id": "o1"}
+    assert repo.records[("order", "k1")].status == "처리중"
+    assert service.run("order", "k1", {"amount": 1000}, handler) == {"id": "o1"}
+    assert len(calls) == 1
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 from datetime import datetime, timezone
 from dependency_injector.wiring import inject
 from fastapi import HTTPException, status, UploadFile
@@ -127,6 +127,9 @@ class UserService:
         users = self.user_repo.get_users(page, items_per_page)
 
         return users
+
+    def export_users(self) -> Iterator[User]:
+        return self.user_repo.iter_users()
     
     def get_user(self, user_id: str) -> User:
         user = self.user_repo.find_by_id(user_id)
@@ -211,6 +214,9 @@ class UserService:
         total_count, inquiries = self.user_repo.get_inquiries(page, items_per_page)
         return total_count, inquiries
 
+    def export_inquiries(self) -> Iterator[UserInquiry]:
+        return self.user_repo.iter_inquiries()
+
     def get_user_inquiries(
         self,
         identifier: str,
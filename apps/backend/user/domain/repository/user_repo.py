@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 from abc import ABCMeta, abstractmethod
 from fastapi import UploadFile
 
@@ -45,6 +45,13 @@ class IUserRepository(metaclass=ABCMeta):
     @abstractmethod
     def get_users(self, page: int, items_per_page: int) -> tuple[int, list[User]]:
         raise NotImplementedError
+
+    @abstractmethod
+    def iter_users(self) -> Iterator[User]:
+        """
+        모든 유저를 서버 사이드 커서로 스트리밍. (내보내기용)
+        """
+        raise NotImplementedError
     
     @abstractmethod
     def delete(self, id: str):
@@ -64,6 +71,13 @@ class IUserRepository(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_inquiries(self) -> Iterator[UserInquiry]:
+        """
+        모든 유저 문의를 서버 사이드 커서로 스트리밍. (내보내기용)
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_inquiries_by_user(
         self, user_id: str, page: int, items_per_page: int
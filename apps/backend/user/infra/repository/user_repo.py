@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 from fastapi import HTTPException, UploadFile
+from sqlalchemy import select
 import requests
 import jose.jwt as jwt
 
 from database import SessionLocal
 from utils.db_utils import row_to_dict
 from common.s3_upload import upload_images_to_s3, delete_images_from_s3
+from common.export import stream_rows
 from user.domain.repository.user_repo import IUserRepository
 from user.domain.user import User as UserVO
 from user.domain.user import UserInquiry as UserInquiryVO
@@ -143,6 +145,12 @@ class UserRepository(IUserRepository):
             users = query.limit(items_per_page).offset(offset).all()
 
         return total_count, [UserVO(**row_to_dict(user)) for user in users]
+
+    def iter_users(self) -> Iterator[UserVO]:
+        with SessionLocal() as db:
+            rows = stream_rows(db, select(User.__table__).order_by(User.created_at, User.id))
+            for row in rows:
+                yield UserVO(**row._mapping)
     
     def delete(self, id: str):
         with SessionLocal() as db:
@@ -184,6 +192,12 @@ class UserRepository(IUserRepository):
 
         return total_count, [UserInquiryVO(**row_to_dict(inquiry)) for inquiry in inquiries]
 
+    def iter_inquiries(self) -> Iterator[UserInquiryVO]:
+        with SessionLocal() as db:
+            rows = stream_rows(db, select(UserInquiry.__table__).order_by(UserInquiry.created_at, UserInquiry.id))
+            for row in rows:
+                yield UserInquiryVO(**row._mapping)
+
     def get_inquiries_by_user(
         self, user_id: str, page: int, items_per_page: int
     ) -> tuple[int, list[UserInquiryVO]]:
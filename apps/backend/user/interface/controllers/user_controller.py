@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, UploadFile, File, Form
 from fastapi.security import OAuth2PasswordRequestForm
@@ -7,7 +7,9 @@ from pydantic import BaseModel, EmailStr, Field
 
 from containers import Container
 from common.auth import CurrentUser, get_current_user, get_admin_user
+from common.export import ExportFormat, export_response
 from user.application.user_service import UserService
+from order.application.point_service import PointService
 from utils.val_image import validate_images
 
 router = APIRouter(prefix="/users")
@@ -106,6 +108,17 @@ def get_users(
     }
 
 
+@router.get("/export")
+@inject
+def export_users(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    format: ExportFormat = "ndjson",
+    user_service: UserService = Depends(Provide[Container.user_service]),
+):
+    columns = list(UserResponse.model_fields)
+    return export_response(user_service.export_users(), columns, format, "users")
+
+
 @router.get("", response_model=UserResponse)
 @inject
 def get_user(
@@ -116,6 +129,54 @@ def get_user(
     return user
 
 
+class PointBalanceResponse(BaseModel):
+    user_id: str
+    balance: int
+    updated_at: datetime | None
+
+
+@router.get("/points", response_model=PointBalanceResponse)
+@inject
+def get_point_balance(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    point_service: PointService = Depends(Provide[Container.point_service]),
+):
+    return point_service.get_point_balance(current_user.id)
+
+
+class CreatePointTransactionBody(BaseModel):
+    user_id: str = Field(min_length=10, max_length=36)
+    type: Literal["적립", "사용", "취소"]
+    amount: int = Field(gt=0, le=99999)
+    order_id: str | None = Field(default=None, max_length=36)
+
+
+class PointTransactionResponse(BaseModel):
+    id: str
+    user_id: str
+    order_id: str | None
+    type: str
+    amount: int
+    balance_after: int
+    created_at: datetime
+    updated_at: datetime
+
+
+@router.post("/points/admin", status_code=201, response_model=PointTransactionResponse)
+@inject
+def create_point_transaction(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    body: CreatePointTransactionBody,
+    point_service: PointService = Depends(Provide[Container.point_service]),
+):
+    return point_service.create_point_transaction(
+        user_id=body.user_id,
+        type=body.type,
+        amount=body.amount,
+        order_id=body.order_id,
+    )
+
+
 @router.delete("", status_code=204)
 @inject
 def delete_for_user(
@@ -223,6 +284,17 @@ def get_user_inquiries(
     }
 
 
+@router.get("/inquiry/export")
+@inject
+def export_user_inquiries(
+    current_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    format: ExportFormat = "ndjson",
+    user_service: UserService = Depends(Provide[Container.user_service]),
+):
+    columns = list(UserInquiryResponse.model_fields)
+    return export_response(user_service.export_inquiries(), columns, format, "inquiries")
+
+
 @router.get("/inquiry/by_user", response_model=GetUserInquiriesResponse)
 @inject
 def get_user_inquiries_by_user(
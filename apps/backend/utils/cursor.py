@@ -0,0 +1,28 @@
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException
+
+
+def encode_cursor(*values) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """
+    encode_cursor로 만든 커서를 types 순서대로 복원.
+    형식이 맞지 않으면 400 에러 발생.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        return tuple(
+            datetime.fromisoformat(value) if type_ is datetime else type_(value)
+            for value, type_ in zip(payload, types)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")